@@ -0,0 +1,80 @@
+# CppCodeDoc — Licensed under the GNU General Public License v3.0 (GPLv3-or-later)
+# SPDX-License-Identifier: GPLv3-or-later
+# Copyright (C) 2025 Jojo1220
+# See https://www.gnu.org/licenses/gpl-3.0.html
+
+"""
+Memory benchmark of the function records.
+The functions of a synthetic corpus (see corpus_generator.py) are held as
+FunctionRecord (slots, interned strings) and as the former per-function dicts,
+the retained memory of both variants is measured by tracemalloc.
+"""
+
+import io
+import os
+import sys
+import argparse
+import contextlib
+import tracemalloc
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', "src")))
+sys.path.insert(0, os.path.abspath(os.path.dirname(__file__)))
+
+from corpus_generator import generate_corpus
+from formatter.code_parser import extract_functions_from_string
+from formatter.doxygen_generator import generate_doxygen_comment
+from generator.calcToDos import calculation_of_todos
+
+def copy_string(value):
+    """
+    Returning an equal, but not identical string (like the former per-function slices).
+    """
+    return value.encode("utf-8").decode("utf-8") if isinstance(value, str) else value
+
+def as_former_dict(func):
+    """
+    Converting a record into the former function dict: one dict per function,
+    name and return type are separate string objects per function.
+    """
+    record = dict(func.items())
+    record["name"] = copy_string(record["name"])
+    record["return_type"] = copy_string(record["return_type"])
+    return record
+
+def retained_memory(build):
+    """
+    Returning the memory (bytes) retained by the result of build.
+    """
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    result = build()
+    retained = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    return retained, result
+
+def main():
+    parser = argparse.ArgumentParser(description="Memory of FunctionRecord against function dicts")
+    parser.add_argument("--files", type=int, default=20, help="number of corpus files")
+    parser.add_argument("--functions", type=int, default=200, help="functions per file")
+    args = parser.parse_args()
+
+    # the same functions (incl. doxygen and TODO analysis) are kept in both variants
+    functions = []
+    with contextlib.redirect_stdout(io.StringIO()):
+        for file_name, text in generate_corpus({"files": args.files, "functions": args.functions}):
+            functions.extend(extract_functions_from_string(text, os.path.join("src", file_name)))
+        for func in functions:
+            generate_doxygen_comment(func)
+        calculation_of_todos(functions)
+
+    dict_memory, _ = retained_memory(lambda: [as_former_dict(func) for func in functions])
+    record_memory, _ = retained_memory(lambda: [func.copy() for func in functions])
+
+    count = len(functions)
+    print(f"functions:        {count}")
+    print(f"dict records:     {dict_memory / 1024:>10.1f} kB ({dict_memory / count:.0f} B/function)")
+    print(f"FunctionRecord:   {record_memory / 1024:>10.1f} kB ({record_memory / count:.0f} B/function)")
+    print(f"saving:           {(1 - record_memory / dict_memory) * 100:>10.1f} %")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+# CppCodeDoc — Licensed under the GNU General Public License v3.0 (GPLv3-or-later)
+# SPDX-License-Identifier: GPLv3-or-later
+# Copyright (C) 2025 Jojo1220
+# See https://www.gnu.org/licenses/gpl-3.0.html
+
+"""
+Benchmark of the line analysis (brace/paren depth and line classes, see
+line_analysis.py): the pure Python pass is compared against the NumPy pass
+on growing file sizes, the crossover size is the smallest size where NumPy
+is faster (NUMPY_MIN_CHARS should be close to it). Requires NumPy.
+"""
+
+import os
+import sys
+import argparse
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', "src")))
+sys.path.insert(0, os.path.abspath(os.path.dirname(__file__)))
+
+from benchmark_parser import SAMPLE, measure
+from formatter.cpp_lexer import clean_lines
+from formatter.line_analysis import analyze_lines, load_numpy, NUMPY_MIN_CHARS
+
+def analyze_and_classify(lines, cleaned_lines, use_numpy):
+    """
+    Analysis including the (lazily computed) line classes.
+    """
+    return analyze_lines(lines, cleaned_lines, use_numpy).classes
+
+def main():
+    parser = argparse.ArgumentParser(description="Line analysis benchmark: Python against NumPy")
+    parser.add_argument("--lines", type=int, nargs="+",
+                        default=[10, 30, 100, 300, 1000, 3000, 10000, 30000, 100000],
+                        help="number of lines of the analyzed files")
+    args = parser.parse_args()
+    if load_numpy() is None:
+        sys.exit("NumPy is not installed")
+
+    sample = SAMPLE.splitlines()
+    print(f"{'lines':>8} {'chars':>9} {'depth py':>9} {'depth np':>9} "
+          f"{'+class py':>10} {'+class np':>10}")
+    crossover = {}
+    for count in args.lines:
+        lines = (sample * (count // len(sample) + 1))[:count]
+        cleaned_lines, _ = clean_lines(lines)
+        chars = len("\n".join(lines))
+
+        times = [measure(function, lines, cleaned_lines, use_numpy)
+                 for function in (analyze_lines, analyze_and_classify)
+                 for use_numpy in (False, True)]
+        print(f"{count:>8} {chars:>9} " + " ".join(f"{time * 1e3:>8.3f}ms" for time in times))
+        for name, (python_time, numpy_time) in (("depth", times[:2]), ("class", times[2:])):
+            if numpy_time < python_time:
+                crossover.setdefault(name, chars)
+
+    for name in ("depth", "class"):
+        print(f"crossover ({name}): {crossover.get(name, 'not reached')} chars")
+    print(f"NUMPY_MIN_CHARS: {NUMPY_MIN_CHARS} chars")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,143 @@
+# CppCodeDoc — Licensed under the GNU General Public License v3.0 (GPLv3-or-later)
+# SPDX-License-Identifier: GPLv3-or-later
+# Copyright (C) 2025 Jojo1220
+# See https://www.gnu.org/licenses/gpl-3.0.html
+
+"""
+Benchmark of the parser on growing input sizes.
+A synthetic source file is repeated n times and parsed; the time per line
+has to stay (roughly) constant, if parsing is linear in the file size.
+The lexer based cleaning of strings/comments is compared against the
+former character-by-character implementation.
+"""
+
+import io
+import os
+import sys
+import time
+import argparse
+import contextlib
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', "src")))
+
+from formatter.code_parser import extract_functions_from_string, remove_strings_and_comments
+from formatter.brace_map import BraceMap
+
+SAMPLE = """\
+#include <vector>
+#include <string>
+
+namespace demo {
+
+/**
+ * @brief Adds two numbers
+ */
+int add(int a, int b) {
+    return a + b; // "sum"
+}
+
+/*
+ * Prints a text
+ */
+void print(const std::string& text,
+           int count = 1)
+{
+    for (int i = 0; i < count; ++i) {
+        printf("%s {\\n", text.c_str());
+    }
+}
+
+// Scales all values
+template <typename T>
+std::vector<T> scale(const std::vector<T>& values, T factor) {
+    std::vector<T> result;
+    for (const auto& value : values) { result.push_back(value * factor); }
+    return result;
+}
+
+class Counter {
+public:
+    Counter() : value(0) {}
+    int next() const
+    {
+        const char* brace = "}";
+        return value + 1; /* { */
+    }
+private:
+    int value;
+};
+
+}
+"""
+
+def legacy_remove_strings_and_comments(lines):
+    """
+    Former implementation of remove_strings_and_comments (loop over all characters),
+    only used as reference for the comparison.
+    """
+    import re
+    in_block_comment = False
+    result = []
+    string_regex = re.compile(r'"(\\.|[^"\\])*"')
+    char_regex = re.compile(r"'(\\.|[^'\\])'")
+
+    for line in lines:
+        if not in_block_comment:
+            line = string_regex.sub('""', line)
+            line = char_regex.sub("''", line)
+        new_line = []
+        i = 0
+        while i < len(line):
+            if in_block_comment:
+                if line[i:i+2] == "*/":
+                    in_block_comment = False
+                    i += 2
+                else:
+                    i += 1
+            elif line[i:i+2] == "/*":
+                in_block_comment = True
+                i += 2
+            elif line[i:i+2] == "//":
+                break
+            else:
+                new_line.append(line[i])
+                i += 1
+        result.append("".join(new_line))
+    return result
+
+def measure(function, *args):
+    """
+    Returning the best time of three runs in seconds.
+    """
+    best = None
+    for _ in range(3):
+        start = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            function(*args)
+        duration = time.perf_counter() - start
+        best = duration if best is None else min(best, duration)
+    return best
+
+def main():
+    parser = argparse.ArgumentParser(description="Parser benchmark on growing input sizes")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 100, 1000],
+                        help="number of repetitions of the sample source")
+    args = parser.parse_args()
+
+    print(f"{'lines':>8} {'parse':>10} {'us/line':>8} {'clean old':>10} {'clean new':>10} "
+          f"{'speedup':>8} {'brace map':>10}")
+    for size in args.sizes:
+        content = SAMPLE * size
+        lines = content.splitlines()
+
+        parse_time = measure(extract_functions_from_string, content)
+        legacy_time = measure(legacy_remove_strings_and_comments, lines)
+        clean_time = measure(remove_strings_and_comments, lines)
+        brace_time = measure(BraceMap, lines)
+
+        print(f"{len(lines):>8} {parse_time:>9.3f}s {parse_time / len(lines) * 1e6:>8.1f} "
+              f"{legacy_time:>9.3f}s {clean_time:>9.3f}s {legacy_time / clean_time:>7.1f}x "
+              f"{brace_time:>9.3f}s")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,303 @@
+# CppCodeDoc — Licensed under the GNU General Public License v3.0 (GPLv3-or-later)
+# SPDX-License-Identifier: GPLv3-or-later
+# Copyright (C) 2025 Jojo1220
+# See https://www.gnu.org/licenses/gpl-3.0.html
+
+"""
+Reproducible benchmark suite of the parser, the comment rewriting and the report writers.
+The benchmarks run on a synthetic corpus (see corpus_generator.py), the results
+are stored as JSON and can be compared against a baseline to find regressions.
+
+    python scripts/benchmark_suite.py run --output baseline.json
+    python scripts/benchmark_suite.py run --files 50 --pathological 4 --baseline baseline.json
+    python scripts/benchmark_suite.py compare baseline.json results.json --threshold 0.15
+"""
+
+import io
+import os
+import sys
+import copy
+import json
+import time
+import argparse
+import platform
+import tempfile
+import contextlib
+import statistics
+from datetime import datetime
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', "src")))
+sys.path.insert(0, os.path.abspath(os.path.dirname(__file__)))
+
+from corpus_generator import CORPUS_DEFAULTS, COMMENT_STYLES, corpus_options, generate_corpus
+from formatter.code_parser import extract_functions_from_string, insert_comments, replace_comments
+from formatter.doxygen_generator import generate_doxygen_comment
+from generator.html_output import write_html_doc
+from generator.markdown_output import write_markdown_doc
+from generator.calcToDos import calculation_of_todos
+
+RESULTS_VERSION = 1
+DEFAULT_THRESHOLD = 0.10
+
+ARGUMENTS = {
+    "readonly": False,
+    "headerCommentStyle": "default",
+    "document": {"title": "Benchmark", "version": "1.0", "author": "benchmark",
+                 "date": "2025-01-01", "highlightTodo": True, "showDocProgress": True},
+}
+
+class BenchmarkContext:
+    """
+    Corpus and working directory shared by all benchmarks of a run.
+    """
+    def __init__(self, corpus, work_dir):
+        self.corpus = corpus
+        self.work_dir = work_dir
+        self.lines = sum(len(text.splitlines()) for _, text in corpus)
+        self.functions = []
+        for file_name, text in corpus:
+            functions = extract_functions_from_string(text, os.path.join(work_dir, file_name))
+            for func in functions:
+                generate_doxygen_comment(func)
+            self.functions.extend(functions)
+
+    def write_sources(self):
+        """
+        (Re-)writing the corpus files into the working directory.
+        Returns the written paths.
+        """
+        paths = []
+        for file_name, text in self.corpus:
+            path = os.path.join(self.work_dir, file_name)
+            with open(path, "w", encoding="utf-8", newline="") as f:
+                f.write(text)
+            paths.append(path)
+        return paths
+
+    def functions_per_file(self):
+        """
+        Returning deep copies of the function records, grouped per file path.
+        """
+        grouped = {}
+        for func in copy.deepcopy(self.functions):
+            grouped.setdefault(func["file"], []).append(func)
+        return grouped
+
+def bench_extract_functions(context):
+    """parsing all files of the corpus"""
+    def run(_):
+        for file_name, text in context.corpus:
+            extract_functions_from_string(text, file_name)
+    return None, run, context.lines, "lines"
+
+def bench_insert_comments(context):
+    """inserting header and post comments into all files"""
+    def run(paths):
+        for path in paths:
+            insert_comments(path, ARGUMENTS)
+    return context.write_sources, run, context.lines, "lines"
+
+def bench_replace_comments(context):
+    """replacing the header comments by doxygen comments in all files"""
+    def setup():
+        context.write_sources()
+        return context.functions_per_file()
+
+    def run(grouped):
+        for path, functions in grouped.items():
+            replace_comments(path, functions)
+    return setup, run, len(context.functions), "functions"
+
+def bench_generate_doxygen_comment(context):
+    """generating the doxygen comments of all functions"""
+    def run(functions):
+        for func in functions:
+            generate_doxygen_comment(func)
+    return lambda: copy.deepcopy(context.functions), run, len(context.functions), "functions"
+
+def bench_write_report(writer, extension):
+    """
+    Returning the benchmark of a report writer.
+    """
+    def bench(context):
+        output_path = os.path.join(context.work_dir, f"report.{extension}")
+        todo_stats = calculation_of_todos(context.functions)
+
+        def run(_):
+            writer(context.functions, output_path, ARGUMENTS, todo_stats)
+        return None, run, len(context.functions), "functions"
+    bench.__doc__ = f"writing the {extension} report of all functions"
+    return bench
+
+BENCHMARKS = {
+    "extract_functions_from_string": bench_extract_functions,
+    "insert_comments": bench_insert_comments,
+    "replace_comments": bench_replace_comments,
+    "generate_doxygen_comment": bench_generate_doxygen_comment,
+    "write_html_doc": bench_write_report(write_html_doc, "html"),
+    "write_markdown_doc": bench_write_report(write_markdown_doc, "md"),
+}
+
+def measure(setup, run, repeat):
+    """
+    Running setup (not measured) and run repeat times.
+    Returns the measured durations in seconds.
+    """
+    durations = []
+    for _ in range(repeat):
+        state = setup() if setup else None
+        with contextlib.redirect_stdout(io.StringIO()):
+            start = time.perf_counter()
+            run(state)
+            durations.append(time.perf_counter() - start)
+    return durations
+
+def run_benchmarks(options, seed=0, repeat=5, names=None):
+    """
+    Running the benchmarks (all, or the selected names) on the generated corpus.
+    Returns the results as dict (see RESULTS_VERSION).
+    """
+    options = corpus_options(**options)
+    corpus = generate_corpus(options, seed)
+    results = {
+        "version": RESULTS_VERSION,
+        "created": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "corpus": options,
+        "seed": seed,
+        "repeat": repeat,
+        "benchmarks": {},
+    }
+
+    with tempfile.TemporaryDirectory() as work_dir:
+        context = BenchmarkContext(corpus, work_dir)
+        for name, bench in BENCHMARKS.items():
+            if names and name not in names:
+                continue
+            setup, run, units, unit = bench(context)
+            durations = measure(setup, run, repeat)
+            best = min(durations)
+            results["benchmarks"][name] = {
+                "best": best,
+                "median": statistics.median(durations),
+                "runs": durations,
+                "units": units,
+                "unit": unit,
+                "us_per_unit": best / units * 1e6 if units else None,
+            }
+    return results
+
+def compare_results(baseline, results, threshold=DEFAULT_THRESHOLD):
+    """
+    Comparing the best times of results against baseline.
+    Returns a list of (name, baseline_best, best, ratio, regression) for all
+    benchmarks within both results; regression is True if the benchmark got
+    slower by more than threshold (e.g. 0.1 = 10 %).
+    """
+    rows = []
+    for name, result in results["benchmarks"].items():
+        base = baseline["benchmarks"].get(name)
+        if base is None or not base["best"]:
+            continue
+        ratio = result["best"] / base["best"]
+        rows.append((name, base["best"], result["best"], ratio, ratio > 1 + threshold))
+    return rows
+
+def format_results(results):
+    """
+    Returning the results as text table.
+    """
+    lines = [f"{'benchmark':<32} {'best [s]':>10} {'median [s]':>11} {'units':>8} {'us/unit':>9}"]
+    for name, result in results["benchmarks"].items():
+        lines.append(f"{name:<32} {result['best']:>10.4f} {result['median']:>11.4f} "
+                     f"{result['units']:>8} {result['us_per_unit']:>9.2f}")
+    return "\n".join(lines)
+
+def format_comparison(rows, threshold):
+    """
+    Returning the comparison rows as text table.
+    """
+    lines = [f"{'benchmark':<32} {'baseline [s]':>12} {'current [s]':>12} {'ratio':>7}"]
+    for name, base_best, best, ratio, regression in rows:
+        flag = f"  REGRESSION (> {threshold:.0%})" if regression else ""
+        lines.append(f"{name:<32} {base_best:>12.4f} {best:>12.4f} {ratio:>6.2f}x{flag}")
+    return "\n".join(lines)
+
+def load_results(path):
+    """
+    Loading stored results (JSON).
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+def print_comparison(baseline, results, threshold):
+    """
+    Printing the comparison against baseline.
+    Returns the number of regressions.
+    """
+    if baseline.get("corpus") != results.get("corpus") or baseline.get("seed") != results.get("seed"):
+        print("⚠️ Baseline was measured on a different corpus, the comparison is not meaningful.")
+    rows = compare_results(baseline, results, threshold)
+    print(format_comparison(rows, threshold))
+    return sum(1 for row in rows if row[4])
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark suite on a synthetic C++ corpus")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = commands.add_parser("run", help="run the benchmarks")
+    run_parser.add_argument("--files", type=int, help=f"number of files ({CORPUS_DEFAULTS['files']})")
+    run_parser.add_argument("--functions", type=int,
+                            help=f"functions per file ({CORPUS_DEFAULTS['functions']})")
+    run_parser.add_argument("--body-lines", type=int,
+                            help=f"statements per function ({CORPUS_DEFAULTS['body_lines']})")
+    run_parser.add_argument("--density", type=float,
+                            help=f"share of functions of all items ({CORPUS_DEFAULTS['density']})")
+    run_parser.add_argument("--template-depth", type=int,
+                            help=f"depth of template types ({CORPUS_DEFAULTS['template_depth']})")
+    run_parser.add_argument("--overloads", type=int,
+                            help=f"overloads per function name ({CORPUS_DEFAULTS['overloads']})")
+    run_parser.add_argument("--comment-style", choices=COMMENT_STYLES + ("mixed",),
+                            help=f"header comments ({CORPUS_DEFAULTS['comment_style']})")
+    run_parser.add_argument("--pathological", type=int,
+                            help=f"pathological lines per file ({CORPUS_DEFAULTS['pathological']})")
+    run_parser.add_argument("--pathological-length", type=int,
+                            help=f"length of pathological lines "
+                                 f"({CORPUS_DEFAULTS['pathological_length']})")
+    run_parser.add_argument("--seed", type=int, default=0, help="seed of the corpus generator")
+    run_parser.add_argument("--repeat", type=int, default=5, help="repetitions per benchmark")
+    run_parser.add_argument("--only", nargs="+", choices=list(BENCHMARKS),
+                            help="run only the selected benchmarks")
+    run_parser.add_argument("--output", help="write the results to this JSON file")
+    run_parser.add_argument("--baseline", help="compare the results against this JSON file")
+    run_parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                            help="allowed slowdown against the baseline (0.1 = 10 %%)")
+
+    compare_parser = commands.add_parser("compare", help="compare two stored results")
+    compare_parser.add_argument("baseline", help="baseline results (JSON)")
+    compare_parser.add_argument("results", help="current results (JSON)")
+    compare_parser.add_argument("--threshold", type=float, default=DEFAULT_THRESHOLD,
+                                help="allowed slowdown against the baseline (0.1 = 10 %%)")
+    args = parser.parse_args()
+
+    if args.command == "compare":
+        regressions = print_comparison(load_results(args.baseline), load_results(args.results),
+                                       args.threshold)
+        sys.exit(1 if regressions else 0)
+
+    options = {key: getattr(args, key) for key in CORPUS_DEFAULTS}
+    results = run_benchmarks(options, args.seed, args.repeat, args.only)
+    print(format_results(results))
+
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+        print(f"Results written to {args.output}")
+
+    if args.baseline:
+        regressions = print_comparison(load_results(args.baseline), results, args.threshold)
+        sys.exit(1 if regressions else 0)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,194 @@
+# CppCodeDoc — Licensed under the GNU General Public License v3.0 (GPLv3-or-later)
+# SPDX-License-Identifier: GPLv3-or-later
+# Copyright (C) 2025 Jojo1220
+# See https://www.gnu.org/licenses/gpl-3.0.html
+
+"""
+Deterministic generator of synthetic C++ source corpora for benchmarks.
+The same options and seed always produce the same files, so benchmark
+results of different versions are comparable.
+
+Options (see CORPUS_DEFAULTS):
+    files: number of source files
+    functions: number of functions per file (overloads included)
+    body_lines: number of statements per function body
+    density: share of top-level items being functions (0..1), the rest are
+             declarations, globals and structs between the functions
+    template_depth: nesting depth of template return types (0 = no templates)
+    overloads: number of overloads per function name
+    comment_style: none, line, block, doxygen or mixed (header comments of the functions)
+    pathological: number of pathological lines per file (very long lines)
+    pathological_length: length of the pathological lines in characters
+"""
+
+import os
+import random
+
+CORPUS_DEFAULTS = {
+    "files": 10,
+    "functions": 40,
+    "body_lines": 6,
+    "density": 0.7,
+    "template_depth": 1,
+    "overloads": 2,
+    "comment_style": "mixed",
+    "pathological": 0,
+    "pathological_length": 2000,
+}
+
+COMMENT_STYLES = ("none", "line", "block", "doxygen")
+TYPES = ("int", "double", "bool", "char", "float", "long", "unsigned int", "std::string")
+PARAM_TYPES = ("int", "double", "const std::string&", "char*", "bool", "float",
+               "const std::vector<int>&", "long long", "unsigned short")
+
+def corpus_options(**options):
+    """
+    Returning the complete corpus options (defaults updated by options).
+    Unknown options raise a ValueError.
+    """
+    unknown = set(options) - set(CORPUS_DEFAULTS)
+    if unknown:
+        raise ValueError(f"Unknown corpus options: {', '.join(sorted(unknown))}")
+    result = dict(CORPUS_DEFAULTS)
+    result.update({key: value for key, value in options.items() if value is not None})
+    if result["comment_style"] not in COMMENT_STYLES + ("mixed",):
+        raise ValueError(f"Invalid comment style: {result['comment_style']}")
+    return result
+
+def template_type(depth):
+    """
+    Returning a nested template type of depth, e.g. std::vector<std::vector<T>> for 2.
+    """
+    result = "T"
+    for level in range(depth):
+        result = f"std::vector<{result}>" if level % 2 == 0 else f"std::map<int, {result}>"
+    return result
+
+def header_comment(rng, style, name):
+    """
+    Returning the header comment lines of a function in style.
+    """
+    if style == "mixed":
+        style = rng.choice(COMMENT_STYLES)
+    if style == "line":
+        return [f"// {name}: computes a value"]
+    if style == "block":
+        return ["/*", f" * {name}: computes a value", " */"]
+    if style == "doxygen":
+        return ["/**", f" * @brief {name} computes a value",
+                " * @param a first value", " * @return result", " */"]
+    return []
+
+def function_lines(rng, options, name, overload):
+    """
+    Returning the lines of one function definition (with header comment).
+    """
+    params = ", ".join(f"{rng.choice(PARAM_TYPES)} p{i}" for i in range(overload + 1))
+    lines = header_comment(rng, options["comment_style"], name)
+
+    if options["template_depth"] and rng.random() < 0.3:
+        lines.append("template <typename T>")
+        head = f"{template_type(options['template_depth'])} {name}({params})"
+    else:
+        head = f"{rng.choice(TYPES)} {name}({params})"
+
+    # alternating brace styles and multiline parameter lists
+    variant = rng.randrange(3)
+    if variant == 0:
+        lines.append(head + " {")
+    elif variant == 1:
+        lines.extend([head, "{"])
+    else:
+        split = head.index("(") + 1
+        lines.extend([head[:split], "        " + head[split:] + " {"])
+
+    for i in range(options["body_lines"]):
+        kind = rng.randrange(4)
+        if kind == 0:
+            lines.append(f"    int v{i} = {rng.randrange(100)}; // value {{ {i}")
+        elif kind == 1:
+            lines.append(f"    if (v{max(i - 1, 0)} > {i}) {{ v{max(i - 1, 0)}--; }}")
+        elif kind == 2:
+            lines.append(f'    const char* s{i} = "text {{ {i} }}";')
+        else:
+            lines.append(f"    /* step {i} */ int w{i} = {i} * 2;")
+    lines.append("    return {};")
+    lines.append("}")
+    return lines
+
+def filler_lines(rng, index):
+    """
+    Returning the lines of a top-level item, which is no function definition.
+    """
+    kind = rng.randrange(4)
+    if kind == 0:
+        return [f"static int global_{index} = {rng.randrange(1000)};"]
+    if kind == 1:
+        return [f"int declared_{index}(int a, double b);"]
+    if kind == 2:
+        return [f"struct Item{index} {{", "    int id;", "    double value;", "};"]
+    return [f"#define LIMIT_{index} {rng.randrange(1000)}"]
+
+def pathological_lines(rng, length, index):
+    """
+    Returning one pathological (very long) line, which is valid C++.
+    """
+    kind = index % 6
+    if kind == 0:
+        count = length // 6
+        return f"static const int table_{index}[] = {{{', '.join('1' for _ in range(count))}}};"
+    if kind == 1:
+        return f"#define LONG_MACRO_{index}(x) (" + " + ".join("(x)" for _ in range(length // 6)) + ")"
+    if kind == 2:
+        return f'static const char* text_{index} = "' + "a" * length + '";'
+    if kind == 3:
+        return "// " + "word " * (length // 5)
+    if kind == 4:
+        return f"static int qualified_{index} = " + "a::" * (length // 3) + "b;"
+    return f"std::map<{'std::vector<' * (length // 24)}int{'>' * (length // 24)}, int> nested_{index};"
+
+def generate_source(options, seed, file_index=0):
+    """
+    Returning the text of one generated source file.
+    """
+    rng = random.Random(f"{seed}-{file_index}")
+    lines = ["#include <string>", "#include <vector>", "#include <map>", ""]
+
+    functions = options["functions"]
+    overloads = max(1, options["overloads"])
+    density = min(max(options["density"], 0.05), 1.0)
+    pathological = set(rng.sample(range(functions + 1), min(options["pathological"], functions + 1)))
+
+    for index in range(functions):
+        if index in pathological:
+            lines.append(pathological_lines(rng, options["pathological_length"], index))
+            lines.append("")
+        while rng.random() > density:
+            lines.extend(filler_lines(rng, f"{index}_{rng.randrange(10**6)}"))
+            lines.append("")
+        name = f"func_{file_index}_{index // overloads}"
+        lines.extend(function_lines(rng, options, name, index % overloads))
+        lines.append("")
+    return "\n".join(lines) + "\n"
+
+def generate_corpus(options=None, seed=0):
+    """
+    Returning the generated corpus as list of (file_name, text).
+    """
+    options = corpus_options(**(options or {}))
+    return [(f"file_{index:04d}.cpp", generate_source(options, seed, index))
+            for index in range(options["files"])]
+
+def write_corpus(directory, options=None, seed=0):
+    """
+    Writing the generated corpus into directory.
+    Returns the paths of the written files.
+    """
+    os.makedirs(directory, exist_ok=True)
+    paths = []
+    for file_name, text in generate_corpus(options, seed):
+        path = os.path.join(directory, file_name)
+        with open(path, "w", encoding="utf-8", newline="") as f:
+            f.write(text)
+        paths.append(path)
+    return paths
@@ -97,6 +97,22 @@ def load_config(config_path = ""):
                 "readonly": get_with_fallback(config_data, "readonly", True, "root"),
                 "headerCommentStyle": get_with_fallback(
                     config_data, "headerCommentStyle", None, "root"),
+                # optional settings, no warning if they are not specified
+                "jobs": config_data.get("jobs", 1),
+                "parse_chunk_lines": config_data.get("parse_chunk_lines", 50000),
+                "cache": config_data.get("cache", True),
+                "cache_path": config_data.get("cache_path"),
+                "cache_max_size": config_data.get("cache_max_size", 256),
+                "incremental": config_data.get("incremental", True),
+                "manifest_path": config_data.get("manifest_path"),
+                "backup_compress": config_data.get("backup_compress", False),
+                "backup_keep_runs": config_data.get("backup_keep_runs", 20),
+                "extensions": config_data.get("extensions"),
+                "include": config_data.get("include"),
+                "exclude": config_data.get("exclude"),
+                "ignore_files": config_data.get("ignore_files"),
+                "use_gitignore": config_data.get("use_gitignore", False),
+                "walk_workers": config_data.get("walk_workers", 1),
             }, None
         except Exception as e:
             return None, f"[configSetup] Error parsing config file '{used_path}': {e}"
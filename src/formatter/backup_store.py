@@ -0,0 +1,289 @@
+# CppCodeDoc — Licensed under the GNU General Public License v3.0 (GPLv3-or-later)
+# SPDX-License-Identifier: GPLv3-or-later
+# Copyright (C) 2025 Jojo1220
+# See https://www.gnu.org/licenses/gpl-3.0.html
+
+"""
+Content-addressed backup store.
+Before a source file is edited, its content is stored as blob within
+backup_path/objects, named by the sha256 hash of the content, so every unique
+content is stored once (optionally gzip compressed), independent of the file
+name or directory and of the number of runs. Each documentation run appends
+the backed up files to its run journal (backup_path/runs/<run id>.jsonl,
+original path -> blob), which is used to restore the files of a run (--restore).
+"""
+
+import os
+import sys
+import stat
+import gzip
+import json
+import shutil
+import hashlib
+import tempfile
+from datetime import datetime
+
+from formatter.run_manifest import hash_file
+
+DEFAULT_KEEP_RUNS = 20
+LATEST_RUN = "latest"
+
+# ioctl of Linux to share the data blocks of two files (copy-on-write, e.g. btrfs/xfs)
+FICLONE = 0x40049409
+
+class BackupStore:
+    """
+    Backup store within root, shared by all processes of a documentation run.
+    run_id: name of the run journal, a new id (time and process) if not specified
+    compress: storing new blobs gzip compressed
+    """
+    def __init__(self, root, compress=False, run_id=None):
+        self.root = root
+        self.compress = compress
+        self.run_id = run_id or f"{datetime.now().strftime('%Y%m%d-%H%M%S-%f')}-{os.getpid()}"
+
+    @property
+    def objects_dir(self):
+        return os.path.join(self.root, "objects")
+
+    @property
+    def runs_dir(self):
+        return os.path.join(self.root, "runs")
+
+    def blob_path(self, digest, compressed=False):
+        """
+        Returning the file path of a blob.
+        """
+        return os.path.join(self.objects_dir, digest[:2], digest + (".gz" if compressed else ""))
+
+    def find_blob(self, digest):
+        """
+        Returning the file path of a stored blob (compressed or not), or None.
+        """
+        for compressed in (False, True):
+            path = self.blob_path(digest, compressed)
+            if os.path.exists(path):
+                return path
+        return None
+
+    def add(self, file_path, content=None):
+        """
+        Backing up a file and adding it to the run journal.
+        If the file content is already loaded, it can be overloaded by content
+        (text read with newline=''), which avoids reading the file a second time.
+        A content, which is already stored, is not written again.
+        Returns the sha256 hash of the content.
+        """
+        if content is not None:
+            data = content.encode("utf-8", "surrogatepass")
+            digest = hashlib.sha256(data).hexdigest()
+            size = len(data)
+        else:
+            data = None
+            digest = hash_file(file_path)
+            size = os.path.getsize(file_path)
+
+        if self.find_blob(digest) is None:
+            self.write_blob(digest, file_path, data)
+
+        os.makedirs(self.runs_dir, exist_ok=True)
+        record = json.dumps({"path": os.path.abspath(file_path), "blob": digest, "size": size})
+        # one write per line, so parallel worker processes do not mix their lines
+        with open(self.journal_path(self.run_id), "a", encoding="utf-8") as f:
+            f.write(record + "\n")
+        return digest
+
+    def write_blob(self, digest, file_path, data=None):
+        """
+        Storing a new blob out of data or the file (cloned, if supported by the
+        file system). Written atomically and read-only afterwards.
+        """
+        path = self.blob_path(digest, self.compress)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                if self.compress:
+                    with gzip.GzipFile(fileobj=f, mode="wb", mtime=0) as gz:
+                        if data is None:
+                            with open(file_path, "rb") as src:
+                                shutil.copyfileobj(src, gz)
+                        else:
+                            gz.write(data)
+                elif data is not None:
+                    f.write(data)
+                else:
+                    with open(file_path, "rb") as src:
+                        if not clone_file(src, f):
+                            shutil.copyfileobj(src, f)
+            os.chmod(tmp_path, 0o444)
+            os.replace(tmp_path, path)
+        except OSError:
+            remove_file(tmp_path)
+            # another process stored the same blob at the same time
+            if os.path.exists(path):
+                return
+            raise
+        except BaseException:
+            remove_file(tmp_path)
+            raise
+
+    def read_blob(self, digest):
+        """
+        Returning the content of a blob, verified by its hash.
+        """
+        path = self.find_blob(digest)
+        if path is None:
+            raise FileNotFoundError(f"Backup blob {digest} is missing")
+        opener = gzip.open if path.endswith(".gz") else open
+        with opener(path, "rb") as f:
+            data = f.read()
+        if hashlib.sha256(data).hexdigest() != digest:
+            raise ValueError(f"Backup blob {digest} is corrupted")
+        return data
+
+    def journal_path(self, run_id):
+        """
+        Returning the file path of the journal of a run.
+        """
+        return os.path.join(self.runs_dir, run_id + ".jsonl")
+
+    def list_runs(self):
+        """
+        Returning the ids of all stored runs, oldest first.
+        """
+        try:
+            names = os.listdir(self.runs_dir)
+        except OSError:
+            return []
+        return sorted(name[:-len(".jsonl")] for name in names if name.endswith(".jsonl"))
+
+    def get_run(self, run_id=LATEST_RUN):
+        """
+        Returning the backed up files of a run as dict original path -> blob.
+        If a file was backed up several times within the run, its first backup is used.
+        """
+        if run_id == LATEST_RUN:
+            runs = self.list_runs()
+            if not runs:
+                raise FileNotFoundError(f"No backup runs within {self.root}")
+            run_id = runs[-1]
+        files = {}
+        with open(self.journal_path(run_id), "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    # partly written line of an aborted run
+                    continue
+                files.setdefault(record["path"], record["blob"])
+        return files
+
+    def restore(self, run_id=LATEST_RUN, files=None):
+        """
+        Restoring the files of a run to their original paths.
+        files: optional selection of original paths (all files of the run if not specified)
+        Returns the paths of the restored files.
+        """
+        backup = self.get_run(run_id)
+        if files is not None:
+            selected = {os.path.abspath(path) for path in files}
+            backup = {path: digest for path, digest in backup.items() if path in selected}
+
+        restored = []
+        for path, digest in backup.items():
+            if os.path.exists(path) and hash_file(path) == digest:
+                continue
+            data = self.read_blob(digest)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as f:
+                    f.write(data)
+                if os.path.exists(path):
+                    shutil.copymode(path, tmp_path)
+                else:
+                    os.chmod(tmp_path, 0o666 & ~current_umask())
+                os.replace(tmp_path, path)
+            except BaseException:
+                remove_file(tmp_path)
+                raise
+            restored.append(path)
+        return restored
+
+    def prune(self, keep_runs=DEFAULT_KEEP_RUNS):
+        """
+        Deleting all runs except the latest keep_runs and all blobs, which are not
+        used by the remaining runs. Returns the number of deleted blobs.
+        """
+        runs = self.list_runs()
+        outdated = runs[:max(0, len(runs) - keep_runs)]
+        if not outdated:
+            return 0
+        for run_id in outdated:
+            remove_file(self.journal_path(run_id))
+
+        used = set()
+        for run_id in self.list_runs():
+            try:
+                used.update(self.get_run(run_id).values())
+            except OSError:
+                continue
+
+        deleted = 0
+        for root, _, files in os.walk(self.objects_dir):
+            for file in files:
+                digest = file[:-len(".gz")] if file.endswith(".gz") else file
+                # temporary files of blobs, which are written right now, are kept
+                if digest in used or file.endswith(".tmp"):
+                    continue
+                path = os.path.join(root, file)
+                try:
+                    # blobs are read-only, which prevents their removal on Windows
+                    os.chmod(path, stat.S_IREAD | stat.S_IWRITE)
+                    os.remove(path)
+                    deleted += 1
+                except OSError:
+                    continue
+        return deleted
+
+def remove_file(file_path):
+    """
+    Deleting a (temporary) file, if it exists.
+    """
+    try:
+        os.remove(file_path)
+    except OSError:
+        pass
+
+def clone_file(src, dst):
+    """
+    Cloning the data of the open file src into dst (reflink, copy-on-write),
+    returns False if not supported by the platform or file system.
+    """
+    if not sys.platform.startswith("linux"):
+        return False
+    try:
+        import fcntl
+        fcntl.ioctl(dst.fileno(), FICLONE, src.fileno())
+        return True
+    except (ImportError, OSError):
+        return False
+
+def current_umask():
+    """
+    Returning the umask of the process (permissions of newly created files).
+    """
+    umask = os.umask(0)
+    os.umask(umask)
+    return umask
+
+def create_backup_store(arguments):
+    """
+    Creating the backup store of a documentation run out of the configuration,
+    or None if no backup is made (readonly or no backup_path).
+    backup_compress: storing the blobs gzip compressed
+    """
+    if arguments.get("readonly") or arguments.get("backup_path") is None:
+        return None
+    return BackupStore(arguments["backup_path"], bool(arguments.get("backup_compress", False)))
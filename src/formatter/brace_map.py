@@ -0,0 +1,71 @@
+# CppCodeDoc — Licensed under the GNU General Public License v3.0 (GPLv3-or-later)
+# SPDX-License-Identifier: GPLv3-or-later
+# Copyright (C) 2025 Jojo1220
+# See https://www.gnu.org/licenses/gpl-3.0.html
+
+"""
+Per-file brace map.
+The curly braces of all lines (without strings and comments) are counted
+in a single pass over the lexed lines (see line_analysis), so the end line of every function
+is a direct lookup instead of a rescan of the whole file per function.
+"""
+
+from bisect import bisect_left
+
+from formatter.comment_index import CommentIndex
+from formatter.cpp_lexer import clean_line, clean_lines
+from formatter.line_analysis import analyze_lines
+
+class BraceMap:
+    """
+    Brace depth map of a file.
+    depths[i]: brace depth at the beginning of line i (depths[len(lines)] at the end of the file)
+    closing_lines: matching table depth -> sorted lines containing a "}",
+                   after which the depth is back at this depth
+    The end line of a function starting at line s is the first line of
+    closing_lines[depths[s]] at or below s (see find_function_end_line).
+    comment_index: comment and string regions of the lines (see CommentIndex.from_lines)
+    """
+    def __init__(self, lines):
+        self.build(lines)
+
+    def build(self, lines):
+        """
+        Counting the braces of all lines in one pass (see cpp_lexer and line_analysis).
+        """
+        cleaned_lines, self.lexer_states = clean_lines(lines)
+        analysis = analyze_lines(lines, cleaned_lines)
+        self.braces = list(zip(analysis.openings, analysis.closings))
+        self.depths = analysis.depths
+        self.closing_lines = {}
+        self.comment_index = CommentIndex.from_lines(lines)
+
+        for i, closing in enumerate(analysis.closings):
+            if closing:
+                self.closing_lines.setdefault(self.depths[i + 1], []).append(i)
+
+    def end_line(self, start_line):
+        """
+        Returning the line of the closing curly brace of the function starting
+        at start_line, or None if the function is not closed.
+        """
+        if not 0 <= start_line < len(self.braces):
+            return None
+
+        closing_lines = self.closing_lines.get(self.depths[start_line], [])
+        idx = bisect_left(closing_lines, start_line)
+        return closing_lines[idx] if idx < len(closing_lines) else None
+
+    def update_line(self, lines, line_idx):
+        """
+        Has to be called after lines[line_idx] has been edited (e.g. a post comment was added).
+        The map is only rebuilt, if the braces of the line or the comments or raw strings
+        crossing its bounds have changed, otherwise only the regions of the line are replaced.
+        """
+        code, state = clean_line(lines[line_idx], self.lexer_states[line_idx])
+        if ((code.count("{"), code.count("}")) != self.braces[line_idx]
+                or self.lexer_states[line_idx] is not None
+                or state != self.lexer_states[line_idx + 1]):
+            self.build(lines)
+        else:
+            self.comment_index.replace_line(line_idx, lines[line_idx])
@@ -10,9 +10,36 @@ This file contains parsing functionality.
 
 import os
 import re
-import shutil
+from bisect import bisect_left, bisect_right
 from pathlib import PurePath
-
+from itertools import repeat
+from concurrent.futures import ProcessPoolExecutor
+
+from formatter.function_index import FunctionIndex
+from formatter.brace_map import BraceMap
+from formatter.cpp_lexer import clean_lines, TokenStream, COMMENT, STRING
+from formatter.line_analysis import (
+    analyze_lines, classify_lines, LineClasses, BLANK, LINE_COMMENT, BLOCK_COMMENT, PREPROCESSOR)
+from formatter.function_head import match_function_head, match_constructor_head
+from formatter.comment_index import CommentIndex
+from formatter.function_record import FunctionRecord
+from formatter.backup_store import BackupStore
+from streamLogger.trace import get_tracer, get_trace_spec, enable_tracing
+from utils.file_utils import write_text_if_changed
+from utils.memo_cache import memoize
+
+trace = get_tracer("parser")
+
+# files with more lines are parsed in parallel chunks (parse_chunk_lines)
+DEFAULT_CHUNK_LINES = 50000
+
+TEMPLATE_PLACEHOLDER_REGEX = re.compile(r"__TPL\d+__")
+
+# function head after a '}', at which a line of several functions is split
+SPLIT_HEAD_REGEX = re.compile(r'\s*(?:/\*.*?\*/\s*)*[\w:~]+\s+[\w:~]+\s*\(')
+
+# memoized, but not while tracing (the trace output of each call is kept)
+@memoize(bypass=lambda: trace.debug)
 def normalize_signature(sig: str) -> str:
     """
     Deleting double spaces and normalizing pointer distances.
@@ -22,18 +49,22 @@ def normalize_signature(sig: str) -> str:
     sig = re.sub(r'/\*.*?\*/', '', sig)
     normalized = re.sub(r'\s+', ' ', sig.strip().replace(' *', '*').replace(' &', '&'))
     normalized = re.sub(r'\s*=\s*', '=', normalized)  # normalization of equal signs
-    print(f"[code_parser][normalize_signature] Input: '{sig}' -> Output: '{normalized}'")
+    if trace.debug:
+        trace.log("[normalize_signature] Input: '%s' -> Output: '%s'", sig, normalized)
     return normalized
 
+@memoize(bypass=lambda: trace.debug)
 def extract_param_signature(buffer: str) -> str:
     """
     extracting parameter signature out of function definition,
     if previously found.
     """
-    print(f"[code_parser][extract_param_signature] Raw buffer: '{buffer}'")
+    if trace.debug:
+        trace.log("[extract_param_signature] Raw buffer: '%s'", buffer)
     start = buffer.find('(')
     if start == -1:
-        print("[code_parser][extract_param_signature] No opening parenthesis found.")
+        if trace.debug:
+            trace.log("[extract_param_signature] No opening parenthesis found.")
         return ""
 
     depth = 0
@@ -47,9 +78,60 @@ def extract_param_signature(buffer: str) -> str:
                 # Cleaning up inline comments and block comments
                 return normalize_signature(param_block)
 
-    print("[code_parser][extract_param_signature] No matching closing parenthesis found.")
+    if trace.debug:
+        trace.log("[extract_param_signature] No matching closing parenthesis found.")
     return ""
 
+def escape_function_name(function_name: str) -> str:
+    """
+    escaping function name for further regex based searching.
+    Operator-names and destructors are escaped in a special way.
+    """
+    if function_name.startswith("operator"):
+        # Operator-name, but no alphanumeric characters should be escaped
+        # Only escape special characters after "operator"
+        base = "operator"
+        suffix = function_name[len(base):]
+        # only escape special characters in the suffix
+        escaped_suffix = re.escape(suffix)
+        return base + escaped_suffix
+
+    escaped_name = re.escape(function_name)
+    return escaped_name.replace("\\~", "~")
+
+def is_function_definition_line(stripped: str, function_name: str) -> bool:
+    """
+    Checking, if the stripped line is the start of a function definition
+    (Constructor/Destructor or function definition, NO FUNCTION CALLS).
+    """
+    escaped_name = escape_function_name(function_name)
+    is_definition = bool(re.match(
+        rf'^\s*(?:[\w:\s<>\[\],*&]+)?\s*{escaped_name}\s*\(',
+        stripped
+    ))
+    is_call = re.match(rf'.*\b{escaped_name}\b\s*\(.*\)\s*;', stripped)
+    return is_definition and is_call is None
+
+def is_function_start_line(lines, start_line, func):
+    """
+    Checking, if the function record func starts at start_line of lines: the line
+    has to be a definition of the function name (see is_function_definition_line)
+    and the parameters up to the opening curly brace have to match the normalized
+    signature of func (compared like within find_function_start_line), so an
+    overload of the same name is not taken for the function.
+    """
+    stripped = lines[start_line].strip()
+    if not is_function_definition_line(stripped, func["name"]):
+        return False
+
+    buffer = stripped
+    line_idx = start_line
+    while "{" not in buffer and ";" not in buffer and line_idx + 1 < len(lines):
+        line_idx += 1
+        buffer += " " + lines[line_idx].strip()
+    expected_params = normalize_signature(normalize_signature(func["params"])).lower()
+    return normalize_signature(extract_param_signature(buffer)).lower() == expected_params
+
 def find_function_start_line(
         content: str, function_name: str,param_signature: str = None,
         occurrence: int = 1) -> int:
@@ -59,23 +141,16 @@ def find_function_start_line(
     returns the line number, where function is found.
     """
 
-    print("[code_parser][find_function_start_line]\n"
-          f"=== search for function'{function_name}' "
-          f"with parameter '{param_signature}' ===")
+    if trace.debug:
+        trace.log("[find_function_start_line]\n=== search for function'%s' with parameter '%s' ===",
+                  function_name, param_signature)
     match_count = 0
     lines = content.splitlines()
-    if function_name.startswith("operator"):
-        # Operator-name, but no alphanumeric characters should be escaped
-        # Only escape special characters after "operator"
-        base = "operator"
-        suffix = function_name[len(base):]
-        # only escape special characters in the suffix
-        escaped_suffix = re.escape(suffix)
-        escaped_name = base + escaped_suffix
-    else:
-        escaped_name = re.escape(function_name)
-        escaped_name = escaped_name.replace("\\~", "~")
+    escaped_name = escape_function_name(function_name)
     param_signature = normalize_signature(param_signature) if param_signature is not None else None
+    # the expected signature is compared normalized once more (see below)
+    expected_params = (normalize_signature(param_signature).lower()
+                       if param_signature is not None else None)
 
     start_index = None
     buffer = ""
@@ -101,11 +176,9 @@ def find_function_start_line(
         if start_index is None:
             # Checking for Constructor/Destructor or function definition (NO FUNCTION CALLS)
             if re.search(rf'{escaped_name}\s*\(', stripped):
-                print("[code_parser][find_function_start_line] → function definition found!")
-                is_definition = bool(re.match(
-                    rf'^\s*(?:[\w:\s<>\[\],*&]+)?\s*{escaped_name}\s*\(',
-                    stripped
-                ))
+                if trace.debug:
+                    trace.log("[find_function_start_line] → function definition found!")
+                is_definition = is_function_definition_line(stripped, function_name)
 
                 # Checking for one-liner-Destructor/Constructor definition
                 is_destructor = bool(re.match(
@@ -113,327 +186,397 @@ def find_function_start_line(
                     stripped
                 ))
 
-                is_call = re.match(rf'.*\b{escaped_name}\b\s*\(.*\)\s*;', stripped)
-
-                if is_definition and not is_call:
-                    print(f"\n[Line {idx}] {line.strip()}")
-                    print("  → Potentieller Funktionsstart gefunden")
+                if is_definition:
+                    if trace.debug:
+                        trace.log("\n[Line %d] %s\n  → Potentieller Funktionsstart gefunden",
+                                  idx, stripped)
                     start_index = idx
                     buffer = stripped
                     # Applying to the destructor or constructor
                     if is_destructor:
-                        print("  [DEBUG] Destruktor erkannt.")
                         actual_params = extract_param_signature(buffer)
-                        print(f"  [DEBUG] actual_params = '{actual_params}'")
-                        print(f"  [DEBUG] expected      = '{param_signature}'")
+                        if trace.debug:
+                            trace.log("  Destruktor erkannt.\n  actual_params = '%s'\n"
+                                      "  expected      = '%s'", actual_params, param_signature)
                         if (param_signature is None
-                                or normalize_signature(actual_params).lower() ==
-                                    normalize_signature(param_signature).lower()):
+                                or normalize_signature(actual_params).lower() == expected_params):
 
                             match_count += 1
                             if match_count == occurrence:
-                                print("  ✅ Match found (Destructor found)")
+                                if trace.debug:
+                                    trace.log("  ✅ Match found (Destructor found)")
                                 return start_index
                             else:
-                                print("  ➕ Matching function start, "
-                                      "but not correct function order.")
+                                if trace.debug:
+                                    trace.log("  ➕ Matching function start, "
+                                              "but not correct function order.")
                                 start_index = None
                                 buffer = ""
 
                     # Constructor or other function
                     if "{" in stripped:
                         actual_params = extract_param_signature(buffer)
-                        print(f"  [DEBUG] actual_params = '{actual_params}'")
-                        print(f"  [DEBUG] expected      = '{param_signature}'")
+                        if trace.debug:
+                            trace.log("  actual_params = '%s'\n  expected      = '%s'",
+                                      actual_params, param_signature)
                         if (param_signature is None or
-                            normalize_signature(actual_params).lower() ==
-                            normalize_signature(param_signature).lower()):
+                            normalize_signature(actual_params).lower() == expected_params):
 
                             match_count += 1
                             if match_count == occurrence:
-                                print("  ✅ Match found (inline)")
+                                if trace.debug:
+                                    trace.log("  ✅ Match found (inline)")
                                 return start_index
                             else:
-                                print("  ➕ Matching function start, "
-                                      "but not correct function order.")
+                                if trace.debug:
+                                    trace.log("  ➕ Matching function start, "
+                                              "but not correct function order.")
                                 start_index = None
                                 buffer = ""
                         else:
-                            print("  ❌ No Match, reset")
+                            if trace.debug:
+                                trace.log("  ❌ No Match, reset")
                             start_index = None
                             buffer = ""
         else:
             buffer += " " + stripped
             if "{" in stripped:
-                print(f"\n[Line {idx}] {line.strip()}")
-                print("  → End of Functiondeclaration (multiline)")
                 actual_params = extract_param_signature(buffer)
-                print(f"  [DEBUG] actual_params = '{actual_params}'")
-                print(f"  [DEBUG] expected      = '{param_signature}'")
+                if trace.debug:
+                    trace.log("\n[Line %d] %s\n  → End of Functiondeclaration (multiline)\n"
+                              "  actual_params = '%s'\n  expected      = '%s'",
+                              idx, stripped, actual_params, param_signature)
                 if (not param_signature
-                    or normalize_signature(actual_params).lower() ==
-                    normalize_signature(param_signature).lower()):
+                    or normalize_signature(actual_params).lower() == expected_params):
 
                     match_count += 1
                     if match_count == occurrence:
-                        print("  ✅ Match found (multiline)")
+                        if trace.debug:
+                            trace.log("  ✅ Match found (multiline)")
                         return start_index
                     else:
-                        print("  ➕ Matching function start, but not correct function order.")
+                        if trace.debug:
+                            trace.log("  ➕ Matching function start, but not correct function order.")
                         start_index = None
                         buffer = ""
                 else:
-                    print("  ❌ No Match, reset")
+                    if trace.debug:
+                        trace.log("  ❌ No Match, reset")
                     start_index = None
                     buffer = ""
 
-    print("🔚 Function not found.")
+    if trace.debug:
+        trace.log("🔚 Function not found.")
     return -1
 
 def remove_strings_and_comments(lines):
     """
-    removing strings and comments out of overloaded lines.
+    removing strings and comments out of overloaded lines (see cpp_lexer).
     returns a clear lines-set
     """
-    in_block_comment = False
-    result = []
-
-    # Total Regex for Literale
-    string_regex = re.compile(r'"(\\.|[^"\\])*"')
-    char_regex = re.compile(r"'(\\.|[^'\\])'")
-
-    for line in lines:
-        if not in_block_comment:
-            line = string_regex.sub('""', line)
-            line = char_regex.sub("''", line)
-
-        new_line = []
-        i = 0
-        while i < len(line):
-            if in_block_comment:
-                if line[i:i+2] == "*/":
-                    in_block_comment = False
-                    i += 2
-                else:
-                    i += 1
-            else:
-                if line[i:i+2] == "/*":
-                    in_block_comment = True
-                    i += 2
-                elif line[i:i+2] == "//":
-                    break
-                else:
-                    new_line.append(line[i])
-                    i += 1
-        result.append("".join(new_line))
+    result, _ = clean_lines(lines)
     return result
 
-def find_function_end_line(lines, start_line):
+def find_function_end_line(lines, start_line, brace_map=None):
     """
     Seaching for the end of a function starting at start_line.
     During that, opening and closing curly braces are counted.
+    If a brace_map of lines is overloaded, the end line is looked up out of it.
     Retuns: The line number (including start_line) of the closing curly brace.
     """
-    brace_count = 0
-    cleaned_lines = remove_strings_and_comments(lines)
-
-    for i in range(start_line, len(cleaned_lines)):
-        code = cleaned_lines[i]
-        brace_count += code.count("{")
-        brace_count -= code.count("}")
-        if brace_count == 0 and "}" in code:
-            return i
+    if brace_map is not None:
+        return brace_map.end_line(start_line)
 
-    return None
+    return analyze_lines(lines, remove_strings_and_comments(lines)).end_line(start_line)
 
-def mask_templates(line: str):
+def mask_templates(line: str, tokens=None):
     """
     masking function pattern to a template.
+    tokens: the tokens of line (see TokenStream), lexed out of line if not overloaded;
+            '<' and '>' within comments and literals are no template brackets
     Returns: masked string, templates
     """
-    stack, templates = [], []
-    masked = ''
-    i, last_pos, placeholder_count = 0, 0, 0
+    if tokens is None:
+        tokens = TokenStream([line]).tokens[0]
+    stack, templates, masked = [], [], []
+    last_pos, copied = 0, 0
 
-    while i < len(line):
-        if line[i] == '<':
+    for kind, i, _ in tokens:
+        if kind == '<':
             if not stack:
                 last_pos = i
             stack.append(i)
-        elif line[i] == '>' and stack:
+        elif kind == '>' and stack:
             stack.pop()
             if not stack:
                 # total template-block
-                original = line[last_pos:i+1]
-                placeholder = f"__TPL{placeholder_count}__"
-                templates.append((placeholder, original))
-                masked += line[:last_pos] + placeholder
-                line = line[i+1:]
-                i = -1
-                placeholder_count += 1
-        i += 1
+                placeholder = f"__TPL{len(templates)}__"
+                templates.append((placeholder, line[last_pos:i+1]))
+                masked.append(line[copied:last_pos])
+                masked.append(placeholder)
+                copied = i + 1
+
+    masked.append(line[copied:])
+    return "".join(masked), dict(templates)
+
+def unmask_templates(text, templates):
+    """
+    demasking the placeholders of mask_templates in text back to the original templates.
+    """
+    if not templates or not text:
+        return text
+    return TEMPLATE_PLACEHOLDER_REGEX.sub(
+        lambda match: templates.get(match.group(), match.group()), text)
 
-    masked += line
-    return masked, dict(templates)
+def strip_tokens(text, tokens):
+    """
+    Stripping text and shifting its tokens (kind, start, end) along.
+    """
+    if not text or not text[0].isspace() and not text[-1].isspace():
+        return text, tokens
+    stripped = text.lstrip()
+    shift = len(text) - len(stripped)
+    stripped = stripped.rstrip()
+    return stripped, [(kind, max(start - shift, 0), min(end - shift, len(stripped)))
+                      for kind, start, end in tokens]
+
+def remove_comment_tokens(text, tokens, inline_only=False):
+    """
+    Deleting the comment tokens out of text (inline_only: only the /* ... */ comments,
+    which start and end within text).
+    Returns the stripped text and its remaining tokens.
+    """
+    for kind, _, _ in tokens:
+        if kind == COMMENT:
+            break
+    else:
+        return strip_tokens(text, tokens)
+    parts, kept = [], []
+    copied = removed = 0
+    for kind, start, end in tokens:
+        if kind != COMMENT or inline_only and not (
+                text.startswith("/*", start) and end - start >= 4
+                and text.endswith("*/", 0, end)):
+            kept.append((kind, start - removed, end - removed))
+            continue
+        parts.append(text[copied:start])
+        copied = end
+        removed += end - start
+    parts.append(text[copied:])
+    return strip_tokens("".join(parts), kept)
 
-def extract_multiline_comments(lines):
+def extract_multiline_comments(lines, stream=None):
     """
     Collecting block comments that are in their own lines, and return them as a list of tuples.
+    stream: TokenStream of lines (lexed out of lines if not overloaded)
     """
+    stream = stream or TokenStream(lines)
     comments = []
     comment_start = None
 
-    for i, line in enumerate(lines):
-        stripped = line.strip()
-        if stripped.startswith("/*") and comment_start is None:
+    for i, line_tokens in enumerate(stream.tokens):
+        if comment_start is None:
+            # a block comment starting at the beginning of the line
+            if stream.states[i] is not None or not line_tokens:
+                continue
+            kind, start, _ = line_tokens[0]
+            if kind != COMMENT or not lines[i].startswith("/*", start) or lines[i][:start].strip():
+                continue
             comment_start = i
-        if comment_start is not None and stripped.endswith("*/"):
+        if stream.code_lines[i].strip():
+            # code before or after the comments of the line
+            comment_start = None
+        elif stream.states[i + 1] is None:
             comment_text = "\n".join(lines[comment_start:i+1])
             comments.append((comment_start, i, comment_text))
             comment_start = None
 
     return comments
 
-def join_multiline_function_declarations(lines):
+def join_multiline_function_declarations(lines, stream=None, classes=None):
     """
     Collecting multi-line function declarations and joining them into a single line.
+    stream: TokenStream of lines (lexed out of lines if not overloaded)
+    classes: line classes of lines (see classify_lines, classified if not overloaded)
     Returns:
         final_lines: list[str]   → combined ans splittet functionlines
         final_mapping: list[int] → for each final_line the mapped original-line (last-relevant)
         startline_map: list[int] → for each final_line the original index
     """
-    joined, mapping, starts = [], [], []
+    final_lines, final_mapping, final_startlines, _ = join_declaration_tokens(
+        lines, stream, classes)
+    return final_lines, final_mapping, final_startlines
+
+def join_declaration_tokens(lines, stream=None, classes=None):
+    """
+    join_multiline_function_declarations, returning additionally the tokens
+    (kind, start, end) of each final line out of the TokenStream of lines.
+    Comments within joined declarations are deleted, the decisions are taken
+    on the code of the lines (outside of comments and literals).
+    """
+    stream = stream or TokenStream(lines)
+    classes = classes if classes is not None else classify_lines(lines)
+    joined, joined_tokens, mapping, starts = [], [], [], []
     i = 0
     while i < len(lines):
-        raw = lines[i].strip()
+        code = stream.code_lines[i].strip()
 
         # Take directly, if empty line, only comment or visibility modifier
-        if (not raw
-                or raw.startswith(("//", "/*", "*", "*/"))
-                or raw in ("public:", "private:", "protected:")):
-            joined.append(lines[i])
-            mapping.append(i)
-            starts.append(i)
-            i += 1
-            continue
-
-        if ('(' in raw and '{' in raw and raw.endswith('}')
-                and raw.count('{') == 1 and raw.count('}') == 1):
-            joined.append(lines[i])
-            mapping.append(i)
-            starts.append(i)
-            i += 1
-            continue
-
-        # Special case: multiple functions in one line → split later
-        if ('(' in raw and '{' in raw and raw.endswith('}')
-            and (raw.count('{') > 1 or raw.count('}') > 1)):
-            joined.append(lines[i])
-            mapping.append(i)
-            starts.append(i)
-            i += 1
-            continue
-
-        if '(' in raw and not raw.endswith(';') and not raw.startswith('#'):
-            cur = raw
-            paren_level = raw.count('(') - raw.count(')')
+        if (classes[i] in (BLANK, LINE_COMMENT, BLOCK_COMMENT)
+                or lines[i].strip() in ("public:", "private:", "protected:")):
+            pass
+        # Function in one line, or multiple functions in one line → split later
+        elif '(' in code and '{' in code and code.endswith('}'):
+            pass
+        elif '(' in code and not code.endswith(';') and not stream.directives[i]:
+            cur, cur_tokens = strip_tokens(lines[i], stream.tokens[i])
+            paren_level = code.count('(') - code.count(')')
             start = i
 
-            while (paren_level > 0 or not cur.rstrip().endswith('{')) and i + 1 < len(lines):
-                nxt = lines[i + 1].strip()
-
-                if not nxt or nxt.startswith(("//", "/*", "*", "#")):
+            while (paren_level > 0 or not code.endswith('{')) and i + 1 < len(lines):
+                if (classes[i + 1] in (BLANK, LINE_COMMENT, BLOCK_COMMENT)
+                        or stream.directives[i + 1]):
                     break
 
-                if nxt.startswith('{'):
-                    comment_match = re.search(r'//|/\*', cur)
-                    if comment_match:
-                        cur = cur[:comment_match.start()].rstrip()
-
+                if start == i:
+                    cur, cur_tokens = remove_comment_tokens(cur, cur_tokens)
+                nxt, nxt_tokens = remove_comment_tokens(
+                    *strip_tokens(lines[i + 1], stream.tokens[i + 1]))
                 i += 1
-                cur += ' ' + nxt
-                paren_level += nxt.count('(') - nxt.count(')')
-
-                if cur.rstrip().endswith(('{', ';')):
+                if nxt:
+                    cur_tokens.extend((kind, token_start + len(cur) + 1, token_end + len(cur) + 1)
+                                      for kind, token_start, token_end in nxt_tokens)
+                    cur += ' ' + nxt
+                nxt_code = stream.code_lines[i].strip()
+                code = f"{code} {nxt_code}".rstrip()
+                paren_level += nxt_code.count('(') - nxt_code.count(')')
+
+                if code.endswith(('{', ';')):
                     break
 
             joined.append(cur)
+            joined_tokens.append(cur_tokens)
             mapping.append(i)
             starts.append(start)
             i += 1
-        else:
-            joined.append(lines[i])
-            mapping.append(i)
-            starts.append(i)
-            i += 1
+            continue
+
+        joined.append(lines[i])
+        joined_tokens.append(stream.tokens[i])
+        mapping.append(i)
+        starts.append(i)
+        i += 1
 
     # Splitting multi-line function declarations into individual lines
-    split_lines, split_mapping, split_startlines = [], [], []
+    split_lines, split_tokens, split_mapping, split_startlines = [], [], [], []
 
-    for line, idx, start in zip(joined, mapping, starts):
+    for line, tokens, idx, start in zip(joined, joined_tokens, mapping, starts):
         # delete commments to prevent splitting issues
-        line_clean = re.sub(r'/\*.*?\*/', '', line).strip()
+        line_clean, tokens = remove_comment_tokens(line, tokens, inline_only=True)
 
         # splitting only if there is a '}' + optional comment + new function head
-        parts = re.split( # match "int sub(", "void foo(", etc.
-            r'}\s*(?=(?:/\*.*?\*/\s*)*[\w:~]+\s+[\w:~]+\s*\()',  
-            line_clean
-        )
-        # filling the split parts with the closing brace, only if it is not the last part
-        for j, part in enumerate(parts):
-            if j < len(parts) - 1:
-                part += '}'
-            part = part.strip()
+        # (like "int sub(", "void foo(", etc.), keeping the '}' in the first part
+        cuts = [0]
+        for kind, brace, _ in tokens:
+            if kind == '}' and SPLIT_HEAD_REGEX.match(line_clean, brace + 1):
+                cuts.append(brace + 1)
+        if len(cuts) == 1:
+            if not line_clean:
+                continue
+            split_lines.append(line_clean)
+            split_tokens.append(tokens)
+            split_mapping.append(idx)
+            split_startlines.append(start)
+            continue
+        cuts.append(len(line_clean))
+        for cut_start, cut_end in zip(cuts, cuts[1:]):
+            part, part_tokens = strip_tokens(
+                line_clean[cut_start:cut_end],
+                [(kind, token_start - cut_start, token_end - cut_start)
+                 for kind, token_start, token_end in tokens
+                 if cut_start <= token_start < cut_end])
             if part:
                 split_lines.append(part)
+                split_tokens.append(part_tokens)
                 split_mapping.append(idx)
                 split_startlines.append(start)
 
-    final_lines, final_mapping, final_startlines = [], [], []
-
-    for line, idx, start in zip(split_lines, split_mapping, split_startlines):
-        # delete comments to prevent splitting issues
-        line_clean = re.sub(r'/\*.*?\*/', '', line).strip()
-
-        # always split if there is a '}' + '{' + return in the line
-        if line_clean.count('{') == 1 and line_clean.count('}') == 1:
-            head, body = line.split('{', 1)
-            body = body.strip()
-            if body.endswith('}'):
-                body_content = body[:-1].strip()
+    final_lines, final_tokens, final_mapping, final_startlines = [], [], [], []
+
+    for line, tokens, idx, start in zip(split_lines, split_tokens, split_mapping, split_startlines):
+        # always split if there is a '}' + '{' + return in the line (behind comments)
+        if [kind for kind, _, _ in tokens if kind in ('{', '}')] == ['{', '}']:
+            code, code_tokens = remove_comment_tokens(line, tokens)
+            open_brace = [kind for kind, _, _ in code_tokens].index('{')
+            opening, closing = code_tokens[open_brace], code_tokens[-1]
+            if closing[0] == '}' and closing[2] == len(code):
+                head, head_tokens = strip_tokens(code[:opening[1]], code_tokens[:open_brace])
+                body_content, body_tokens = strip_tokens(
+                    code[opening[2]:closing[1]],
+                    [(kind, token_start - opening[2], token_end - opening[2])
+                     for kind, token_start, token_end in code_tokens[open_brace + 1:-1]])
 
                 # check if body_content is empty or contains 'return' or ';'
                 if (not body_content) or ('return' in body_content) or (';' in body_content):
-                    final_lines.append(f"{head.strip()} {{")
+                    final_lines.append(f"{head} {{")
+                    final_tokens.append(head_tokens + [('{', len(head) + 1, len(head) + 2)])
                     final_mapping.append(idx)
                     final_startlines.append(start)
                     final_lines.append(f"{body_content} }}")
+                    final_tokens.append(body_tokens + [
+                        ('}', len(body_content) + 1, len(body_content) + 2)])
                     final_mapping.append(idx)
                     final_startlines.append(start)
                     continue
 
         final_lines.append(line)
+        final_tokens.append(tokens)
         final_mapping.append(idx)
         final_startlines.append(start)
 
-    return final_lines, final_mapping, final_startlines
+    return final_lines, final_mapping, final_startlines, final_tokens
+
+
+def is_block_comment(lines, start, end, classes=None):
+    """
+    Checking if all lines from start to end are part of a /* */ comment block.
+    classes: line classes of lines (see classify_lines)
+    """
+    classes = classes if classes is not None else LineClasses(lines)
+    return all(classes[j] == BLOCK_COMMENT for j in range(start, end+1))
+
+def get_block_comments(lines, multiline_comments, classes=None):
+    """
+    Selecting the pure /* */ comment blocks out of multiline_comments,
+    the only ones extract_comment_for_function takes into account.
+    Returns the block comments and their (sorted) end lines.
+    """
+    block_comments = [comment for comment in multiline_comments
+                      if is_block_comment(lines, comment[0], comment[1], classes)]
+    return block_comments, [end for _, end, _ in block_comments]
 
+def get_block_comment_above(block_comments, block_comment_ends, orig_idx):
+    """
+    Returning the last block comment ending above orig_idx as single-element list
+    (empty, if there is none). Overloaded to extract_comment_for_function, the
+    result is the same as for all multiline comments, without scanning them.
+    """
+    idx = bisect_left(block_comment_ends, orig_idx)
+    return block_comments[idx-1:idx]
 
-def extract_comment_for_function(lines, orig_idx, multiline_comments):
+def extract_comment_for_function(lines, orig_idx, multiline_comments, classes=None):
     """
     Extracts the comment directly above the function at orig_idx.
+    classes: line classes of lines (see classify_lines)
     """
+    classes = classes if classes is not None else LineClasses(lines)
+
     # Check for Multiline-Blockcomments
     comment = ''
     for start, end, ctext in reversed(multiline_comments):
-        if (end < orig_idx and
-            all(lines[j].strip().startswith('/*') or
-                lines[j].strip().startswith('*') for j in range(start, end+1))):
+        if end < orig_idx and is_block_comment(lines, start, end, classes):
             # ensuring, that the comment block is directly above the function
-            if all(
-                not lines[j].strip() or
-                lines[j].lstrip().startswith('#') for j in range(end+1, orig_idx)
-                ):
+            if all(classes[j] in (BLANK, PREPROCESSOR) for j in range(end+1, orig_idx)):
                 comment = ctext
             break
 
@@ -443,15 +586,15 @@ def extract_comment_for_function(lines, orig_idx, multiline_comments):
         collected = []
         j = orig_idx - 1
         while j >= 0:
-            stripped = lines[j].strip()
-            if not stripped:
+            line_class = classes[j]
+            if line_class == BLANK:
                 # If there is an empty line -> BREAK
                 break
-            if stripped.startswith('#'):
+            if line_class == PREPROCESSOR:
                 j -= 1
                 continue
-            if stripped.startswith('//'):
-                collected.append(stripped)
+            if line_class == LINE_COMMENT:
+                collected.append(lines[j].strip())
                 j -= 1
             else:
                 # Somthing else then // found -> BREAK
@@ -461,15 +604,35 @@ def extract_comment_for_function(lines, orig_idx, multiline_comments):
             comment = "\n".join(collected)
     return comment
 
+def is_doxygen_comment(comment):
+    """
+    Checking if the given comment is a Doxygen-style comment
+    """
+    return comment.startswith('/**') or '@brief' in comment
+
 def is_in_comment_block(line_idx, comments):
     """
     Checking if the given line is part of a comment block
+    comments: list of (start, end, text) or a CommentIndex out of it
     """
+    if hasattr(comments, "contains"):
+        return comments.contains(line_idx)
+
     for start, end, _ in comments:
         if start <= line_idx <= end:
             return True
     return False
 
+def find_joined_line(final_startlines, line_idx, original_lines_count):
+    """
+    Returning the index of the joined line containing the original line line_idx,
+    or None if line_idx is out of range.
+    """
+    if not 0 <= line_idx < original_lines_count:
+        return None
+    idx = bisect_right(final_startlines, line_idx) - 1
+    return idx if idx >= 0 else None
+
 def sync_multiline_comments_to_joined_lines(multiline_comments,
                                             original_lines_count, final_startlines):
     """
@@ -487,26 +650,9 @@ def sync_multiline_comments_to_joined_lines(multiline_comments,
     # A comment can span multiple lines, it is sufficient to map the start index.
     for c_start, c_end, c_text in multiline_comments:
         # Seaching for the start and end index in final_startlines
-        # final_startlines is a list of start lines for each joined line.
-
-        start_idx_in_joined = None
-        end_idx_in_joined = None
-
-        for i in range(len(final_startlines)):
-            start_line = final_startlines[i]
-            next_start_line = (
-                final_startlines[i+1]
-                if i+1 < len(final_startlines)
-                else original_lines_count
-            )
-
-            if start_line <= c_start < next_start_line:
-                start_idx_in_joined = i
-            if start_line <= c_end < next_start_line:
-                end_idx_in_joined = i
-            # If both is found, abort
-            if start_idx_in_joined is not None and end_idx_in_joined is not None:
-                break
+        # final_startlines is a sorted list of start lines for each joined line.
+        start_idx_in_joined = find_joined_line(final_startlines, c_start, original_lines_count)
+        end_idx_in_joined = find_joined_line(final_startlines, c_end, original_lines_count)
 
         # if not found, we try to find the closest match
         if start_idx_in_joined is None:
@@ -518,7 +664,8 @@ def sync_multiline_comments_to_joined_lines(multiline_comments,
 
     return synced_comments
 
-def extract_functions_from_string(content: str, file_path: str = "<memory>"):
+def extract_functions_from_string(content: str, file_path: str = "<memory>",
+                                  chunk_lines: int = 0, workers: int = None):
     """
     Extracting functions from the given content string.
     For each function we determine:
@@ -530,15 +677,95 @@ def extract_functions_from_string(content: str, file_path: str = "<memory>"):
     - Whether the comment is a Doxygen-style comment
     - The file name (or path) where the function is defined
     ignores Control-Statements like if, else, for, while, switch, case and template lines.
+    A content with more than chunk_lines lines (0: never) is split into chunks of about
+    chunk_lines lines (see find_chunk_bounds), which are parsed in parallel by up to
+    workers processes (default: number of CPU cores). The result is the same.
     """
     lines = content.splitlines()
+    if chunk_lines and len(lines) > chunk_lines:
+        workers = workers or os.cpu_count() or 1
+        bounds = find_chunk_bounds(lines, -(-len(lines) // chunk_lines))
+        if workers > 1 and len(bounds) > 2:
+            return extract_functions_from_chunks(lines, bounds, file_path, workers)
+
+    functions, _, _ = extract_functions_from_lines(lines, file_path)
+    return functions
+
+def find_chunk_bounds(lines, count):
+    """
+    Returning the line indices [0, ..., len(lines)], at which lines are split into
+    (at most) count chunks of about equal size, which are parsed independently.
+    A chunk starts at an empty line after a line "}" (or "};") outside of comments
+    and raw strings (see clean_lines), so neither a token, a joined function
+    declaration nor the look-ahead for "{" crosses a boundary.
+    """
+    bounds = [0]
+    chunk_size = len(lines) / count
+    _, states = clean_lines(lines)
+    for i in range(len(lines) - 1):
+        if (states[i + 1] is None and lines[i].strip() in ("}", "};")
+                and not lines[i + 1].strip()
+                and i + 1 >= len(bounds) * chunk_size and len(bounds) < count):
+            bounds.append(i + 1)
+    bounds.append(len(lines))
+    return bounds
+
+def extract_functions_from_chunks(lines, bounds, file_path, workers):
+    """
+    Parsing the chunks of lines (see find_chunk_bounds) within worker processes and
+    stitching the results together: the template state of a template line, which
+    is still pending at the end of a chunk, is applied to the first function of the
+    next chunk and the count of overloaded definitions is counted over all chunks.
+    The workers trace with the tracers enabled in this process.
+    """
+    if trace.info:
+        trace.log("📦 Parsing %s in %d chunks", file_path, len(bounds) - 1)
+    # the trace settings of this process are not inherited by spawned workers
+    with ProcessPoolExecutor(max_workers=min(workers, len(bounds) - 1), initializer=enable_tracing,
+                             initargs=(get_trace_spec(),)) as executor:
+        results = executor.map(
+            extract_functions_from_lines,
+            [lines[start:end] for start, end in zip(bounds, bounds[1:])],
+            repeat(file_path), bounds[:-1])
+
+        functions, definition_counts = [], {}
+        template_state = (None, None)
+        for chunk_functions, end_state, inherited in results:
+            if inherited:
+                if not chunk_functions:
+                    end_state = template_state
+                elif template_state[0]:
+                    chunk_functions[0]["isTemplate"] = True
+                    chunk_functions[0]["templateParams"] = template_state[1]
+            template_state = end_state
+
+            for func in chunk_functions:
+                count = definition_counts.get((func["name"], func["params"]), 0) + 1
+                definition_counts[(func["name"], func["params"])] = count
+                func["count"] = count
+                functions.append(func)
+    return functions
+
+def extract_functions_from_lines(lines, file_path="<memory>", line_offset=0):
+    """
+    Extracting the functions out of lines (see extract_functions_from_string),
+    startLine is shifted by line_offset (lines is a chunk of a larger content).
+    Returns (functions, template state (template line, parameters) pending at the end,
+    whether the template state of the first function (or of the end) is the initial one).
+    """
     functions = []
+    inherited = True
+
+    # one token stream and the line classes of lines for all stages
+    stream = TokenStream(lines)
+    classes = classify_lines(lines)
 
     # Gathering Blockcomments in single-lines
-    multiline_comments = extract_multiline_comments(lines)
+    multiline_comments = extract_multiline_comments(lines, stream)
 
     # Gatehring multiline function declarations together
-    joined_lines, _, final_startlines = join_multiline_function_declarations(lines)
+    joined_lines, _, final_startlines, joined_tokens = join_declaration_tokens(
+        lines, stream, classes)
 
     # syncing multiline_comments to joined_lines Index and popping out single-liner
     synced_multiline_comments = sync_multiline_comments_to_joined_lines(
@@ -547,69 +774,58 @@ def extract_functions_from_string(content: str, file_path: str = "<memory>"):
     for idx, (start, end, _) in reversed(list(enumerate(synced_multiline_comments))):
         if start == end:
             synced_multiline_comments.pop(idx)
-
-    # General Function detection pattern
-    pattern = re.compile(r"""
-        ^\s*
-        (?P<rtype>\w[\w\s:*&<>]*?)\s*                                       # return type
-        (?P<name>(\w+::)*[\w~]+|operator\s*[\w\[\]\(\)\+\-\*/<>=!&|^%~]+)
-        \s*\(
-        (?P<params>[^()]*(?:\([^)]*\)[^()]*)*)
-        \)                                                                  # parameter list (1-level nested)
-        \s*(?P<const>const)?                                                # optional const       
-        \s*(\{)?\s*$                                                        # optional '{' at the end or in next line
-        """, re.VERBOSE)
-
-    # Constructor/Destructor detection pattern
-    ctor_pattern = re.compile(r"""
-        ^\s*(?P<name>(\w+::)?~?\w+)\s*              # Const-/Destructor name
-        \((?P<params>[^)]*)\)\s*                    # Parameter
-        (?:\s*:\s*(?P<initlist>[^{}]*))?            # opt.: Initialisation list
-        (?P<const>const)?\s*                        # opt.: const
-        \{                                          # Opening Braces
-        """, re.VERBOSE)
+    comment_index = CommentIndex.from_comments(synced_multiline_comments)
+    block_comments, block_comment_ends = get_block_comments(lines, multiline_comments, classes)
 
     control_keywords = ('if', 'else', 'for', 'while', 'switch', 'case')
+    control_pattern = re.compile(rf"^\s*(?:{'|'.join(control_keywords)})\b")
 
     template_line, template_params = None, None
+    # number of definitions per (name, params), e.g. in #if/#else statements
+    definition_counts = {}
 
     for idx, line in enumerate(joined_lines):
-        # First check, if Parser is within multiline comment and skip this line
-        if is_in_comment_block(idx, synced_multiline_comments):
+        # First check, if Parser is within multiline comment or raw string and skip this line
+        if is_in_comment_block(idx, comment_index):
+            continue
+        state = stream.states[final_startlines[idx]]
+        if state is not None and state[0] == STRING:
             continue
 
+        # Delete blockkoments and inline-comments (/* ... */) (// ...)
+        line, tokens = remove_comment_tokens(line, joined_tokens[idx])
+
         # masking complex functionpattern and saving
         # the original template for later use
         # first mask complex patterns
-        masked_line, tpl_map = mask_templates(line)
+        masked_line, tpl_map = mask_templates(line, tokens)
 
         # skip templates
         if masked_line.startswith('template'):
+            if not functions:
+                inherited = False
             template_line = masked_line.strip()
             match_tpl = re.match(r'^template\s+(__TPL\d+__)', template_line)
             if match_tpl:
                 template_params = match_tpl.group(1).strip()
                 # demasking Function pattern back to original template
-                for key, val in tpl_map.items():
-                    if template_params:
-                        template_params = template_params.replace(key, val)
+                template_params = unmask_templates(template_params, tpl_map)
                 # if template was found
                 # extract definition to avoid retval containing "template __TPxxx__"
                 masked_line = re.sub(r'\btemplate\s+__TPL\d+__\s*', '', masked_line)
             else:
                 template_params = None
 
-        # skip control statements
-        if re.match(rf"^\s*(?:{'|'.join(control_keywords)})\b", masked_line):
+        # skip control statements and lines without a parameter list
+        if '(' not in masked_line or control_pattern.match(masked_line):
             continue
-        # Delete singelton blockkoments and inline-comments (/* ... */) (// ...)
-        masked_line = re.sub(r'/\*.*?\*/', '', masked_line)
-        masked_line = re.sub(r'//.*$', '', masked_line).rstrip()
 
-        ctor_match = ctor_pattern.match(masked_line)
+        # Constructor/Destructor detection
+        ctor_match = match_constructor_head(masked_line)
         match = None
         if not ctor_match:
-            match = pattern.match(masked_line)
+            # General Function detection (return type, name, parameters, const, '{')
+            match = match_function_head(masked_line)
 
         if not match and not ctor_match:
             continue
@@ -618,30 +834,30 @@ def extract_functions_from_string(content: str, file_path: str = "<memory>"):
             # checking in originallines, if the next line has a '{'
             next_line_idx = idx + 1
             while next_line_idx < len(joined_lines):
-                next_line = re.sub(r'/\*.*?\*/', '', joined_lines[next_line_idx]).strip()
+                next_line, _ = remove_comment_tokens(
+                    joined_lines[next_line_idx], joined_tokens[next_line_idx])
                 if next_line.startswith('{'):
                     break  # valid function call
-                elif not next_line or next_line.startswith('//') or next_line.startswith('/*'):
+                elif not next_line:
                     next_line_idx += 1  # empty line, or ignore comment
                 else:
                     match = None  # no vaild function head found
                     break
 
         if match:
-            rtype = match.group('rtype').strip()
-            name = match.group('name')
-            params = match.group('params').strip()
-            constness = bool(match.group('const'))
+            rtype = match['rtype'].strip()
+            name = match['name']
+            params = match['params'].strip()
+            constness = bool(match['const'])
         else:
             rtype = ''
-            name = ctor_match.group('name')
-            params = ctor_match.group('params').strip()
-            constness = bool(ctor_match.group('const'))
+            name = ctor_match['name']
+            params = ctor_match['params'].strip()
+            constness = bool(ctor_match['const'])
 
         # demasking Function pattern back to original template
-        for key, val in tpl_map.items():
-            rtype = rtype.replace(key, val)
-            params = params.replace(key, val)
+        rtype = unmask_templates(rtype, tpl_map)
+        params = unmask_templates(params, tpl_map)
 
         orig_idx = final_startlines[idx]
 
@@ -650,35 +866,38 @@ def extract_functions_from_string(content: str, file_path: str = "<memory>"):
 
         # seaching for comment directly above
         # Checking for Multiline-blockcomments
-        comment = extract_comment_for_function(lines, orig_idx, multiline_comments)
+        comment = extract_comment_for_function(
+            lines, orig_idx, get_block_comment_above(block_comments, block_comment_ends, orig_idx),
+            classes)
 
         # determine isDoxygenComment or not
-        is_doxygen = comment.startswith('/**') or '@brief' in comment
+        is_doxygen = is_doxygen_comment(comment)
 
         # Count up how often the function is defined (e.g. in #if/#else statements)
-        count = 1
-        for f in functions:
-            if f['name'] == name and f['params'] == params:
-                count += 1
-
-        functions.append({
-            'name': name,
-            'return_type': rtype,
-            'params': params,
-            'const': constness,
-            'comment': comment,
-            'isDoxygenComment': is_doxygen,
-            'file': file_path,
-            'startLine': orig_idx,
-            'count': count,
-            "isTemplate": is_template,
-            "templateParams": final_template_params
-        })
+        count = definition_counts.get((name, params), 0) + 1
+        definition_counts[(name, params)] = count
+
+        functions.append(FunctionRecord(
+            name=name,
+            return_type=rtype,
+            params=params,
+            const=constness,
+            comment=comment,
+            isDoxygenComment=is_doxygen,
+            file=file_path,
+            startLine=orig_idx + line_offset,
+            count=count,
+            isTemplate=is_template,
+            templateParams=final_template_params
+        ))
 
         template_line = None
         template_params = None
 
-    return functions
+    if trace.info:
+        trace.log("🔍 %s lines %d-%d: %d functions", file_path, line_offset + 1,
+                  line_offset + len(lines), len(functions))
+    return functions, (template_line, template_params), inherited
 
 def extract_functions(file_path: str):
     """
@@ -690,7 +909,7 @@ def extract_functions(file_path: str):
         content = f.read()
     return extract_functions_from_string(content, file_path)
 
-def header_comment_exists(lines, func_start):
+def header_comment_exists(lines, func_start, comment_index=None):
     """
     Checks if a valid header comment exists directly above the function.
     A header comment is:
@@ -699,10 +918,14 @@ def header_comment_exists(lines, func_start):
     - Directly attached to the function (without a blank line in between)
     - At least 2 lines long
     - Not a footer comment, which might appear after a closing curly brace
+    The comments and the braces are looked up in the comment_index of lines
+    (see CommentIndex.from_lines), which is built if not overloaded.
     """
 
     if func_start == 0:
         return False
+    if comment_index is None:
+        comment_index = CommentIndex.from_lines(lines)
 
     # start with line above the function
     i = func_start - 1
@@ -720,30 +943,27 @@ def header_comment_exists(lines, func_start):
         if stripped == "":
             break
 
-        # if a "}" is found at the END, break - because this is NOT a header comment candidadte
-        if stripped.endswith("}") or stripped.endswith("};") or stripped.endswith("}/*"):
-            break
-
-        # if a "}" is found at the BEGINNING, break
+        # if a "}" is found at the END or at the BEGINNING of the code, break
         # because this is NOT a header comment candidadte
-        if stripped.startswith("}/*") or stripped.startswith("} /*") or stripped.startswith("}"):
+        code = comment_index.strip_comments(i, lines[i]).strip()
+        if code.endswith("}") or code.endswith("};") or code.startswith("}"):
             break
 
-        candidate.insert(0, lines[i])
+        candidate.insert(0, i)
         i -= 1
 
-    block = "\n".join(candidate)
-
     # Line hould not end with an "*/" and a "}" direct in previous,
     #  → Footer-Command-Candidate found
-    if func_start >= 2 and lines[func_start - 2].strip().endswith("}"):
+    if (func_start >= 2 and
+            comment_index.strip_comments(func_start - 2, lines[func_start - 2]).rstrip().endswith("}")):
         return False
 
     # Muss mit Blockkommentar starten
-    if block.strip().startswith("/*"):
+    if candidate and starts_with_comment(lines, candidate[0], "/*", comment_index):
         # MultiLine Header-Comment Block with /* */
         return True
-    elif candidate and all(line.strip().startswith("//") for line in candidate):
+    elif candidate and all(starts_with_comment(lines, idx, "//", comment_index)
+                           for idx in candidate):
         # Check Ok for "One-Lined" header-Comment Block consisting of multiline
         # "//"
         return True
@@ -751,6 +971,16 @@ def header_comment_exists(lines, func_start):
         # Invalid Header-Comment Block
         return False
 
+def starts_with_comment(lines, line_idx, marker, comment_index):
+    """
+    Checking, if line line_idx starts with a comment, which starts with marker ("/*" or "//").
+    """
+    line = lines[line_idx]
+    col = len(line) - len(line.lstrip())
+    region = comment_index.region_at(line_idx, col)
+    return (region is not None and region[0] == (line_idx, col) and region[2] == COMMENT
+            and line.startswith(marker, col))
+
 def convert_single_line_comment_to_header(lines, func_start):
     """
     Converting an existing single-line comment block (//) directly above a function
@@ -804,14 +1034,14 @@ def convert_single_line_comment_to_header(lines, func_start):
     new_lines = pre_part + header_block + lines[i+1:]
     return new_lines
 
-def add_header_comment(lines, func_name, start_line, comment_text=None):
+def add_header_comment(lines, func_name, start_line, comment_text=None, comment_index=None):
     """
     Insert a header comment block before the function at start_line.
     Bevor and after the comment block should be exactly two empty lines.
     if there is already a valid header comment (checked with header_comment_exists()),
     nothing will be inserted.
     """
-    if header_comment_exists(lines, start_line):
+    if header_comment_exists(lines, start_line, comment_index):
         return lines  # valid header already exists.
     # Deleting empty lines at the end of the block before the function
     pre_part = lines[:start_line]
@@ -846,51 +1076,63 @@ def add_header_comment(lines, func_name, start_line, comment_text=None):
     new_lines = new_part + lines[start_line:]
     return new_lines
 
-def is_inside_multiline_comment(lines, line_index):
+def is_inside_multiline_comment(lines, line_index, comment_index=None):
     """
-    Checking, if the given line is part of a multiline comment.
-    Searching backwarts to the beginning of the file for an unparsed /* without */ 
+    Checking, if the given line is part of a multiline comment,
+    i.e. the line ends within a /* comment, which is not closed yet.
+    The comment_index of lines (see CommentIndex.from_lines) is built if not overloaded.
     """
-    up_to_line = "\n".join(lines[:line_index + 1])
-    open_blocks = up_to_line.count("/*")
-    close_blocks = up_to_line.count("*/")
-    return open_blocks > close_blocks
+    if comment_index is None:
+        comment_index = CommentIndex.from_lines(lines)
+    return comment_index.contains(line_index)
 
-def add_post_comment(lines, func_name, func_start_line):
+def add_post_comment(lines, func_name, func_start_line, brace_map=None):
     """
     Adding at the end of the function a Post-comment without empty line, basesd on func_start_line.
     Existing Inline-comments will be deleted within this line.
+    If a brace_map is overloaded, it is used to find the end line and kept in sync with lines.
     """
-    end_line = find_function_end_line(lines, func_start_line)
+    end_line = find_function_end_line(lines, func_start_line, brace_map)
     if end_line is None:
         return lines
 
     original_line = lines[end_line].rstrip()
 
     # 1. checking against multiline-comment block
-    if is_inside_multiline_comment(lines, end_line):
+    comment_index = (brace_map.comment_index if brace_map is not None
+                     else CommentIndex.from_lines(lines))
+    if is_inside_multiline_comment(lines, end_line, comment_index):
         return lines
 
+    comments = [start[1] for start, _, kind in comment_index.line_regions(end_line)
+                if kind == COMMENT and start[0] == end_line]
     # 2. Checking for // comment
-    match = re.match(r'^(.*?)(//\s*)(.*)$', original_line)
-    if match:
-        code_part = match.group(1).rstrip()
-        comment_text = match.group(3).strip()
+    if comments and original_line.startswith("//", comments[-1]):
+        code_part = original_line[:comments[-1]].rstrip()
+        comment_text = original_line[comments[-1] + 2:].strip()
         lines[end_line] = f"{code_part} /* {comment_text} */"
+        if brace_map is not None:
+            brace_map.update_line(lines, end_line)
         return lines
 
     # 3. checking for /* */ Comment
-    if re.search(r'/\*.*\*/', original_line):
+    if comments:
         return lines
 
     # 4. No comment → appending new one
     lines[end_line] = original_line + f" /* {func_name}() */"
+    if brace_map is not None:
+        brace_map.update_line(lines, end_line)
     return lines
 
-def make_file_backup(file_path, backup_base_path):
+def make_file_backup(file_path, backup_base_path, content=None, store=None):
     """
-    Creating Backup of the file im destination backup-folder.
+    Creating Backup of the file im destination backup-folder (content-addressed,
+    see BackupStore: an unchanged content is stored only once).
     If folder does not exist, a new one is created
+    If the file content is already loaded, it can be overloaded by content,
+    which avoids reading the file a second time.
+    store: BackupStore of the documentation run, a new run is started if not specified
     """
     if check_input_string_looks_like_path(backup_base_path):
         if not os.path.exists(backup_base_path):
@@ -899,10 +1141,11 @@ def make_file_backup(file_path, backup_base_path):
         print("Backup path has invalid Format!")
         return False
 
-    filename = os.path.basename(file_path)
-    backup_path = os.path.join(backup_base_path, filename + ".bak")
-    shutil.copyfile(file_path, backup_path)
-    print(f"🔄 Backup created: {backup_path}")
+    if store is None:
+        store = BackupStore(backup_base_path)
+    digest = store.add(file_path, content)
+    if trace.info:
+        trace.log("🔄 Backup created: %s (%s)", file_path, digest[:12])
     return True
 
 def check_input_string_looks_like_path(path_str: str) -> bool:
@@ -967,30 +1210,53 @@ def insert_comments(file_path, arguments):
     """
     functions = extract_functions(file_path)
 
-    with open(file_path, 'r', encoding='utf-8') as f:
-        lines = f.read().splitlines()
+    with open(file_path, 'r', encoding='utf-8', newline='') as f:
+        content = f.read()
+
+    lines = insert_comments_into_lines(content.splitlines(), functions, arguments)
+
+    # unchanged files are not written (see write_text_if_changed)
+    write_text_if_changed(file_path, "\n".join(lines) + "\n", content)
+
+    if trace.info:
+        trace.log("✅ Header and Post Comments successfully evaluated.")
+
+def insert_comments_into_lines(lines, functions, arguments, function_index=None):
+    """
+    In-memory part of insert_comments: applying Header and Post Comments
+    of all overloaded functions to lines. Returns the edited lines.
+    If a function_index is overloaded, it is kept in sync with the edited lines.
+    """
+    if function_index is None:
+        function_index = FunctionIndex(
+            functions, fallback=find_function_start_line, verify=is_function_start_line)
 
     # working bottom-up to ensure, inserting does not interact the line-indices
+    # (and the comment index of the lines above the edited ones stays valid)
+    comment_index = CommentIndex.from_lines(lines)
     for idx in range(len(functions)-1, -1, -1):
         func = functions[idx]
-        content = "\n".join(lines)
-        start_line = find_function_start_line(content, func["name"], func["params"], func["count"])
+        start_line = function_index.find(func, lines)
         if start_line == -1:
             continue  # Fucntion not found
 
-        if not func["comment"].strip() or not header_comment_exists(lines, start_line):
+        lines_count = len(lines)
+        if (not func["comment"].strip()
+                or not header_comment_exists(lines, start_line, comment_index)):
             # if no header is present - insert it
-            lines = add_header_comment(lines, func["name"], start_line)
+            lines = add_header_comment(lines, func["name"], start_line,
+                                       comment_index=comment_index)
         elif (func["comment"].strip() and func["isDoxygenComment"] is True and
               arguments["headerCommentStyle"] != "doxygen"):
             # Convert Pre-Existing doxygen Style Command back to defaultHeader-Comment
-            print(f"ℹ️ Converting Doxygen-style comment for {func['name']}")
+            if trace.info:
+                trace.log("ℹ️ Converting Doxygen-style comment for %s", func['name'])
             comment_text = convert_doxygen_to_default_comment(func["comment"])
 
             lines = remove_existing_header(lines, start_line)
-            content = "\n".join(lines)
-            start_line = find_function_start_line(
-                content, func["name"], func["params"], func["count"])
+            function_index.shift(start_line, len(lines) - lines_count)
+            start_line = function_index.find(func, lines)
+            lines_count = len(lines)
 
             # Inserting standard-comment with extracted text
             lines = add_header_comment(lines, func["name"], start_line, comment_text)
@@ -1000,27 +1266,24 @@ def insert_comments(file_path, arguments):
             while i >= 0 and lines[i].strip() == "":
                 i -= 1
             if i >= 0 and lines[i].strip().startswith("//"):
-                print(f"ℹ️ Converting single-line header comment for {func['name']}")
+                if trace.info:
+                    trace.log("ℹ️ Converting single-line header comment for %s", func['name'])
                 lines = convert_single_line_comment_to_header(lines, start_line)
             else:
-                print(
-                    f"ℹ️ for {func['name']} already exists "
-                    "an valid block-header-comment! No changes.")
-
-    # adding post-comments in natural collection
+                if trace.info:
+                    trace.log("ℹ️ for %s already exists an valid block-header-comment! "
+                              "No changes.", func['name'])
+        function_index.shift(start_line, len(lines) - lines_count)
+
+    # adding post-comments in natural collection,
+    # the braces are counted once for all functions
+    brace_map = BraceMap(lines)
     for func in functions:
-        func_name = func["name"]
-        func_params = func["params"]
-        func_count = func["count"]
-        content = "\n".join(lines)
-        start_line = find_function_start_line(content, func_name, func_params, func_count)
+        start_line = function_index.find(func, lines)
         if start_line != -1:
-            lines = add_post_comment(lines, func_name, start_line)
-
-    with open(file_path, 'w', encoding='utf-8') as f:
-        f.write("\n".join(lines) + "\n")
+            lines = add_post_comment(lines, func["name"], start_line, brace_map)
 
-    print("✅ Header and Post Comments successfully evaluated.")
+    return lines
 
 def replace_comments(file_path, functions):
     """
@@ -1028,22 +1291,41 @@ def replace_comments(file_path, functions):
     Falls kein Kommentar existiert, wird er eingefügt (mit 2 Leerzeilen Abstand).
     """
 
-    with open(file_path, 'r', encoding='utf-8') as f:
-        lines = f.read().splitlines()
+    with open(file_path, 'r', encoding='utf-8', newline='') as f:
+        content = f.read()
 
+    lines = replace_comments_in_lines(content.splitlines(), functions)
+
+    # unchanged files are not written (see write_text_if_changed)
+    write_text_if_changed(file_path, "\n".join(lines) + "\n", content)
+
+    if trace.info:
+        trace.log("✅ Alle Header-Kommentare erfolgreich ersetzt oder eingefügt.")
+
+def replace_comments_in_lines(lines, functions, function_index=None):
+    """
+    In-memory part of replace_comments: replacing/inserting the `func["doxygen"]`
+    comments within lines and updating `func["startLine"]` afterwards.
+    Returns the edited lines.
+    """
+    if function_index is None:
+        function_index = FunctionIndex(
+            functions, fallback=find_function_start_line, verify=is_function_start_line)
+
+    # bottom-up, the comment index of the lines above the edited ones stays valid
+    comment_index = CommentIndex.from_lines(lines)
     for idx in range(len(functions)-1, -1, -1):
         func = functions[idx]
-        content = "\n".join(lines)
-        start_line = find_function_start_line(content, func["name"], func["params"], func["count"])
+        start_line = function_index.find(func, lines)
         if start_line == -1:
             continue  # Funktion nicht gefunden
 
         # Lösche bestehenden Header-Kommentar, falls vorhanden
-        if header_comment_exists(lines, start_line):
+        if header_comment_exists(lines, start_line, comment_index):
+            lines_count = len(lines)
             lines = remove_existing_header(lines, start_line)
-            content = "\n".join(lines)
-            start_line = find_function_start_line(
-                content, func["name"], func["params"], func["count"])
+            function_index.shift(start_line, len(lines) - lines_count)
+            start_line = function_index.find(func, lines)
 
         # Füge neuen Kommentar ein
         comment_lines = func["doxygen"].splitlines()
@@ -1059,6 +1341,7 @@ def replace_comments(file_path, functions):
             comment_lines = [""] + comment_lines  # Eine Leerzeile VOR dem Kommentar einfügen
 
         # Jetzt fügen wir den Kommentar vor der Funktion ein
+        lines_count = len(lines)
         lines = lines[:insert_pos] + comment_lines + lines[insert_pos:]
 
         # Nach dem Kommentar nach Leerzeilen suchen und diese entfernen
@@ -1069,19 +1352,16 @@ def replace_comments(file_path, functions):
 
         # Entferne die Leerzeilen nach dem Kommentar
         lines = lines[:insert_pos_bevor] + lines[insert_pos_after:]
-
-    with open(file_path, 'w', encoding='utf-8') as f:
-        f.write("\n".join(lines) + "\n")
+        function_index.shift(start_line, len(lines) - lines_count)
 
     # UND JETZT: Start-Linien neu bestimmen!
-    content = "\n".join(lines)
     for func in functions:
-        new_start = find_function_start_line(
-            content, func["name"], func["params"], func["count"]) + 1
+        new_start = function_index.find(func, lines) + 1
         func['startLine'] = new_start
-        print(f"🔄 Funktion '{func['name']}' neue Startlinie: {new_start}")
+        if trace.info:
+            trace.log("🔄 Funktion '%s' neue Startlinie: %d", func['name'], new_start)
 
-    print("✅ Alle Header-Kommentare erfolgreich ersetzt oder eingefügt.")
+    return lines
 
 def remove_existing_header(lines, func_start_line):
     """
@@ -0,0 +1,135 @@
+# CppCodeDoc — Licensed under the GNU General Public License v3.0 (GPLv3-or-later)
+# SPDX-License-Identifier: GPLv3-or-later
+# Copyright (C) 2025 Jojo1220
+# See https://www.gnu.org/licenses/gpl-3.0.html
+
+"""
+Per-file comment index.
+Comment regions are collected once as sorted line intervals,
+so checking if a line is part of a comment is a binary search
+instead of a scan over all comments (or the whole file) per line.
+Built out of the lexer tokens of the lines (see cpp_lexer), the index also holds
+the comment and string regions with their positions, so the comment-detection
+helpers of code_parser look up, if a column of a line is code, comment or string.
+"""
+
+from bisect import bisect_left, bisect_right
+
+from formatter.cpp_lexer import tokenize, COMMENT
+
+class CommentIndex:
+    """
+    Sorted line intervals (start, end) of comment regions, both lines included.
+    regions: sorted (start, end, kind) of the comments and strings with positions
+             (line, column), end excluded (see from_lines)
+    """
+    def __init__(self, intervals=(), regions=()):
+        self.starts = []
+        self.max_ends = []
+        self.regions = list(regions)
+        self.region_starts = [start for start, _, _ in self.regions]
+
+        max_end = -1
+        for start, end in sorted(intervals):
+            max_end = max(max_end, end)
+            self.starts.append(start)
+            # overlapping intervals: the largest end up to here is kept
+            self.max_ends.append(max_end)
+
+    @classmethod
+    def from_comments(cls, comments):
+        """
+        Building the index out of (start, end, text) comment tuples
+        (see extract_multiline_comments).
+        """
+        return cls((start, end) for start, end, _ in comments)
+
+    @classmethod
+    def from_lines(cls, lines):
+        """
+        Building the index of lines in a single lexer scan over their text:
+        the line intervals are the lines ending within a /* comment
+        (see is_inside_multiline_comment), the regions are all comments and strings.
+        A region, which is not closed, ends behind the last line.
+        """
+        intervals, regions = [], []
+        line_offsets = []
+        offset = 0
+        for line in lines:
+            line_offsets.append(offset)
+            offset += len(line) + 1
+        line_offsets.append(offset)
+
+        line_idx = 0
+        for kind, start, end, _, closed in tokenize("\n".join(lines), literals_only=True):
+            while line_offsets[line_idx + 1] <= start:
+                line_idx += 1
+            end_line = line_idx
+            while line_offsets[end_line + 1] < end:
+                end_line += 1
+            start_pos = (line_idx, start - line_offsets[line_idx])
+            end_pos = (end_line, end - line_offsets[end_line]) if closed else (len(lines), 0)
+            regions.append((start_pos, end_pos, kind))
+            if kind == COMMENT and end_pos[0] > line_idx:
+                intervals.append((line_idx, end_pos[0] - 1))
+        return cls(intervals, regions)
+
+    def contains(self, line_idx):
+        """
+        Checking, if line_idx is part of a comment region.
+        """
+        idx = bisect_right(self.starts, line_idx) - 1
+        return idx >= 0 and self.max_ends[idx] >= line_idx
+
+    def region_at(self, line_idx, col):
+        """
+        Returning the comment or string region (start, end, kind) at
+        column col of line line_idx, or None if it is code.
+        """
+        pos = (line_idx, col)
+        idx = bisect_right(self.region_starts, pos) - 1
+        if idx >= 0 and self.regions[idx][1] > pos:
+            return self.regions[idx]
+        return None
+
+    def is_comment(self, line_idx, col):
+        """
+        Checking, if column col of line line_idx is within a comment.
+        """
+        region = self.region_at(line_idx, col)
+        return region is not None and region[2] == COMMENT
+
+    def line_regions(self, line_idx):
+        """
+        Returning the regions overlapping line line_idx.
+        """
+        lo = max(bisect_left(self.region_starts, (line_idx, 0)) - 1, 0)
+        hi = bisect_left(self.region_starts, (line_idx + 1, 0))
+        return [region for region in self.regions[lo:hi] if region[1] > (line_idx, 0)]
+
+    def strip_comments(self, line_idx, line):
+        """
+        Returning line line_idx without its comments (strings are kept).
+        """
+        parts = []
+        pos = 0
+        for (start_line, start_col), (end_line, end_col), kind in self.line_regions(line_idx):
+            if kind != COMMENT:
+                continue
+            start = start_col if start_line == line_idx else 0
+            parts.append(line[pos:start])
+            pos = end_col if end_line == line_idx else len(line)
+        parts.append(line[pos:])
+        return "".join(parts)
+
+    def replace_line(self, line_idx, line):
+        """
+        Has to be called after line line_idx has been edited, if the line neither
+        starts nor ends within a comment or raw string (before and after the edit).
+        """
+        lo = bisect_left(self.region_starts, (line_idx, 0))
+        hi = bisect_left(self.region_starts, (line_idx + 1, 0))
+        regions = [((line_idx, start), (line_idx, end), kind)
+                   for kind, start, end, _, _ in tokenize(line, literals_only=True)]
+        self.regions[lo:hi] = regions
+        self.region_starts[lo:hi] = [start for start, _, _ in regions]
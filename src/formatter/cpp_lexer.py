@@ -0,0 +1,210 @@
+# CppCodeDoc — Licensed under the GNU General Public License v3.0 (GPLv3-or-later)
+# SPDX-License-Identifier: GPLv3-or-later
+# Copyright (C) 2025 Jojo1220
+# See https://www.gnu.org/licenses/gpl-3.0.html
+
+"""
+Lexer of C++ code.
+The text of a file is scanned once by one compiled regex for comments,
+string/char/raw-string literals, preprocessor directives and the punctuation
+{ } ( ) < >; everything between these tokens is code. Block comments and raw
+strings may span several lines.
+The parser stages of a file (see code_parser) share one TokenStream of its lines,
+instead of scanning the raw lines each with own rules.
+"""
+
+import re
+from bisect import bisect_right
+
+COMMENT = "comment"
+STRING = "string"
+CHAR = "char"
+PREPROCESSOR = "preprocessor"
+# the kind of a punctuation token is its character
+PUNCTUATION = "{}()<>"
+
+LITERAL_PATTERN = r"""
+      (?P<line_comment>//[^\n]*)
+    | (?P<block_comment>/\*.*?(?P<block_end>\*/|\Z))
+    | (?P<string>"(?:\\[^\n]|[^"\\\n])*")
+    | (?P<char>'(?:\\[^\n]|[^'\\\n])')
+    | (?P<raw_string>\b(?:u8|u|U|L)?R"(?P<delimiter>[^()\\\s"]{0,16})\(
+                     .*?(?P<raw_end>\)(?P=delimiter)"|\Z))
+    """
+
+# the look-ahead skips all characters, at which no token can start, at once
+TOKEN_REGEX = re.compile(r"""
+    (?=[{}()<>/"'#uULR]|^)
+    (?:
+      (?P<punctuation>[{}()<>])
+    | (?P<preprocessor>^[ \t]*\#)
+    | """ + LITERAL_PATTERN + ")", re.VERBOSE | re.DOTALL | re.MULTILINE)
+
+# comments and literals only (see tokenize)
+LITERAL_REGEX = re.compile(r"""(?=[/"'uULR])(?:""" + LITERAL_PATTERN + ")",
+                           re.VERBOSE | re.DOTALL | re.MULTILINE)
+
+TOKEN_KINDS = {
+    "line_comment": COMMENT,
+    "block_comment": COMMENT,
+    "raw_string": STRING,
+    "string": STRING,
+    "char": CHAR,
+    "preprocessor": PREPROCESSOR,
+}
+
+# replacement of literals and comments within the cleaned code
+CLEANED_TEXT = {
+    COMMENT: "",
+    STRING: '""',
+    CHAR: "''",
+}
+
+def tokenize(text, literals_only=False):
+    """
+    Returning the token stream of text: (kind, start, end, state, closed) for every
+    token, the text between the tokens is code.
+    kind: COMMENT, STRING, CHAR, PREPROCESSOR (the "#" of a directive with the
+          indentation before) or the character of a punctuation token
+    state: (kind, terminator) of block comments and raw strings, which may span
+           several lines (None for all other tokens)
+    closed: False, if the token is not closed within text
+    literals_only: only the comments, strings and chars are returned
+    """
+    regex = LITERAL_REGEX if literals_only else TOKEN_REGEX
+    for match in regex.finditer(text):
+        kind = match.lastgroup
+        if kind == "punctuation":
+            yield match.group(), match.start(), match.end(), None, True
+            continue
+        state, closed = None, True
+        if kind == "block_comment":
+            state, closed = (COMMENT, "*/"), bool(match.group("block_end"))
+        elif kind == "raw_string":
+            state = (STRING, ")" + match.group("delimiter") + '"')
+            closed = bool(match.group("raw_end"))
+        yield TOKEN_KINDS[kind], match.start(), match.end(), state, closed
+
+def clean_text(text):
+    """
+    Removing strings and comments out of text (string and char literals are
+    replaced by "" and '', line breaks within tokens are kept).
+    Returns the cleaned text and the token stream.
+    """
+    parts, tokens = [], []
+    pos = 0
+    for token in tokenize(text):
+        tokens.append(token)
+        kind, start, end, _, _ = token
+        if kind not in CLEANED_TEXT:
+            continue
+        parts.append(text[pos:start])
+        parts.append(CLEANED_TEXT[kind] + "\n" * text.count("\n", start, end))
+        pos = end
+    parts.append(text[pos:])
+    return "".join(parts), tokens
+
+def clean_line(line, state=None):
+    """
+    Removing strings and comments out of a single line.
+    state: comment or raw string, which is still open at the beginning of the line
+           (None, or the end state of the previous line)
+    Returns the cleaned line and the state at the end of the line.
+    """
+    if state is not None:
+        end = line.find(state[1])
+        if end == -1:
+            return "", state
+        line = line[end + len(state[1]):]
+
+    code, tokens = clean_text(line)
+    if tokens and not tokens[-1][4]:
+        return code, tokens[-1][3]
+    return code, None
+
+def clean_lines(lines):
+    """
+    Removing strings and comments out of all lines in one pass.
+    Returns the cleaned lines and the states at the beginning of each line
+    (states[len(lines)] is the state at the end of the file).
+    """
+    text = "\n".join(lines)
+    code, tokens = clean_text(text)
+
+    states = [None] * (len(lines) + 1)
+    line_offsets = []
+    offset = 0
+    for line in lines:
+        line_offsets.append(offset)
+        offset += len(line) + 1
+
+    for _, start, end, state, closed in tokens:
+        if state is None:
+            continue
+        # all lines after the first line of the token start within the token
+        first_line = bisect_right(line_offsets, start)
+        last_line = bisect_right(line_offsets, end - 1) if closed else len(lines) + 1
+        for line_idx in range(first_line, last_line):
+            states[line_idx] = state
+
+    return code.split("\n") if lines else [], states
+
+class TokenStream:
+    """
+    Tokens of the lines of a file out of one scan of their text (see tokenize).
+    tokens[i]: the tokens within line i as (kind, start, end) with columns of the
+               line; a block comment or raw string spanning several lines has a
+               part within each of its lines
+    code_lines[i]: line i without strings and comments (see clean_text)
+    states[i]: comment or raw string still open at the beginning of line i
+               (states[len(lines)] is the state at the end of the file)
+    directives[i]: line i belongs to a preprocessor directive (continued by a
+                   backslash at the end of the line before)
+    """
+    def __init__(self, lines):
+        self.lines = lines
+        code, tokens = clean_text("\n".join(lines))
+        self.code_lines = code.split("\n") if lines else []
+        self.tokens = [[] for _ in lines]
+        self.states = [None] * (len(lines) + 1)
+        self.directives = [False] * len(lines)
+
+        # line_offsets[len(lines)] is behind the end of the text
+        line_offsets = []
+        offset = 0
+        for line in lines:
+            line_offsets.append(offset)
+            offset += len(line) + 1
+        line_offsets.append(offset)
+
+        line_idx = 0
+        for kind, start, end, state, closed in tokens:
+            while line_offsets[line_idx + 1] <= start:
+                line_idx += 1
+            offset = line_offsets[line_idx]
+            if state is None:
+                self.tokens[line_idx].append((kind, start - offset, end - offset))
+                if kind == PREPROCESSOR:
+                    self.mark_directive(line_idx)
+                continue
+
+            # all lines after the first line of the token start within the token
+            last_line = line_idx
+            while line_offsets[last_line + 1] <= end:
+                last_line += 1
+                self.states[last_line] = state
+            if not closed:
+                self.states[len(lines)] = state
+            for part_idx in range(line_idx, min(last_line + 1, len(lines))):
+                part_offset = line_offsets[part_idx]
+                self.tokens[part_idx].append((kind, max(start, part_offset) - part_offset,
+                                              min(end, line_offsets[part_idx + 1] - 1) - part_offset))
+
+    def mark_directive(self, line_idx):
+        """
+        Marking the directive starting at line_idx and its continuation lines.
+        """
+        self.directives[line_idx] = True
+        while self.lines[line_idx].endswith("\\") and line_idx + 1 < len(self.lines):
+            line_idx += 1
+            self.directives[line_idx] = True
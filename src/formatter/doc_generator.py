@@ -7,31 +7,259 @@
 generation of documentation in html or markdown format is done here.
 """
 
-from formatter.code_parser import (
-     extract_functions, insert_comments, replace_comments, make_file_backup)
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from formatter.code_parser import make_file_backup, DEFAULT_CHUNK_LINES
 from formatter.doxygen_generator import generate_doxygen_comment
+from formatter.source_document import SourceDocument
+from formatter.function_record import FunctionRecord
+from formatter.parse_cache import create_parse_cache
+from formatter.backup_store import create_backup_store, DEFAULT_KEEP_RUNS
+from formatter.scheduler import estimate_costs, schedule_files
+from streamLogger.trace import enable_tracing, get_tracer
+from streamLogger.run_profile import RunProfile, FILE, profile_span
+from utils.memo_cache import get_memo_stats, diff_memo_stats
+
+trace = get_tracer("generator")
+
+CANCELLED = "CANCELLED: Documentation run was cancelled"
 
-def generate_documentation(arguments, source_files):
+class BackupError(Exception):
     """
-    generating documentation out of source-files and arguments.
+    Raised, if the backup of a source file could not be created.
+    In this case the whole documentation run is aborted.
+    """
+
+def parse_jobs(jobs):
+    """
+    Converting a number of parallel processes (config file or --jobs) into an int.
+    jobs: 0 or "auto" selects the number of available CPU cores.
+    Raises ValueError, if jobs is no number.
+    """
+    if str(jobs).strip().lower() in ("0", "auto"):
+        return os.cpu_count() or 1
+    return max(1, int(jobs))
+
+def get_jobs(arguments):
+    """
+    Returning the number of parallel processes for the documentation run (see parse_jobs).
+    """
+    jobs = arguments.get("jobs", 1)
+    if jobs is None:
+        return 1
+    try:
+        return parse_jobs(jobs)
+    except ValueError:
+        print(f"❌ Invalid number of jobs: {jobs} - using 1")
+        return 1
+
+def process_source_file(file_path, arguments, cache=None, profile=None, backup=None):
+    """
+    Processing of a single source file: parsing, comment insertion,
+    doxygen generation and writing the file back (if not readonly).
+    If a parse cache is overloaded and the file content is unchanged since a
+    previous run, the cached result is used without parsing the file.
+    If a run profile is overloaded, the stages of the file are recorded as spans.
+    backup: BackupStore of the run, the original file is stored before it is edited
+    Returns the documented functions of the file.
+    """
+    with profile_span(profile, "file", file_path, FILE) as file_span:
+        functions = document_source_file(file_path, arguments, cache, profile, backup)
+        file_span["functions"] = len(functions)
+    return functions
+
+def document_source_file(file_path, arguments, cache=None, profile=None, backup=None):
+    """
+    Stages of process_source_file (see there).
     """
-    all_functions = []
     readonly = arguments["readonly"]
     doxygen_comments = arguments["headerCommentStyle"]
     backup_path = arguments["backup_path"]
 
-    for file_path in source_files:
-        if not readonly:
-            if backup_path is not None:
-                if not make_file_backup(file_path, backup_path):
-                    return f"ERROR while creating Backupdir: {backup_path}"
-            insert_comments(file_path, arguments)
+    with profile_span(profile, "read", file_path) as span:
+        document = SourceDocument(file_path)
+        span["bytes_read"] = os.path.getsize(file_path) if profile else 0
+
+        if not readonly and backup_path is not None:
+            if not make_file_backup(file_path, backup_path, document.content, backup):
+                raise BackupError(f"ERROR while creating Backupdir: {backup_path}")
+
+    cache_key = cache.make_key(document.content, arguments) if cache else None
+    cached = cache.get(cache_key) if cache else None
+    if cached is not None:
+        functions = [FunctionRecord(func, file=file_path) for func in cached["functions"]]
+        if cached["output"] is not None:
+            document.set_text(cached["output"])
+        save_source_document(document, profile)
+        if trace.info:
+            trace.log("♻️ %s: %d functions taken out of the parse cache", file_path, len(functions))
+        return functions
 
-        functions = extract_functions(file_path)
+    with profile_span(profile, "parse", file_path) as span:
+        functions = document.parse(int(arguments.get("parse_chunk_lines", DEFAULT_CHUNK_LINES)),
+                                   arguments.get("parse_workers"))
+        span["functions"] = len(functions)
+
+    if not readonly:
+        with profile_span(profile, "rewrite", file_path):
+            document.insert_comments(arguments)
+
+    with profile_span(profile, "doxygen", file_path) as span:
         for func in functions:
             generate_doxygen_comment(func)
-        all_functions.extend(functions)
-        if (doxygen_comments == "doxygen" or doxygen_comments == 'doxygen') and not readonly:
-            replace_comments(file_path, functions)
+        span["functions"] = len(functions)
+    if doxygen_comments == "doxygen" and not readonly:
+        with profile_span(profile, "rewrite", file_path):
+            document.replace_comments()
+
+    if cache:
+        cache.put(cache_key, {
+            # the file is set while loading, so equal contents can share one entry
+            "functions": [{key: value for key, value in func.items() if key != "file"}
+                          for func in functions],
+            "output": document.get_text() if document.modified else None,
+        })
+
+    save_source_document(document, profile)
+    if trace.info:
+        trace.log("📄 %s: %d functions documented", file_path, len(functions))
+    return functions
+
+def save_source_document(document, profile=None):
+    """
+    Writing the document back to its file (if edited), recorded as "write" stage.
+    """
+    with profile_span(profile, "write", document.file_path) as span:
+        if document.save() and profile:
+            span["bytes_written"] = os.path.getsize(document.file_path)
+
+def process_source_file_with_spans(file_path, arguments, cache=None, memory=False, backup=None):
+    """
+    Variant of process_source_file for worker processes: the spans and memoization
+    counters are recorded within the worker and returned together with the functions.
+    memory: recording the memory of the spans (see RunProfile)
+    """
+    profile = RunProfile(memory)
+    memo_stats = get_memo_stats()
+    functions = process_source_file(file_path, arguments, cache, profile, backup)
+    return functions, profile.spans, diff_memo_stats(memo_stats)
 
+def generate_documentation(arguments, source_files, errors=None, progress=None, cancel=None,
+                           profile=None, report=None, manifest=None):
+    """
+    generating documentation out of source-files and arguments.
+    Each source file is read once, parsed once and written at most once.
+    Results of unchanged files are taken out of the parse cache (see parse_cache).
+    With arguments["jobs"] > 1 the files are processed within a process pool, the most
+    expensive files first (see scheduler), the results are merged in the order of source_files.
+    Large files are parsed in parallel chunks (parse_chunk_lines) only within a serial run,
+    the workers of the pool parse each file in one pass (no nested process pools).
+    A failing file is reported by a per-file error (appended to errors as
+    (file_path, message), if a list is overloaded) and does not stop the run.
+    progress: optional callable(done, total, file_path), called after each file
+    cancel: optional event (e.g. threading.Event), checked between the files -
+            if it is set, no further file is started and CANCELLED is returned
+    profile: optional RunProfile, recording the stages of all files (see run_profile)
+    report: optional callable(functions), called with the functions of each file in the
+            order of source_files (e.g. StreamingReport.add) - the functions are not
+            collected then and the returned list stays empty
+    manifest: optional RunManifest (incremental run) - files, which are unchanged since
+              the previous run, are not processed, their stored functions are used
+    """
+    all_functions = []
+    memo_start = get_memo_stats() if profile else None
+    collect = report if report is not None else all_functions.extend
+    changed = [not (manifest and manifest.is_unchanged(file_path)) for file_path in source_files]
+    jobs = min(get_jobs(arguments), sum(changed)) if any(changed) else 1
+    cache = create_parse_cache(arguments)
+    # one backup run (journal) for all files, also within the worker processes
+    backup = create_backup_store(arguments)
+    if trace.info and manifest:
+        trace.log("⏭️ %d of %d files unchanged since the previous run",
+                  len(source_files) - sum(changed), len(source_files))
+
+    try:
+        if jobs <= 1:
+            for done, file_path in enumerate(source_files, start=1):
+                if cancel is not None and cancel.is_set():
+                    return CANCELLED
+                try:
+                    if changed[done - 1]:
+                        start = time.perf_counter()
+                        functions = process_source_file(
+                            file_path, arguments, cache, profile, backup)
+                        if manifest:
+                            manifest.update(file_path, functions, time.perf_counter() - start)
+                    else:
+                        functions = manifest.get_functions(file_path)
+                    collect(functions)
+                except BackupError as e:
+                    return str(e)
+                except Exception as e:
+                    report_file_error(file_path, e, errors)
+                if progress:
+                    progress(done, len(source_files), file_path)
+        else:
+            # the trace settings of the main process are not inherited by spawned workers
+            with ProcessPoolExecutor(max_workers=jobs, initializer=enable_tracing,
+                                     initargs=(arguments.get("trace"),)) as executor:
+                # unchanged files are not submitted (future None), the spans of the
+                # workers are also used for the timings of the manifest
+                futures = [None] * len(source_files)
+                # the CPU cores are already used by the pool, so large files are
+                # parsed without a nested pool of chunk workers within each worker
+                worker_arguments = dict(arguments, parse_workers=1)
+                costs = estimate_costs(source_files, manifest)
+                for index in schedule_files(costs):
+                    if changed[index]:
+                        futures[index] = executor.submit(
+                            process_source_file_with_spans, source_files[index], worker_arguments,
+                            cache, bool(profile and profile.memory), backup)
+
+                for done, file_path in enumerate(source_files, start=1):
+                    # the result is released after merging (bounded memory with report)
+                    future, futures[done - 1] = futures[done - 1], None
+                    if cancel is not None and cancel.is_set():
+                        # files already running are finished, pending files are not started
+                        executor.shutdown(cancel_futures=True)
+                        return CANCELLED
+                    try:
+                        if future is None:
+                            functions = manifest.get_functions(file_path)
+                        else:
+                            functions, spans, memo_stats = future.result()
+                            if profile:
+                                profile.extend(spans)
+                                profile.add_memo_stats(memo_stats)
+                            if manifest:
+                                manifest.update(file_path, functions, next(
+                                    span["wall"] for span in spans if span["category"] == FILE))
+                        collect(functions)
+                    except BackupError as e:
+                        executor.shutdown(cancel_futures=True)
+                        return str(e)
+                    except Exception as e:
+                        report_file_error(file_path, e, errors)
+                    if progress:
+                        progress(done, len(source_files), file_path)
+    finally:
+        # also after a cancelled or aborted run
+        if cache:
+            cache.evict()
+        if backup:
+            backup.prune(int(arguments.get("backup_keep_runs", DEFAULT_KEEP_RUNS)))
+        if profile:
+            # counters of the files processed within this process
+            profile.add_memo_stats(diff_memo_stats(memo_start))
     return all_functions
+
+def report_file_error(file_path, error, errors=None):
+    """
+    Reporting an error, which occurred while processing a single file.
+    """
+    message = f"{type(error).__name__}: {error}"
+    print(f"❌ Error while processing '{file_path}': {message}")
+    if errors is not None:
+        errors.append((file_path, message))
@@ -9,6 +9,8 @@ Doxygen generator helping function modules.
 
 import re
 
+from utils.memo_cache import memoize
+
 def extract_brief_and_tags(body_lines):
     """
     extracting brief description and tags out of
@@ -123,10 +125,12 @@ def extract_brief_and_tags(body_lines):
 
     return brief_text, param_docs, return_doc, notes_text, tparam_docs, other_tags
 
+@memoize(copy=list)
 def split_function_params(param_str):
     """
     Splits function parameters, avoiding splits inside of 
     nested parentheses, angle brackets, and square brackets.
+    Returns a new list on every call (the cache keeps a tuple, see memoize).
     """
     params = []
     current = ""
@@ -153,8 +157,9 @@ def split_function_params(param_str):
 
     if current.strip():
         params.append(current.strip())
-    return params
+    return tuple(params)
 
+@memoize()
 def extract_func_ptr_info(p):
     """
     Extrahiert den Namen des Funktionszeiger-Parameters sowie dessen interne Signatur.
@@ -166,6 +171,7 @@ def extract_func_ptr_info(p):
         return match.group(2), match.group(3)  # param_name, internal_signature
     return None, None
 
+@memoize()
 def extract_param_name(p):
     """
     Extrahiert den Namen des Parameters, auch bei Zeigern und Referenzen.
@@ -0,0 +1,273 @@
+# CppCodeDoc — Licensed under the GNU General Public License v3.0 (GPLv3-or-later)
+# SPDX-License-Identifier: GPLv3-or-later
+# Copyright (C) 2025 Jojo1220
+# See https://www.gnu.org/licenses/gpl-3.0.html
+
+r"""
+Linear-time function head matcher.
+Hand-written replacement of the former function detection regex (match_function_head)
+
+    ^\s*(?P<rtype>\w[\w\s:*&<>]*?)\s*
+    (?P<name>(\w+::)*[\w~]+|operator\s*[\w\[\]\(\)\+\-\*/<>=!&|^%~]+)
+    \s*\((?P<params>[^()]*(?:\([^)]*\)[^()]*)*)\)
+    \s*(?P<const>const)?\s*(\{)?\s*$
+
+and constructor/destructor detection regex (match_constructor_head)
+
+    ^\s*(?P<name>(\w+::)?~?\w+)\s*\((?P<params>[^)]*)\)\s*
+    (?:\s*:\s*(?P<initlist>[^{}]*))?(?P<const>const)?\s*\{
+
+with the same results, but without backtracking: all lookups are prepared
+in one pass over the line, so the cost is linear in the line length,
+also for long macro-expanded or minified lines.
+"""
+
+import re
+
+BRACE_REGEX = re.compile(r"[{}]")
+
+OPERATOR = "operator"
+OPERATOR_CHARS = set("[]()+-*/<>=!&|^%~")
+RTYPE_CHARS = set(":*&<>")
+
+def is_word_char(char):
+    """
+    Checking for a regex word character (\\w).
+    """
+    return char.isalnum() or char == "_"
+
+def match_function_head(line):
+    """
+    Matching a function head (return type, name, parameters, const, optional '{').
+    Returns a dict with rtype, name, params and const (like the groups of the
+    former regex, const is "const" or None), or None if the line is no function head.
+    """
+    length = len(line)
+    start = skip_spaces(line, 0)
+    if start >= length or not is_word_char(line[start]):
+        return None
+
+    head = FunctionHeadLine(line)
+
+    # the return type is matched lazily: the shortest one with a matching remainder wins
+    end = start + 1
+    while True:
+        name_start = head.next_non_space[end]
+        match = head.match_name(name_start)
+        if match is not None:
+            name_end, open_paren, close_paren, const = match
+            return {
+                "rtype": line[start:end],
+                "name": line[name_start:name_end],
+                "params": line[open_paren + 1:close_paren],
+                "const": const,
+            }
+        if end >= length or not (is_word_char(line[end]) or line[end].isspace()
+                                 or line[end] in RTYPE_CHARS):
+            return None
+        end += 1
+
+def match_constructor_head(line):
+    """
+    Matching a constructor/destructor head (name, parameters, optional initialisation
+    list or const, '{'). Only the start of line has to match.
+    Returns a dict with name, params and const, or None.
+    """
+    length = len(line)
+    start = skip_spaces(line, 0)
+
+    # (\w+::)? is tried first, then the name without class prefix
+    name_starts = [start]
+    prefix_end = skip_word_chars(line, start)
+    if prefix_end > start and line.startswith("::", prefix_end):
+        name_starts.insert(0, prefix_end + 2)
+
+    for name_start in name_starts:
+        pos = name_start + 1 if line.startswith("~", name_start) else name_start
+        name_end = skip_word_chars(line, pos)
+        if name_end == pos:
+            continue
+        open_paren = skip_spaces(line, name_end)
+        if open_paren >= length or line[open_paren] != "(":
+            continue
+        close_paren = line.find(")", open_paren + 1)
+        if close_paren == -1:
+            continue
+
+        pos = skip_spaces(line, close_paren + 1)
+        const = None
+        if line.startswith(":", pos):
+            # initialisation list: everything up to the opening brace
+            brace = BRACE_REGEX.search(line, pos + 1)
+            if brace is None or brace.group() != "{":
+                continue
+        else:
+            if line.startswith("const", pos):
+                const = "const"
+                pos = skip_spaces(line, pos + 5)
+            if not line.startswith("{", pos):
+                continue
+
+        return {
+            "name": line[start:name_end],
+            "params": line[open_paren + 1:close_paren],
+            "const": const,
+        }
+    return None
+
+def skip_spaces(line, pos):
+    """
+    Returning the first position at or after pos, which is no whitespace.
+    """
+    while pos < len(line) and line[pos].isspace():
+        pos += 1
+    return pos
+
+def skip_word_chars(line, pos):
+    """
+    Returning the first position at or after pos, which is no word character.
+    """
+    while pos < len(line) and is_word_char(line[pos]):
+        pos += 1
+    return pos
+
+class FunctionHeadLine:
+    """
+    Lookup tables of a single line, built in one pass from right to left.
+    next_non_space[i]: first position >= i, which is no whitespace
+    name_end[i]: end of the run of [\\w~:] characters containing i
+    qualified_name[i]: line[i:name_end[i]] is a (\\w+::)*[\\w~]+ name
+    operator_end[i]: end of the run of operator characters containing i
+    params_end[i]: closing ")" of a parameter list starting at i (or None)
+    """
+    def __init__(self, line):
+        self.line = line
+        length = len(line)
+
+        self.next_non_space = [length] * (length + 1)
+        self.name_end = list(range(length + 1))
+        self.qualified_name = [False] * (length + 1)
+        self.operator_end = list(range(length + 1))
+        self.params_end = [None] * (length + 1)
+        # best operator end per run of operator characters (see find_operator_end)
+        self.operator_matches = {}
+
+        next_close = None
+        # first colon / first non word character at or after i within the current name run
+        next_colon = next_non_word = None
+        for i in range(length - 1, -1, -1):
+            char = line[i]
+            word = is_word_char(char)
+
+            if char.isspace():
+                self.next_non_space[i] = self.next_non_space[i + 1]
+            else:
+                self.next_non_space[i] = i
+
+            if word or char in "~:":
+                self.name_end[i] = self.name_end[i + 1]
+                if not word:
+                    next_non_word = i
+                    if char == ":":
+                        next_colon = i
+                if next_colon is None:
+                    # [\w~]+
+                    self.qualified_name[i] = True
+                elif word and line.startswith("::", next_non_word):
+                    # \w+:: followed by a qualified name again
+                    self.qualified_name[i] = self.qualified_name[next_non_word + 2]
+            else:
+                next_colon = next_non_word = None
+
+            if word or char in OPERATOR_CHARS:
+                self.operator_end[i] = self.operator_end[i + 1]
+
+            # [^()]*(?:\([^)]*\)[^()]*)*\) - a "(" is closed by the next ")"
+            if char == ")":
+                next_close = i
+                self.params_end[i] = i
+            elif char == "(":
+                self.params_end[i] = (self.params_end[next_close + 1]
+                                      if next_close is not None else None)
+            else:
+                self.params_end[i] = self.params_end[i + 1]
+
+    def match_name(self, pos):
+        """
+        Matching the name at pos including the remainder of the head.
+        Returns (name_end, open_paren, close_paren, const) or None.
+        """
+        line = self.line
+        if pos >= len(line):
+            return None
+
+        # no name character may follow the name, so it has to cover the whole name run
+        if self.qualified_name[pos]:
+            name_end = self.name_end[pos]
+            remainder = self.match_remainder(name_end)
+            if remainder is not None:
+                return (name_end,) + remainder
+
+        if not line.startswith(OPERATOR, pos):
+            return None
+        return self.match_operator(self.next_non_space[pos + len(OPERATOR)])
+
+    def match_operator(self, pos):
+        """
+        Matching the operator characters starting at pos, the longest
+        operator with a matching remainder wins (greedy).
+        Returns (operator_end, open_paren, close_paren, const) or None.
+        """
+        run_end = self.operator_end[pos]
+        if run_end <= pos:
+            return None
+
+        if run_end not in self.operator_matches:
+            self.operator_matches[run_end] = self.find_operator_end(run_end)
+        match = self.operator_matches[run_end]
+        # the best end of the run is the best end for all positions before it
+        if match is None or match[0] <= pos:
+            return None
+        return match
+
+    def find_operator_end(self, run_end):
+        """
+        Searching the last end within the run of operator characters ending at
+        run_end, which is followed by a matching remainder. Within the run, only
+        ends directly followed by "(" are possible.
+        Returns (operator_end, open_paren, close_paren, const) or None.
+        """
+        run_start = run_end
+        while run_start > 0 and self.operator_end[run_start - 1] == run_end:
+            run_start -= 1
+
+        for operator_end in range(run_end, run_start, -1):
+            if operator_end == run_end or self.line[operator_end] == "(":
+                remainder = self.match_remainder(operator_end)
+                if remainder is not None:
+                    return (operator_end,) + remainder
+        return None
+
+    def match_remainder(self, name_end):
+        """
+        Matching \\s*\\( parameters \\) const { after a name ending at name_end.
+        Returns (open_paren, close_paren, const) or None.
+        """
+        line = self.line
+        open_paren = self.next_non_space[name_end]
+        if open_paren >= len(line) or line[open_paren] != "(":
+            return None
+        close_paren = self.params_end[open_paren + 1]
+        if close_paren is None:
+            return None
+
+        pos = self.next_non_space[close_paren + 1]
+        const = None
+        if line.startswith("const", pos):
+            const = "const"
+            pos = self.next_non_space[pos + 5]
+        if pos < len(line) and line[pos] == "{":
+            pos = self.next_non_space[pos + 1]
+        if pos < len(line):
+            return None
+        return open_paren, close_paren, const
@@ -0,0 +1,76 @@
+# CppCodeDoc — Licensed under the GNU General Public License v3.0 (GPLv3-or-later)
+# SPDX-License-Identifier: GPLv3-or-later
+# Copyright (C) 2025 Jojo1220
+# See https://www.gnu.org/licenses/gpl-3.0.html
+
+"""
+Per-file function index.
+Keeps the start line of every extracted function, so inserting or replacing
+comments does not have to rescan the whole file for each function.
+"""
+
+class FunctionIndex:
+    """
+    Lookup table of function start lines, keyed by (name, params, count).
+    The index is built once out of the extract_functions_from_string results
+    and shifted, whenever lines are inserted or removed above a function.
+    If a function can not be resolved out of the index (e.g. record without
+    startLine, or verify(lines, start_line, func) rejects the indexed line), the
+    overloaded fallback search is used.
+    """
+    def __init__(self, functions, fallback=None, verify=None):
+        self.fallback = fallback
+        self.verify = verify
+        self.start_lines = {}
+
+        for func in functions:
+            start_line = func.get("startLine")
+            if isinstance(start_line, int) and start_line >= 0:
+                self.start_lines[self.key(func)] = start_line
+
+    @staticmethod
+    def key(func):
+        """
+        Building the unique lookup key of a function record.
+        """
+        return func["name"], func["params"], func.get("count", 1)
+
+    def get(self, func):
+        """
+        Returning the indexed start line of the function without any verification,
+        or None if the function is not part of the index.
+        """
+        return self.start_lines.get(self.key(func))
+
+    def find(self, func, lines):
+        """
+        Returning the current start line of the function within lines.
+        -1 is returned, if the function can not be found.
+        """
+        key = self.key(func)
+        start_line = self.start_lines.get(key)
+        if start_line is not None and 0 <= start_line < len(lines):
+            # plausibility check of the indexed line (name and signature)
+            if self.verify is None or self.verify(lines, start_line, func):
+                return start_line
+
+        if self.fallback is None:
+            return -1
+
+        start_line = self.fallback(
+            "\n".join(lines), func["name"], func["params"], func.get("count", 1))
+        if start_line != -1:
+            self.start_lines[key] = start_line
+        return start_line
+
+    def shift(self, from_line, delta):
+        """
+        Moving all functions starting at or below from_line by delta lines.
+        Has to be called after a header block was inserted (delta > 0)
+        or removed (delta < 0) directly above from_line.
+        """
+        if delta == 0:
+            return
+        for key, start_line in self.start_lines.items():
+            if start_line >= from_line:
+                self.start_lines[key] = start_line + delta
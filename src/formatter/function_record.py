@@ -0,0 +1,124 @@
+# CppCodeDoc — Licensed under the GNU General Public License v3.0 (GPLv3-or-later)
+# SPDX-License-Identifier: GPLv3-or-later
+# Copyright (C) 2025 Jojo1220
+# See https://www.gnu.org/licenses/gpl-3.0.html
+
+"""
+Compact record of an extracted function.
+The record stores its fields within __slots__ instead of a per-function dict
+and interns often repeated strings (file path, return type, name), but it
+keeps the dict-style access of the former function dicts:
+
+    func["name"], func.get("doxygen", ""), "doxygen" in func, func.items()
+
+A field, which was not set yet (e.g. doxygen before generate_doxygen_comment),
+is missing like a missing dict key. Records compare equal to dicts with the
+same items.
+"""
+
+import sys
+from collections.abc import MutableMapping
+
+FIELDS = (
+    "name", "return_type", "params", "const", "comment", "isDoxygenComment",
+    "file", "startLine", "count", "isTemplate", "templateParams",
+    # added by generate_doxygen_comment / calculation_of_todos
+    "doxygen", "doxygen_TODO_Analyze",
+)
+FIELD_NAMES = frozenset(FIELDS)
+
+# values repeated by many functions, a single string object is shared
+INTERNED_FIELDS = frozenset(("file", "return_type", "name"))
+
+class FunctionRecord(MutableMapping):
+    """
+    Function record with dict-style access (see module description).
+    Keys not within FIELDS are kept in an additional dict (only created if needed).
+    """
+    __slots__ = FIELDS + ("_extra",)
+
+    def __init__(self, fields=(), **kwargs):
+        self._extra = None
+        if fields:
+            items = fields.items() if hasattr(fields, "items") else fields
+            for key, value in items:
+                self[key] = value
+        for key, value in kwargs.items():
+            self[key] = value
+
+    def __getitem__(self, key):
+        if key in FIELD_NAMES:
+            try:
+                return getattr(self, key)
+            except AttributeError:
+                raise KeyError(key) from None
+        if self._extra is None:
+            raise KeyError(key)
+        return self._extra[key]
+
+    def __setitem__(self, key, value):
+        if key in FIELD_NAMES:
+            if key in INTERNED_FIELDS and type(value) is str:
+                value = sys.intern(value)
+            setattr(self, key, value)
+        else:
+            if self._extra is None:
+                self._extra = {}
+            self._extra[key] = value
+
+    def __delitem__(self, key):
+        if key in FIELD_NAMES:
+            try:
+                delattr(self, key)
+            except AttributeError:
+                raise KeyError(key) from None
+        elif self._extra is not None and key in self._extra:
+            del self._extra[key]
+        else:
+            raise KeyError(key)
+
+    def __contains__(self, key):
+        if key in FIELD_NAMES:
+            return hasattr(self, key)
+        return self._extra is not None and key in self._extra
+
+    def __iter__(self):
+        for key in FIELDS:
+            if hasattr(self, key):
+                yield key
+        if self._extra:
+            yield from self._extra
+
+    def __len__(self):
+        return sum(1 for _ in self)
+
+    def get(self, key, default=None):
+        """
+        Returning the value of key, or default if it is not set (like dict.get).
+        """
+        if key in FIELD_NAMES:
+            return getattr(self, key, default)
+        if self._extra is None:
+            return default
+        return self._extra.get(key, default)
+
+    def copy(self):
+        """
+        Returning a shallow copy of the record.
+        """
+        return FunctionRecord(self)
+
+    def to_dict(self):
+        """
+        Returning the record as plain dict (e.g. for JSON).
+        """
+        return dict(self.items())
+
+    def __getstate__(self):
+        return self.to_dict()
+
+    def __setstate__(self, state):
+        self.__init__(state)
+
+    def __repr__(self):
+        return f"FunctionRecord({self.to_dict()!r})"
@@ -0,0 +1,225 @@
+# CppCodeDoc — Licensed under the GNU General Public License v3.0 (GPLv3-or-later)
+# SPDX-License-Identifier: GPLv3-or-later
+# Copyright (C) 2025 Jojo1220
+# See https://www.gnu.org/licenses/gpl-3.0.html
+
+"""
+Bulk analysis of the lines of a file.
+The curly braces and parens of every line are counted within the cleaned code
+(strings and comments masked, see cpp_lexer) and accumulated to the brace and
+paren depth at the beginning of each line, every line is classified (blank,
+line comment, block comment, preprocessor or code) by its first characters.
+If NumPy is installed, the counters and classes of larger files are computed
+vectorized on the bytes of the whole text, otherwise (and for small files)
+by a pure Python pass. Both produce identical results. NumPy is only imported
+with the first larger file (see load_numpy), not with the start of the application.
+The parser takes the classes of classify_lines to join declarations and to find
+the comment above a function.
+"""
+
+from formatter.cpp_lexer import clean_text
+
+# NumPy module (None if not installed), set by load_numpy
+numpy = None
+numpy_loaded = False
+
+# line classes (first characters of the stripped line)
+BLANK = 0
+LINE_COMMENT = 1     # //
+BLOCK_COMMENT = 2    # /*, * or */
+PREPROCESSOR = 3     # #
+CODE = 4
+
+# files with less characters of code are analyzed without NumPy (crossover of
+# scripts/benchmark_line_analysis.py between 2 and 5 kB)
+NUMPY_MIN_CHARS = 4 * 1024
+
+# bytes removed by str.strip() (other whitespace characters are not ASCII)
+ASCII_WHITESPACE = b" \t\n\r\x0b\x0c\x1c\x1d\x1e\x1f"
+
+class LineAnalysis:
+    """
+    Result of analyze_lines for n lines:
+    openings, closings: number of "{" and "}" within the code of each line
+    depths: brace depth at the beginning of each line (depths[n] at the end of the file)
+    paren_depths: paren depth at the beginning of each line (paren_depths[n] at the end)
+    classes: line class of each line (BLANK, LINE_COMMENT, BLOCK_COMMENT, PREPROCESSOR, CODE),
+             classified on the first access (e.g. not needed by BraceMap)
+    All values are Python lists of ints.
+    """
+    def __init__(self, openings, closings, depths, paren_depths, lines, use_numpy=False):
+        self.openings = openings
+        self.closings = closings
+        self.depths = depths
+        self.paren_depths = paren_depths
+        self.lines = lines
+        self.use_numpy = use_numpy
+        self._classes = None
+
+    @property
+    def classes(self):
+        if self._classes is None:
+            self._classes = classify_lines(self.lines, self.use_numpy)
+        return self._classes
+
+    def end_line(self, start_line):
+        """
+        Returning the line of the closing curly brace of the block starting at
+        start_line (the first line with a "}", after which the depth is back at
+        the depth of start_line), or None if the block is not closed.
+        """
+        if not 0 <= start_line < len(self.closings):
+            return None
+
+        depth = self.depths[start_line]
+        for i in range(start_line, len(self.closings)):
+            if self.closings[i] and self.depths[i + 1] == depth:
+                return i
+        return None
+
+def load_numpy():
+    """
+    Returning the NumPy module, or None if it is not installed.
+    The import is attempted once, on the first call.
+    """
+    global numpy, numpy_loaded
+    if not numpy_loaded:
+        try:
+            import numpy as module
+        except ImportError:
+            module = None
+        numpy, numpy_loaded = module, True
+    return numpy
+
+def classify_line(line):
+    """
+    Returning the class of a single line.
+    """
+    stripped = line.strip()
+    if not stripped:
+        return BLANK
+    if stripped.startswith("//"):
+        return LINE_COMMENT
+    if stripped.startswith(("/*", "*")):
+        return BLOCK_COMMENT
+    if stripped.startswith("#"):
+        return PREPROCESSOR
+    return CODE
+
+class LineClasses:
+    """
+    Classes of lines, each classified on access (for a few lookups only,
+    instead of classify_lines).
+    """
+    def __init__(self, lines):
+        self.lines = lines
+
+    def __getitem__(self, line_idx):
+        return classify_line(self.lines[line_idx])
+
+def classify_lines(lines, use_numpy=None):
+    """
+    Classifying all lines (see classify_line), without counting braces.
+    use_numpy: as for analyze_lines
+    """
+    text = "\n".join(lines)
+    if use_numpy is None:
+        use_numpy = len(text) >= NUMPY_MIN_CHARS and load_numpy() is not None
+    if use_numpy and lines:
+        if load_numpy() is None:
+            raise ImportError("NumPy is not installed")
+        return classify_numpy(lines, text)
+    return [classify_line(line) for line in lines]
+
+def analyze_lines(lines, cleaned_lines=None, use_numpy=None):
+    """
+    Analyzing all lines of a file in one pass (see LineAnalysis).
+    cleaned_lines: lines without strings and comments, if already available (see clean_lines)
+    use_numpy: forcing (True) or disabling (False) the NumPy pass,
+               if not specified it is used for files of NUMPY_MIN_CHARS or more
+    """
+    if cleaned_lines is None:
+        code = clean_text("\n".join(lines))[0]
+    else:
+        code = "\n".join(cleaned_lines)
+    if use_numpy is None:
+        use_numpy = len(code) >= NUMPY_MIN_CHARS and load_numpy() is not None
+    if use_numpy and lines:
+        if load_numpy() is None:
+            raise ImportError("NumPy is not installed")
+        return analyze_numpy(lines, code)
+    return analyze_python(lines, code.split("\n") if lines else [])
+
+def analyze_python(lines, cleaned_lines):
+    """
+    Pure Python pass of analyze_lines.
+    """
+    openings, closings, depths, paren_depths = [], [], [0], [0]
+    depth = paren_depth = 0
+    for code in cleaned_lines:
+        opening, closing = code.count("{"), code.count("}")
+        depth += opening - closing
+        paren_depth += code.count("(") - code.count(")")
+
+        openings.append(opening)
+        closings.append(closing)
+        depths.append(depth)
+        paren_depths.append(paren_depth)
+    return LineAnalysis(openings, closings, depths, paren_depths, lines)
+
+def analyze_numpy(lines, code):
+    """
+    NumPy pass of analyze_lines: the characters are counted per line by the line
+    index of their positions within the UTF-8 bytes (a line break, brace or
+    paren is never part of a multi-byte character).
+    """
+    line_count = len(lines)
+    code_bytes = numpy.frombuffer(code.encode("utf-8", "surrogatepass"), dtype=numpy.uint8)
+    code_breaks = numpy.flatnonzero(code_bytes == ord("\n"))
+
+    def count_per_line(char):
+        positions = numpy.flatnonzero(code_bytes == ord(char))
+        return numpy.bincount(numpy.searchsorted(code_breaks, positions),
+                              minlength=line_count)
+
+    openings, closings = count_per_line("{"), count_per_line("}")
+    depths = numpy.concatenate(([0], numpy.cumsum(openings - closings)))
+    paren_depths = numpy.concatenate(([0], numpy.cumsum(count_per_line("(")
+                                                        - count_per_line(")"))))
+    return LineAnalysis(openings.tolist(), closings.tolist(), depths.tolist(),
+                        paren_depths.tolist(), lines, use_numpy=True)
+
+def classify_numpy(lines, text):
+    """
+    Classifying all lines by the first two bytes after the leading whitespace.
+    Lines starting with a non-ASCII character (which may be Unicode whitespace)
+    are classified by classify_line.
+    """
+    data = numpy.frombuffer(text.encode("utf-8", "surrogatepass"), dtype=numpy.uint8)
+    breaks = numpy.flatnonzero(data == ord("\n"))
+    starts = numpy.concatenate(([0], breaks + 1))
+    ends = numpy.concatenate((breaks, [len(data)]))
+
+    whitespace = numpy.zeros(256, dtype=bool)
+    whitespace[list(ASCII_WHITESPACE)] = True
+    # first non-whitespace byte of each line (blank, if it is behind the line end),
+    # the end of the text is appended as position of the last lines
+    visible = numpy.append(numpy.flatnonzero(~whitespace[data]), len(data))
+    first = visible[numpy.searchsorted(visible, starts)]
+    blank = first >= ends
+
+    padded = numpy.append(data, numpy.zeros(2, dtype=numpy.uint8))
+    first_byte = padded[first]
+    second_byte = numpy.where(first + 1 < ends, padded[first + 1], 0)
+    slash, star = first_byte == ord("/"), first_byte == ord("*")
+
+    classes = numpy.full(len(lines), CODE, dtype=numpy.int64)
+    classes[first_byte == ord("#")] = PREPROCESSOR
+    classes[star | (slash & (second_byte == ord("*")))] = BLOCK_COMMENT
+    classes[slash & (second_byte == ord("/"))] = LINE_COMMENT
+    classes[blank] = BLANK
+    classes = classes.tolist()
+
+    for i in numpy.flatnonzero(~blank & (first_byte >= 0x80)).tolist():
+        classes[i] = classify_line(lines[i])
+    return classes
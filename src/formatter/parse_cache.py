@@ -0,0 +1,133 @@
+# CppCodeDoc — Licensed under the GNU General Public License v3.0 (GPLv3-or-later)
+# SPDX-License-Identifier: GPLv3-or-later
+# Copyright (C) 2025 Jojo1220
+# See https://www.gnu.org/licenses/gpl-3.0.html
+
+"""
+Persistent parse cache.
+Results of a documentation run (function records incl. doxygen comments and the
+edited file content) are stored on disk, keyed by a hash of the file content,
+the tool/parser version and the relevant settings. Unchanged files are not
+parsed again in the next run.
+"""
+
+import os
+import json
+import hashlib
+import tempfile
+
+from utils.app_info import __version__
+
+# Has to be increased, whenever parsing/commenting results are changing
+PARSER_VERSION = "1"
+
+DEFAULT_CACHE_DIR_NAME = ".cppcodedoc_cache"
+DEFAULT_CACHE_MAX_SIZE_MB = 256
+
+class ParseCache:
+    """
+    On-disk cache, one json file per entry within cache_dir.
+    The modification time of an entry is used as last access time,
+    therefore the least recently used entries are evicted first,
+    if the total size exceeds max_size (bytes).
+    """
+    def __init__(self, cache_dir, max_size=DEFAULT_CACHE_MAX_SIZE_MB * 1024 * 1024):
+        self.cache_dir = cache_dir
+        self.max_size = max_size
+
+    @staticmethod
+    def make_key(content, arguments):
+        """
+        Building the cache key out of file content, tool/parser version
+        and all settings, which have an influence on the result.
+        """
+        digest = hashlib.sha256()
+        digest.update(f"{__version__}|{PARSER_VERSION}|".encode("utf-8"))
+        digest.update(f"{bool(arguments.get('readonly'))}|".encode("utf-8"))
+        digest.update(f"{arguments.get('headerCommentStyle')}|".encode("utf-8"))
+        digest.update(content.encode("utf-8", "surrogatepass"))
+        return digest.hexdigest()
+
+    def entry_path(self, key):
+        """
+        Returning the file path of a cache entry.
+        """
+        return os.path.join(self.cache_dir, key[:2], key + ".json")
+
+    def get(self, key):
+        """
+        Returning the cached entry of key, or None if not available.
+        A hit marks the entry as recently used.
+        """
+        path = self.entry_path(key)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                entry = json.load(f)
+            os.utime(path)
+            return entry
+        except (OSError, ValueError):
+            return None
+
+    def put(self, key, entry):
+        """
+        Storing an entry within the cache. Written atomically, so parallel
+        processes never see partly written entries.
+        """
+        path = self.entry_path(key)
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(path), suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(entry, f)
+            os.replace(tmp_path, path)
+            return True
+        except (OSError, TypeError, ValueError) as e:
+            print(f"⚠️ Parse cache entry could not be written: {e}")
+            return False
+
+    def evict(self):
+        """
+        Deleting least recently used entries, until the cache fits into max_size.
+        Returns the number of deleted entries.
+        """
+        entries, total_size = [], 0
+        for root, _, files in os.walk(self.cache_dir):
+            for file in files:
+                path = os.path.join(root, file)
+                try:
+                    stat = os.stat(path)
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, path))
+                total_size += stat.st_size
+
+        deleted = 0
+        for _, size, path in sorted(entries):
+            if total_size <= self.max_size:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            total_size -= size
+            deleted += 1
+        return deleted
+
+def create_parse_cache(arguments):
+    """
+    Creating the parse cache out of the configuration,
+    or None if caching is disabled (cache: false / --no-cache).
+    If no cache_path is specified, the cache is stored next to the output documents.
+    """
+    if not arguments.get("cache", True):
+        return None
+
+    cache_dir = arguments.get("cache_path")
+    if not cache_dir:
+        if not arguments.get("output_path"):
+            return None
+        output_dir = os.path.dirname(arguments["output_path"])
+        cache_dir = os.path.join(output_dir or ".", DEFAULT_CACHE_DIR_NAME)
+
+    max_size_mb = arguments.get("cache_max_size", DEFAULT_CACHE_MAX_SIZE_MB)
+    return ParseCache(cache_dir, int(float(max_size_mb) * 1024 * 1024))
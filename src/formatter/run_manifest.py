@@ -0,0 +1,204 @@
+# CppCodeDoc — Licensed under the GNU General Public License v3.0 (GPLv3-or-later)
+# SPDX-License-Identifier: GPLv3-or-later
+# Copyright (C) 2025 Jojo1220
+# See https://www.gnu.org/licenses/gpl-3.0.html
+
+"""
+Run manifest of incremental documentation runs.
+For every processed source file the manifest stores its modification time,
+size and content hash (after the file was written) together with the produced
+function records and the rendered report sections (see StreamingReport).
+In the next run a file with unchanged mtime and size (or unchanged hash, if
+only touched) is neither parsed nor rewritten, its stored functions and report
+sections are used instead. A changed file invalidates only its own entry.
+"""
+
+import os
+import json
+import hashlib
+import tempfile
+
+from utils.app_info import __version__
+from formatter.parse_cache import PARSER_VERSION
+from formatter.function_record import FunctionRecord
+
+# Has to be increased, whenever the layout of the manifest is changing
+MANIFEST_VERSION = "1"
+
+DEFAULT_MANIFEST_NAME = ".cppcodedoc_manifest.json"
+
+class RunManifest:
+    """
+    Manifest file of a documentation run, entries keyed by the absolute file path.
+    The whole manifest is discarded, if it was written by another tool/parser
+    version or with other settings (see make_fingerprint).
+    reset: starting with an empty manifest (full run), which is written again
+    """
+    def __init__(self, path, fingerprint, reset=False):
+        self.path = path
+        self.fingerprint = fingerprint
+        self.entries = {} if reset else self.load()
+
+    def load(self):
+        """
+        Returning the entries of the manifest file (empty if missing, invalid or outdated).
+        """
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                manifest = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        if (not isinstance(manifest, dict) or manifest.get("version") != MANIFEST_VERSION
+                or manifest.get("fingerprint") != self.fingerprint):
+            return {}
+        return manifest.get("files", {})
+
+    @staticmethod
+    def make_fingerprint(arguments):
+        """
+        Building the fingerprint of all settings, which have an influence on the result.
+        """
+        return (f"{__version__}|{PARSER_VERSION}|{bool(arguments.get('readonly'))}|"
+                f"{arguments.get('headerCommentStyle')}")
+
+    @staticmethod
+    def file_key(file_path):
+        """
+        Returning the key of a source file within the manifest.
+        """
+        return os.path.normcase(os.path.abspath(file_path))
+
+    def prune(self):
+        """
+        Removing the entries of deleted files.
+        Entries of other files are kept, also if they are not part of the current run.
+        """
+        self.entries = {key: entry for key, entry in self.entries.items() if os.path.exists(key)}
+
+    def is_unchanged(self, file_path):
+        """
+        Checking if a file is unchanged since it was stored, by mtime and size.
+        A file with changed mtime, but equal size and content hash (e.g. after
+        a checkout) is unchanged as well, its entry is updated.
+        """
+        entry = self.entries.get(self.file_key(file_path))
+        if entry is None:
+            return False
+        try:
+            stat = os.stat(file_path)
+            if stat.st_size != entry["size"]:
+                return False
+            if stat.st_mtime_ns != entry["mtime_ns"]:
+                if hash_file(file_path) != entry["sha256"]:
+                    return False
+                entry["mtime_ns"] = stat.st_mtime_ns
+        except OSError:
+            return False
+        return True
+
+    def get_functions(self, file_path):
+        """
+        Returning the stored functions of an unchanged file (see is_unchanged).
+        """
+        entry = self.entries[self.file_key(file_path)]
+        return [FunctionRecord(func, file=file_path) for func in entry["functions"]]
+
+    def update(self, file_path, functions, wall=None):
+        """
+        Storing a processed file (after it was written) with its functions.
+        wall: processing time of the file in seconds (see get_timing)
+        The report sections of a previous run are invalidated.
+        """
+        try:
+            stat = os.stat(file_path)
+            sha256 = hash_file(file_path)
+        except OSError:
+            self.entries.pop(self.file_key(file_path), None)
+            return
+        self.entries[self.file_key(file_path)] = {
+            "mtime_ns": stat.st_mtime_ns,
+            "size": stat.st_size,
+            "sha256": sha256,
+            # the file is set while loading (like within the parse cache)
+            "functions": [{key: value for key, value in func.items()
+                           if key not in ("file", "doxygen_TODO_Analyze")}
+                          for func in functions],
+        }
+        if wall is not None:
+            self.entries[self.file_key(file_path)]["wall"] = wall
+
+    def get_timing(self, file_path):
+        """
+        Returning (size, wall time) of the last processing of a file (also if it
+        was changed since), or None if no timing is stored (see scheduler).
+        """
+        entry = self.entries.get(self.file_key(file_path))
+        if entry is None or "wall" not in entry:
+            return None
+        return entry["size"], entry["wall"]
+
+    def get_sections(self, file_path, report_key):
+        """
+        Returning the stored report sections of a file as dict
+        format -> [table of content, functions], if rendered with report_key.
+        """
+        entry = self.entries.get(self.file_key(file_path))
+        if entry is None or entry.get("report_key") != report_key:
+            return None
+        return entry.get("sections")
+
+    def set_sections(self, file_path, report_key, sections):
+        """
+        Storing the rendered report sections of a file (see get_sections).
+        """
+        entry = self.entries.get(self.file_key(file_path))
+        if entry is not None:
+            entry["report_key"] = report_key
+            entry["sections"] = sections
+
+    def save(self):
+        """
+        Writing the manifest atomically (without entries of deleted files).
+        Returns True on success.
+        """
+        self.prune()
+        try:
+            directory = os.path.dirname(os.path.abspath(self.path))
+            os.makedirs(directory, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump({"version": MANIFEST_VERSION, "fingerprint": self.fingerprint,
+                           "files": self.entries}, f)
+            os.replace(tmp_path, self.path)
+            return True
+        except (OSError, TypeError, ValueError) as e:
+            print(f"⚠️ Run manifest could not be written: {e}")
+            return False
+
+def hash_file(file_path):
+    """
+    Returning the sha256 hash of the file content.
+    """
+    digest = hashlib.sha256()
+    with open(file_path, "rb") as f:
+        for block in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+def create_run_manifest(arguments, reset=False):
+    """
+    Creating the run manifest out of the configuration,
+    or None if incremental runs are disabled (incremental: false).
+    If no manifest_path is specified, the manifest is stored next to the output documents.
+    reset: ignoring the stored entries (full run, e.g. --full)
+    """
+    if not arguments.get("incremental", True):
+        return None
+
+    path = arguments.get("manifest_path")
+    if not path:
+        if not arguments.get("output_path"):
+            return None
+        output_dir = os.path.dirname(arguments["output_path"])
+        path = os.path.join(output_dir or ".", DEFAULT_MANIFEST_NAME)
+    return RunManifest(path, RunManifest.make_fingerprint(arguments), reset)
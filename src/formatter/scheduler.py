@@ -0,0 +1,57 @@
+# CppCodeDoc — Licensed under the GNU General Public License v3.0 (GPLv3-or-later)
+# SPDX-License-Identifier: GPLv3-or-later
+# Copyright (C) 2025 Jojo1220
+# See https://www.gnu.org/licenses/gpl-3.0.html
+
+"""
+Longest-first scheduling of the source files of a parallel documentation run.
+The cost of a file is estimated by the wall time of its previous processing
+(stored within the run manifest, scaled by the change of the file size) or by
+its size and the throughput of the files with stored timings. The most expensive
+files are submitted to the process pool first, each idle worker takes the next
+(smaller) file, so the remaining work is balanced and the run does not wait for
+a few huge files at its end.
+"""
+
+import os
+
+# estimated processing time per byte, if no timings of a previous run are available
+DEFAULT_SECONDS_PER_BYTE = 1e-6
+
+def get_file_size(file_path):
+    """
+    Returning the size of a file in bytes (0 if it can not be accessed).
+    """
+    try:
+        return os.path.getsize(file_path)
+    except OSError:
+        return 0
+
+def estimate_costs(source_files, manifest=None):
+    """
+    Returning the estimated processing time of each source file in seconds.
+    manifest: optional RunManifest with the timings of the previous run (see get_timing)
+    """
+    sizes = [get_file_size(file_path) for file_path in source_files]
+    timings = [manifest.get_timing(file_path) if manifest else None for file_path in source_files]
+
+    measured = [timing for timing in timings if timing is not None]
+    measured_size = sum(size for size, _ in measured)
+    seconds_per_byte = (sum(wall for _, wall in measured) / measured_size if measured_size
+                        else DEFAULT_SECONDS_PER_BYTE)
+
+    costs = []
+    for size, timing in zip(sizes, timings):
+        if timing is None:
+            costs.append(size * seconds_per_byte)
+        else:
+            old_size, wall = timing
+            costs.append(wall * size / old_size if old_size else wall)
+    return costs
+
+def schedule_files(costs):
+    """
+    Returning the indices of the files in submission order: most expensive first,
+    files with equal costs in their original order.
+    """
+    return sorted(range(len(costs)), key=lambda index: -costs[index])
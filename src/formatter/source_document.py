@@ -0,0 +1,119 @@
+# CppCodeDoc — Licensed under the GNU General Public License v3.0 (GPLv3-or-later)
+# SPDX-License-Identifier: GPLv3-or-later
+# Copyright (C) 2025 Jojo1220
+# See https://www.gnu.org/licenses/gpl-3.0.html
+
+"""
+In-memory source document.
+A source file is read once, parsed once, all comment edits are applied
+as one batch in memory and the file is written at most once (only if
+its content changed).
+"""
+
+from formatter.code_parser import (
+    extract_functions_from_string, extract_multiline_comments, extract_comment_for_function,
+    get_block_comments, get_block_comment_above, find_function_start_line,
+    is_function_start_line, is_doxygen_comment,
+    insert_comments_into_lines, replace_comments_in_lines)
+from formatter.function_index import FunctionIndex
+from formatter.line_analysis import classify_lines
+from utils.file_utils import write_text_if_changed
+
+class SourceDocument:
+    """
+    Single source file, held in memory during the documentation run.
+    content: original file content (unchanged, e.g. used for the backup)
+    lines: current, edited lines of the file
+    functions: function records, parsed once out of content (see parse)
+    """
+    def __init__(self, file_path):
+        self.file_path = file_path
+
+        # newline='' keeps the original line endings within content
+        with open(file_path, "r", encoding="utf-8", newline="") as f:
+            self.content = f.read()
+
+        self.lines = self.content.splitlines()
+        self.functions = []
+        self.function_index = None
+        self.modified = False
+
+    def parse(self, chunk_lines=0, workers=None):
+        """
+        Parsing the functions out of the document content (done once per document).
+        A document with more than chunk_lines lines is parsed in parallel chunks
+        by up to workers processes (see extract_functions_from_string).
+        Returns the function records.
+        """
+        self.functions = extract_functions_from_string(
+            self.content, self.file_path, chunk_lines, workers)
+        self.function_index = FunctionIndex(
+            self.functions, fallback=find_function_start_line, verify=is_function_start_line)
+        return self.functions
+
+    def set_text(self, text):
+        """
+        Replacing the current lines of the document by text
+        (e.g. a previously generated result out of the parse cache).
+        """
+        self.lines = text.splitlines()
+        self.modified = True
+
+    def insert_comments(self, arguments):
+        """
+        Applying Header and Post Comments to the document (see insert_comments).
+        Afterwards the function comments are refreshed out of the edited lines,
+        so no second parsing of the document is needed.
+        """
+        self.lines = insert_comments_into_lines(
+            self.lines, self.functions, arguments, self.function_index)
+        self.refresh_comments()
+        self.modified = True
+
+    def refresh_comments(self):
+        """
+        Updating startLine, comment and isDoxygenComment of all functions
+        after the lines of the document have been edited.
+        """
+        classes = classify_lines(self.lines)
+        block_comments, block_comment_ends = get_block_comments(
+            self.lines, extract_multiline_comments(self.lines), classes)
+        for func in self.functions:
+            # the indexed line is the line a new parsing would report as startLine
+            start_line = self.function_index.get(func)
+            if start_line is None:
+                start_line = self.function_index.find(func, self.lines)
+            if start_line == -1:
+                continue
+            comment = extract_comment_for_function(
+                self.lines, start_line,
+                get_block_comment_above(block_comments, block_comment_ends, start_line),
+                classes)
+            func["startLine"] = start_line
+            func["comment"] = comment
+            func["isDoxygenComment"] = is_doxygen_comment(comment)
+
+    def replace_comments(self):
+        """
+        Replacing the header comments by the generated doxygen comments
+        of the functions (see replace_comments).
+        """
+        self.lines = replace_comments_in_lines(self.lines, self.functions, self.function_index)
+        self.modified = True
+
+    def save(self):
+        """
+        Writing the document back to its file, if it has been edited and its
+        text differs from the original content (see write_text_if_changed).
+        Returns True, if the file was written.
+        """
+        if not self.modified:
+            return False
+
+        return write_text_if_changed(self.file_path, self.get_text(), self.content)
+
+    def get_text(self):
+        """
+        Returning the current (edited) text of the document.
+        """
+        return "\n".join(self.lines) + "\n"
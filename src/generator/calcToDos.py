@@ -14,22 +14,42 @@ def calculation_of_todos(functions):
     """
     calculation of overall to-dos within functions.
     """
-    total_funcs = len(functions)
-    todo_funcs = sum(1 for f in functions if "TODO" in f.get("doxygen", ""))
-    done_funcs = total_funcs - todo_funcs
-    percent_done = int((done_funcs / total_funcs) * 100) if total_funcs else 0
+    return todo_statistics(count_todos(functions))
 
-    return_todo, tparams_todo, params_todo = 0, 0, 0
-    brief_todo, total_tparams, total_params = 0, 0, 0
+def count_todos(functions, counts=None):
+    """
+    Counting the to-dos of functions (running summary, e.g. file by file).
+    If counts of previous functions are overloaded, they are updated.
+    Returns the counts, see todo_statistics for the overall statistics.
+    """
+    if counts is None:
+        counts = dict.fromkeys(("total_funcs", "todo_funcs", "return_todo", "tparams_todo",
+                                "total_tparams", "params_todo", "total_params", "brief_todo"), 0)
 
     for func in functions:
+        counts["total_funcs"] += 1
+        counts["todo_funcs"] += int("TODO" in func.get("doxygen", ""))
         func["doxygen_TODO_Analyze"] = analyze_doxygen_todos(func.get("doxygen", ""))
-        return_todo += int(func["doxygen_TODO_Analyze"]["todo_in_return"])
-        tparams_todo += int(func["doxygen_TODO_Analyze"]["tparams_with_todo"])
-        total_tparams += func["doxygen_TODO_Analyze"]["total_tparams"]
-        params_todo += func["doxygen_TODO_Analyze"]["params_with_todo"]
-        total_params += func["doxygen_TODO_Analyze"]["total_params"]
-        brief_todo += int(func["doxygen_TODO_Analyze"]["todo_in_brief"])
+        counts["return_todo"] += int(func["doxygen_TODO_Analyze"]["todo_in_return"])
+        counts["tparams_todo"] += int(func["doxygen_TODO_Analyze"]["tparams_with_todo"])
+        counts["total_tparams"] += func["doxygen_TODO_Analyze"]["total_tparams"]
+        counts["params_todo"] += func["doxygen_TODO_Analyze"]["params_with_todo"]
+        counts["total_params"] += func["doxygen_TODO_Analyze"]["total_params"]
+        counts["brief_todo"] += int(func["doxygen_TODO_Analyze"]["todo_in_brief"])
+    return counts
+
+def todo_statistics(counts):
+    """
+    Calculation of the overall to-do statistics out of the counts of count_todos.
+    """
+    total_funcs = counts["total_funcs"]
+    done_funcs = total_funcs - counts["todo_funcs"]
+    percent_done = int((done_funcs / total_funcs) * 100) if total_funcs else 0
+
+    return_todo, tparams_todo, params_todo = (
+        counts["return_todo"], counts["tparams_todo"], counts["params_todo"])
+    brief_todo, total_tparams, total_params = (
+        counts["brief_todo"], counts["total_tparams"], counts["total_params"])
 
     percent_brief_done = (
         int(((total_funcs - brief_todo) / total_funcs) * 100)
@@ -7,27 +7,44 @@
 Generating html documentation report out of functions.
 """
 
+import io
 import os
 import re
 import html
 
+# index of a function-block rendered independent of its position (no name or
+# path contains it, see render_function_blocks)
+POSITION_PLACEHOLDER = "\0"
+
 def write_html_doc(functions, output_path, arguments, todo_stats):
     """
     writing documentation in html format.
     This is the main-writing functions.
     """
-    document_meta = arguments["document"]
-    highlight_todo = document_meta.get("highlightTodo", False)
-    show_progress = document_meta.get("showDocProgress", True)
+    highlight_todo = arguments["document"].get("highlightTodo", False)
 
     # Writing Output Document
     with open(output_path, "w", encoding="utf-8") as f:
-        write_html_header(f, document_meta)
-        if show_progress:
-            write_html_progress_section(f, todo_stats)
-        write_html_toc(f, functions, highlight_todo)
-        write_functions_to_html(f, functions, highlight_todo)
-        write_html_footer(f, arguments)
+        write_html_document(
+            f, arguments, todo_stats,
+            lambda toc: write_html_toc_entries(toc, functions, highlight_todo),
+            lambda body: write_functions_to_html(body, functions, highlight_todo))
+
+def write_html_document(f, arguments, todo_stats, write_toc, write_functions):
+    """
+    Writing the html document: header, progress, table of content and functions.
+    The entries of the table of content and the function blocks are written by the
+    callables write_toc(f) and write_functions(f) (e.g. copied from a streamed report).
+    """
+    document_meta = arguments["document"]
+    show_progress = document_meta.get("showDocProgress", True)
+
+    write_html_header(f, document_meta)
+    if show_progress:
+        write_html_progress_section(f, todo_stats)
+    write_html_toc(f, write_toc)
+    write_functions(f)
+    write_html_footer(f, arguments)
 
 def write_html_header(f, document_meta):
     """
@@ -128,14 +145,21 @@ def write_html_header(f, document_meta):
     <p><strong>Datum:</strong> {document_meta.get('date', 'Unbekannt')}</p>
 """)
 
-def write_html_toc(f, functions, highlight_todo):
+def write_html_toc(f, write_toc):
     """
-    Writing html table of content to report
+    Writing html table of content to report, the entries are written by write_toc(f)
     """
     f.write("""
     <h2>📚 Table of Content</h2>
     <ul class="toc">
 """)
+    write_toc(f)
+    f.write("</ul>\n")
+
+def write_html_toc_entries(f, functions, highlight_todo):
+    """
+    Writing html table of content entries of functions
+    """
     for func in functions:
         comment = func.get("doxygen", "")
         if highlight_todo:
@@ -144,7 +168,6 @@ def write_html_toc(f, functions, highlight_todo):
         else:
             prefix = " "
         f.write(f"<li><a href='#{func['name']}'>{prefix}{func['name']}</a></li>\n")
-    f.write("</ul>\n")
 
 def write_html_progress_section(f, todo_stats):
     """
@@ -229,29 +252,58 @@ def write_functions_to_html(f, functions, highlight_todo):
     Writing html function-block to report
     """
     for idx, func in enumerate(functions):
-        todo_marker = ""
-        highlight_style = ""
+        write_function_to_html(f, func, highlight_todo, idx)
 
-        comment = func.get("doxygen", "")
-        if highlight_todo:
-            comment_contains_todo = "TODO" in comment
+def render_function_blocks(functions, highlight_todo):
+    """
+    Rendering the html function-blocks of functions independent of their position
+    within the report: each block is returned split at the ids of its comment
+    block, which are filled in by write_function_blocks.
+    """
+    blocks = []
+    for func in functions:
+        block = io.StringIO()
+        write_function_to_html(block, func, highlight_todo, POSITION_PLACEHOLDER)
+        # the ids are written before the comment text, which may contain anything
+        blocks.append(block.getvalue().split(f"comment_{POSITION_PLACEHOLDER}", 2))
+    return blocks
 
-            if comment_contains_todo:
-                todo_marker = "❌ "
-                highlight_style = "background-color: #fff3cd; border-left: 6px solid red; padding-left: 10px;"
-            else:
-                todo_marker = "✅ "
+def write_function_blocks(f, blocks, start):
+    """
+    Writing the function-blocks of render_function_blocks, the first one
+    is the function with index start within the report.
+    """
+    for idx, parts in enumerate(blocks, start=start):
+        f.write(f"comment_{idx}".join(parts))
+
+def write_function_to_html(f, func, highlight_todo, idx):
+    """
+    Writing the html function-block of a single function
+    idx: index of the function within the report (ids of the comment block)
+    """
+    todo_marker = ""
+    highlight_style = ""
+
+    comment = func.get("doxygen", "")
+    if highlight_todo:
+        comment_contains_todo = "TODO" in comment
+
+        if comment_contains_todo:
+            todo_marker = "❌ "
+            highlight_style = "background-color: #fff3cd; border-left: 6px solid red; padding-left: 10px;"
         else:
-            todo_marker = " "
+            todo_marker = "✅ "
+    else:
+        todo_marker = " "
 
-        f.write(f"""
+    f.write(f"""
         <div style='display: flex; align-items: center; justify-content: space-between; margin-top: 15px;'>
             <h2 id='{func['name']}' style='margin: 0; {highlight_style}'>{todo_marker}{func['name']}</h2>
             <a href='#top' style='font-size: 14px; color: #0066cc; text-decoration: none;'>🔝 Back to Top</a>
         </div>
         """)
-        if todo_marker == "❌ ":
-            f.write("""
+    if todo_marker == "❌ ":
+        f.write("""
                 <div style='
                     margin-top: 8px;
                     color: #856404;
@@ -263,10 +315,10 @@ def write_functions_to_html(f, functions, highlight_todo):
                 </div>
             """)
 
-        f.write(f"<div class='code-block'>{html.escape(func['return_type'])} {html.escape(func['name'])}({html.escape(func['params'])})</div>\n")
+    f.write(f"<div class='code-block'>{html.escape(func['return_type'])} {html.escape(func['name'])}({html.escape(func['params'])})</div>\n")
 
-        if func.get("doxygen"):
-            write_comment_to_html(f, func, idx)
+    if func.get("doxygen"):
+        write_comment_to_html(f, func, idx)
 
 def write_comment_to_html(f, func, idx):
     """
@@ -13,112 +13,138 @@ def write_markdown_doc(functions, output_path, arguments, todo_stats):
     """
     writing documentation in markdown format
     """
+    highlight_todo = arguments["document"].get("highlightTodo", False)
+
+    with open(output_path, "w", encoding="utf-8") as f:
+        write_markdown_document(
+            f, arguments, todo_stats,
+            lambda toc: write_markdown_toc_entries(toc, functions, highlight_todo),
+            lambda body: write_markdown_functions(body, functions, highlight_todo))
+
+def write_markdown_document(f, arguments, todo_stats, write_toc, write_functions):
+    """
+    writing the markdown document: header, progress, table of content and functions.
+    The entries of the table of content and the function blocks are written by the
+    callables write_toc(f) and write_functions(f) (e.g. copied from a streamed report).
+    """
     document_meta = arguments["document"]
-    highlight_todo = document_meta.get("highlightTodo", False)
     show_progress = document_meta.get("showDocProgress", True)
 
-    def format_doxygen_comment(comment: str) -> str:
-        lines = comment.strip().split("\n")
-        formatted, tag_buffer = [], []
-        current_tag = None
-
-        def flush_tag():
-            nonlocal current_tag, tag_buffer
-            if not current_tag:
-                return
-            content = " ".join(tag_buffer).strip()
-            if current_tag == "@brief":
-                formatted.append(f"**🔹 Description:** {content}")
-            elif current_tag.startswith("@param"):
-                parts = current_tag.split()
-                name = parts[1] if len(parts) > 1 else ""
-                formatted.append(f"- **Parameter `{name}`**: {content}")
-            elif current_tag.startswith("@tparam"):
-                parts = current_tag.split()
-                name = parts[1] if len(parts) > 1 else ""
-                formatted.append(f"- **Template Parameter `{name}`**: {content}")
-            elif current_tag == "@return":
-                formatted.append(f"**🔁 Return value:** {content}")
-            elif current_tag == "@note":
-                formatted.append(f"> 💡 **Note:** {content}")
-            else:
-                tag = current_tag.lstrip("@").capitalize()
-                formatted.append(f"- **{tag}:** {content}")
-            tag_buffer.clear()
-
-        for line in lines:
-            stripped = line.strip()
-
-            if stripped in ("/*", "/**", "*/"):
-                continue
-
-            stripped = stripped.lstrip("*").strip()
-            if not stripped:
-                continue
-            if stripped.startswith("@"):
-                flush_tag()
-                parts = stripped.split(maxsplit=2)
-                if len(parts) >= 2 and parts[0] in ["@param", "@tparam"]:
-                    current_tag = f"{parts[0]} {parts[1]}"
-                    tag_buffer = [parts[2]] if len(parts) == 3 else []
-                else:
-                    current_tag = parts[0]
-                    tag_buffer = (
-                        [parts[1]]
-                        if len(parts) == 2
-                        else [" ".join(parts[1:])] if len(parts) > 2 else []
-                    )
-            else:
-                tag_buffer.append(stripped)
+    write_header(f, document_meta)
 
-        flush_tag()
-        return "\n".join(formatted)
+    # Documentation Progress
+    if show_progress:
+        write_progress(f, todo_stats)
 
-    with open(output_path, "w", encoding="utf-8") as f:
-        write_header(f, document_meta)
-
-        # Documentation Progress
-        if show_progress:
-            write_progress(f, todo_stats)
-
-        # Adding Table of Content to Documentation
-        f.write("## 📚 Table of Content\n\n")
-        for func in functions:
-            if highlight_todo:
-                comment = func.get("doxygen", "")
-                has_todo = highlight_todo and "TODO" in comment
-                prefix = "❌ " if has_todo else "✅ "
-            else:
-                has_todo = False
-                prefix = " "
-            f.write(f"- [{prefix}{func['name']}](#{func['name'].lower()})\n")
-        f.write("\n")
+    # Adding Table of Content to Documentation
+    f.write("## 📚 Table of Content\n\n")
+    write_toc(f)
+    f.write("\n")
 
-        # Adding Functions Documentation
-        for func in functions:
+    # Adding Functions Documentation
+    write_functions(f)
+
+    # Adding SW-Version at document footer
+    version = arguments.get("app_info", {}).get("version", "1.0")
+    f.write("\n---\n")
+    f.write(f"<div align='right'>SW-Version: {version}</div>\n")
+
+def write_markdown_toc_entries(f, functions, highlight_todo):
+    """
+    writing the table of content entries of functions
+    """
+    for func in functions:
+        if highlight_todo:
             comment = func.get("doxygen", "")
-            if highlight_todo:
-                has_todo = highlight_todo and "TODO" in comment
-                todo_marker = "❌ " if has_todo else "✅ "
+            has_todo = highlight_todo and "TODO" in comment
+            prefix = "❌ " if has_todo else "✅ "
+        else:
+            prefix = " "
+        f.write(f"- [{prefix}{func['name']}](#{func['name'].lower()})\n")
+
+def write_markdown_functions(f, functions, highlight_todo):
+    """
+    writing the documentation blocks of functions
+    """
+    for func in functions:
+        comment = func.get("doxygen", "")
+        if highlight_todo:
+            has_todo = highlight_todo and "TODO" in comment
+            todo_marker = "❌ " if has_todo else "✅ "
+        else:
+            todo_marker = " "
+            has_todo = False
+
+        file_info = f"<div style='font-size: 12px; color: gray;'>📄 {os.path.basename(func['file'])} (Line {func['startLine']})</div>"
+
+        f.write(f"## {todo_marker}`{func['name']}` <a href='#top' style='float:right; font-size: 12px;'>🔝 Back to Top</a>\n")
+        f.write(f"**Signatur:** `{func['return_type']} {func['name']}({func['templateParams']})({func['params']})`\n\n")
+        if func.get("doxygen"):
+            if has_todo:
+                f.write("> ⚠️ **Warning: Function contains a TODO mark!**\n\n")
+            f.write("### 📘 Documentation\n")
+            f.write(f"{file_info}\n\n")
+            f.write(format_doxygen_comment(func["doxygen"]) + "\n\n")
+
+def format_doxygen_comment(comment: str) -> str:
+    """
+    formatting a doxygen comment as markdown (description, parameters, return value).
+    """
+    lines = comment.strip().split("\n")
+    formatted, tag_buffer = [], []
+    current_tag = None
+
+    def flush_tag():
+        nonlocal current_tag, tag_buffer
+        if not current_tag:
+            return
+        content = " ".join(tag_buffer).strip()
+        if current_tag == "@brief":
+            formatted.append(f"**🔹 Description:** {content}")
+        elif current_tag.startswith("@param"):
+            parts = current_tag.split()
+            name = parts[1] if len(parts) > 1 else ""
+            formatted.append(f"- **Parameter `{name}`**: {content}")
+        elif current_tag.startswith("@tparam"):
+            parts = current_tag.split()
+            name = parts[1] if len(parts) > 1 else ""
+            formatted.append(f"- **Template Parameter `{name}`**: {content}")
+        elif current_tag == "@return":
+            formatted.append(f"**🔁 Return value:** {content}")
+        elif current_tag == "@note":
+            formatted.append(f"> 💡 **Note:** {content}")
+        else:
+            tag = current_tag.lstrip("@").capitalize()
+            formatted.append(f"- **{tag}:** {content}")
+        tag_buffer.clear()
+
+    for line in lines:
+        stripped = line.strip()
+
+        if stripped in ("/*", "/**", "*/"):
+            continue
+
+        stripped = stripped.lstrip("*").strip()
+        if not stripped:
+            continue
+        if stripped.startswith("@"):
+            flush_tag()
+            parts = stripped.split(maxsplit=2)
+            if len(parts) >= 2 and parts[0] in ["@param", "@tparam"]:
+                current_tag = f"{parts[0]} {parts[1]}"
+                tag_buffer = [parts[2]] if len(parts) == 3 else []
             else:
-                todo_marker = " "
-                has_todo = False
-
-            file_info = f"<div style='font-size: 12px; color: gray;'>📄 {os.path.basename(func['file'])} (Line {func['startLine']})</div>"
-
-            f.write(f"## {todo_marker}`{func['name']}` <a href='#top' style='float:right; font-size: 12px;'>🔝 Back to Top</a>\n")
-            f.write(f"**Signatur:** `{func['return_type']} {func['name']}({func['templateParams']})({func['params']})`\n\n")
-            if func.get("doxygen"):
-                if has_todo:
-                    f.write("> ⚠️ **Warning: Function contains a TODO mark!**\n\n")
-                f.write("### 📘 Documentation\n")
-                f.write(f"{file_info}\n\n")
-                f.write(format_doxygen_comment(func["doxygen"]) + "\n\n")
-
-        # Adding SW-Version at document footer
-        version = arguments.get("app_info", {}).get("version", "1.0")
-        f.write("\n---\n")
-        f.write(f"<div align='right'>SW-Version: {version}</div>\n")
+                current_tag = parts[0]
+                tag_buffer = (
+                    [parts[1]]
+                    if len(parts) == 2
+                    else [" ".join(parts[1:])] if len(parts) > 2 else []
+                )
+        else:
+            tag_buffer.append(stripped)
+
+    flush_tag()
+    return "\n".join(formatted)
 
 def write_header(f, document_meta):
     """
@@ -8,10 +8,20 @@ Implementation of report generating functionalitys.
 """
 
 import os
+import io
+import json
+import shutil
+import hashlib
+import tempfile
 
-from generator.markdown_output import write_markdown_doc
-from generator.html_output import write_html_doc
-from generator.calcToDos import calculation_of_todos
+from generator.markdown_output import (write_markdown_doc, write_markdown_document,
+                                       write_markdown_toc_entries, write_markdown_functions)
+from generator.html_output import (write_html_doc, write_html_document, write_html_toc_entries,
+                                   render_function_blocks, write_function_blocks)
+from generator.calcToDos import calculation_of_todos, count_todos, todo_statistics
+
+# fields of the function records, out of which the report sections are rendered
+REPORT_FIELDS = ("name", "return_type", "params", "templateParams", "doxygen", "file", "startLine")
 
 def save_documentation(arguments, all_functions):
     """
@@ -35,3 +45,154 @@ def save_documentation(arguments, all_functions):
             print(f"❌ Invalid Output Format: {doc_format}")
             raise ValueError(f"Invalid Output Format: {doc_format}")
     return file_path, todo_stats
+
+def get_output_files(arguments):
+    """
+    Returning the paths of all report files, which are written by save_documentation.
+    """
+    extensions = {"markdown": "md", "md": "md", "html": "html"}
+    return [f"{arguments['output_path']}.{extensions[doc_format]}"
+            for doc_format in arguments["output_format"] if doc_format in extensions]
+
+class StreamingReport:
+    """
+    Report, which is written while the source files are documented, instead of
+    holding all functions in memory until the end of the run (see save_documentation).
+    The functions of each file are passed to add(): their table of content entries
+    and function blocks are rendered at once into temporary spool files and only a
+    running to-do summary is kept. close() writes the final documents (header and
+    progress out of the summary, then the spooled sections), so the memory stays
+    bounded by the largest single file. The documents are equal to save_documentation.
+    manifest: optional RunManifest, storing the rendered sections per source file
+    (unchanged files of an incremental run are not rendered again). The sections
+    depend only on the functions of their file, the html ids of the comment blocks
+    are numbered while the sections are written to the spool files.
+
+        with StreamingReport(arguments) as report:
+            for ...:
+                report.add(functions)
+            file_path, todo_stats = report.close()
+    """
+    def __init__(self, arguments, manifest=None):
+        self.arguments = arguments
+        self.manifest = manifest
+        self.highlight_todo = arguments["document"].get("highlightTodo", False)
+        self.counts = count_todos([])
+        self.function_count = 0
+        self.outputs = []
+
+        for doc_format in arguments["output_format"]:
+            if doc_format not in ("markdown", "md", "html"):
+                print(f"❌ Invalid Output Format: {doc_format}")
+                raise ValueError(f"Invalid Output Format: {doc_format}")
+
+        output_dir = os.path.dirname(arguments["output_path"])
+        if not os.path.exists(output_dir):
+            os.makedirs(output_dir)
+
+        try:
+            for file_path in get_output_files(arguments):
+                self.outputs.append((
+                    file_path,
+                    tempfile.TemporaryFile("w+", encoding="utf-8", dir=output_dir or None),
+                    tempfile.TemporaryFile("w+", encoding="utf-8", dir=output_dir or None)))
+        except OSError:
+            self.discard()
+            raise
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.discard()
+
+    def add(self, functions):
+        """
+        Adding the functions of a source file to the report.
+        With a run manifest, the sections of an unchanged file are taken out of
+        the manifest instead of being rendered again.
+        """
+        self.counts = count_todos(functions, self.counts)
+        source_file = functions[0]["file"] if self.manifest and functions else None
+        report_key = section_key(functions, self.highlight_todo) if source_file else None
+
+        sections = self.manifest.get_sections(source_file, report_key) if source_file else None
+        missing = [file_path for file_path, _, _ in self.outputs
+                   if sections is None or output_format(file_path) not in sections]
+        if missing:
+            sections = dict(sections or {})
+            for file_path in missing:
+                sections[output_format(file_path)] = self.render_sections(file_path, functions)
+            if source_file:
+                self.manifest.set_sections(source_file, report_key, sections)
+
+        for file_path, toc, body in self.outputs:
+            toc_section, functions_section = sections[output_format(file_path)]
+            toc.write(toc_section)
+            if output_format(file_path) == "html":
+                write_function_blocks(body, functions_section, self.function_count)
+            else:
+                body.write(functions_section)
+        self.function_count += len(functions)
+
+    def render_sections(self, file_path, functions):
+        """
+        Rendering the table of content entries and function blocks of functions
+        for the document file_path. Returns [table of content, functions], the
+        functions of html documents as blocks of render_function_blocks.
+        """
+        toc, body = io.StringIO(), io.StringIO()
+        if output_format(file_path) == "html":
+            write_html_toc_entries(toc, functions, self.highlight_todo)
+            return [toc.getvalue(), render_function_blocks(functions, self.highlight_todo)]
+        else:
+            write_markdown_toc_entries(toc, functions, self.highlight_todo)
+            write_markdown_functions(body, functions, self.highlight_todo)
+        return [toc.getvalue(), body.getvalue()]
+
+    def close(self):
+        """
+        Writing the documents out of the summary and the spool files.
+        Returns (file_path, todo_stats) like save_documentation.
+        """
+        todo_stats = todo_statistics(self.counts)
+        file_path = ""
+        for file_path, toc, body in self.outputs:
+            write_document = write_html_document if file_path.endswith(".html") else write_markdown_document
+            with open(file_path, "w", encoding="utf-8") as f:
+                write_document(f, self.arguments, todo_stats,
+                               lambda out, spool=toc: copy_spool(spool, out),
+                               lambda out, spool=body: copy_spool(spool, out))
+        self.discard()
+        return file_path, todo_stats
+
+    def discard(self):
+        """
+        Deleting the spool files (without writing the documents).
+        """
+        for _, toc, body in self.outputs:
+            toc.close()
+            body.close()
+        self.outputs = []
+
+def section_key(functions, highlight_todo):
+    """
+    Returning the key of the report sections of functions (see RunManifest.get_sections):
+    a hash of the rendered fields, a change of any other file keeps the sections valid.
+    """
+    fields = [[func.get(field) for field in REPORT_FIELDS] for func in functions]
+    return hashlib.sha256(
+        json.dumps([highlight_todo, fields], default=str).encode("utf-8")).hexdigest()
+
+def output_format(file_path):
+    """
+    Returning the format of a report file (extension, see get_output_files).
+    """
+    return os.path.splitext(file_path)[1].lstrip(".")
+
+def copy_spool(spool, f):
+    """
+    Copying the content of a spool file to f.
+    """
+    spool.seek(0)
+    shutil.copyfileobj(spool, f)
@@ -0,0 +1,92 @@
+# CppCodeDoc — Licensed under the GNU General Public License v3.0 (GPLv3-or-later)
+# Copyright (C) 2025 Jojo1220
+# See https://www.gnu.org/licenses/gpl-3.0.html
+
+"""
+Background worker of the GUI, running the documentation pipeline
+(parsing, comment insertion, report generation) outside of the GUI thread.
+"""
+
+import copy
+import time
+import threading
+
+from configSetup.installModules import ensure_modules
+
+ensure_modules([("PyQt5", "PyQt5")])
+
+from PyQt5.QtCore import QThread, pyqtSignal
+
+from formatter.doc_generator import generate_documentation
+from formatter.run_manifest import create_run_manifest
+from generator.save_report import save_documentation
+
+class DocumentationWorker(QThread):
+    """
+    QThread running generate_documentation and save_documentation.
+    The GUI is only updated by the signals (executed within the GUI thread):
+    progress(done, total, file_path, files_per_second) after each source file
+    finished_run(result) at the end with the dict keys
+        functions: documented functions, or the error/cancel message (str)
+        errors: per-file errors as (file_path, message)
+        result_files, stats: output of save_documentation (None if not saved)
+        error: exception raised while saving the report (or None)
+    The run uses a snapshot of config and source_files, so the GUI can edit
+    its settings while the worker is running.
+    full: processing all files again, also files unchanged since the previous run
+    """
+    progress = pyqtSignal(int, int, str, float)
+    finished_run = pyqtSignal(object)
+
+    def __init__(self, config, source_files, parent=None, full=False):
+        super().__init__(parent)
+        self.config = copy.deepcopy(config)
+        self.source_files = list(source_files)
+        self.full = full
+        self.cancel_event = threading.Event()
+        self.start_time = None
+
+    def cancel(self):
+        """
+        Requesting a stop of the run, the file in progress is still finished.
+        """
+        self.cancel_event.set()
+
+    def is_cancelled(self):
+        """
+        Checking if a stop of the run was requested.
+        """
+        return self.cancel_event.is_set()
+
+    def report_progress(self, done, total, file_path):
+        """
+        Progress callback of generate_documentation, forwarding to the progress signal.
+        """
+        duration = time.perf_counter() - self.start_time
+        files_per_second = done / duration if duration > 0 else 0.0
+        self.progress.emit(done, total, file_path, files_per_second)
+
+    def run(self):
+        """
+        Thread function: documentation run with all source files.
+        """
+        self.start_time = time.perf_counter()
+        result = {"functions": None, "errors": [], "result_files": None,
+                  "stats": None, "error": None}
+        try:
+            # files unchanged since the previous run are not processed again (unless full),
+            # the manifest is written again after a full run
+            manifest = create_run_manifest(self.config, reset=self.full)
+            result["functions"] = generate_documentation(
+                self.config, self.source_files, result["errors"],
+                progress=self.report_progress, cancel=self.cancel_event, manifest=manifest)
+            if manifest and isinstance(result["functions"], list):
+                manifest.save()
+
+            if isinstance(result["functions"], list) and result["functions"]:
+                result["result_files"], result["stats"] = save_documentation(
+                    self.config, result["functions"])
+        except Exception as e:
+            result["error"] = e
+
+        self.finished_run.emit(result)
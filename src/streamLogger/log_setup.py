@@ -10,7 +10,6 @@ Application specific logging functionality.
 import os
 import logging
 from logging.handlers import TimedRotatingFileHandler
-from PyQt5.QtCore import QTimer
 
 class TimedSizedRotatingFileHandler(TimedRotatingFileHandler):
     """
@@ -44,6 +43,7 @@ class StreamLogger:
     """
     def __init__(self):
         self.app_class = None
+        self.log_file_path = None
 
     def set_app_class(self, app_class):
         """
@@ -59,6 +59,8 @@ class StreamLogger:
         getattr(logging, level)(message)
         print("[LOG] " + message)
         if hasattr(self.app_class, "instance") and self.app_class.instance:
+            # PyQt5 is only loaded if the GUI is running (not in console mode)
+            from PyQt5.QtCore import QTimer
             QTimer.singleShot(0, lambda: self.app_class.instance.append_log(message))
 
     def setup_logging(self, log_name = "log.log",
@@ -67,6 +69,7 @@ class StreamLogger:
         Setup and check logging within itsdirectory.
         """
         log_file_path = os.path.join(log_dir, log_name)
+        self.log_file_path = log_file_path
 
         if not os.path.exists(log_dir):
             os.makedirs(log_dir)
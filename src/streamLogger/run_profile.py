@@ -0,0 +1,322 @@
+# CppCodeDoc — Licensed under the GNU General Public License v3.0 (GPLv3-or-later)
+# SPDX-License-Identifier: GPLv3-or-later
+# Copyright (C) 2025 Jojo1220
+# See https://www.gnu.org/licenses/gpl-3.0.html
+
+"""
+Stage-level timing of a documentation run.
+Spans are recorded per stage (discovery, read, parse, rewrite, doxygen, write, report)
+and per file with wall time, CPU time, bytes read/written and function counts.
+The result is printed as summary table or exported as Chrome/Perfetto trace
+(JSON trace event format, open in chrome://tracing or ui.perfetto.dev).
+With memory profiling (tracemalloc), the peak and retained memory of each span
+and the top allocation sites are recorded additionally.
+"""
+
+import os
+import json
+import time
+import threading
+import tracemalloc
+from contextlib import contextmanager, nullcontext
+
+STAGE = "stage"
+FILE = "file"
+
+MB = 1024 * 1024
+
+class RunProfile:
+    """
+    Collection of the spans of a documentation run.
+    A span is a dict (picklable, so spans of worker processes can be merged):
+    name, category, file, start, wall, cpu, bytes_read, bytes_written, functions, pid, tid
+    start is a time.perf_counter() value (system-wide clock, also within worker processes).
+    memory: if True, tracemalloc is started and each span additionally contains
+            memory_peak (peak above the memory at the start of the span) and
+            memory_retained (memory still allocated at the end of the span) in bytes
+    memo_stats: hits and misses of the memoized functions during the run (see memo_cache)
+    """
+    def __init__(self, memory=False):
+        self.origin = time.perf_counter()
+        self.spans = []
+        self.memo_stats = {}
+        self.memory = memory
+        self.memory_peak = 0
+        self.allocation_sites = []
+        # peak of the open spans (tracemalloc has only one peak, it is reset per span)
+        self._open_peaks = []
+        if memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+
+    @contextmanager
+    def span(self, name, file_path=None, category=STAGE):
+        """
+        Recording a span around the with-block. The yielded span can be updated
+        within the block (bytes_read, bytes_written, functions).
+        """
+        span = {"name": name, "category": category, "file": file_path,
+                "bytes_read": 0, "bytes_written": 0, "functions": 0,
+                "pid": os.getpid(), "tid": threading.get_ident()}
+        memory_start = self._start_memory() if self.memory else 0
+        start, cpu_start = time.perf_counter(), time.thread_time()
+        try:
+            yield span
+        finally:
+            span["start"] = start
+            span["wall"] = time.perf_counter() - start
+            span["cpu"] = time.thread_time() - cpu_start
+            if self.memory:
+                span["memory_peak"], span["memory_retained"] = self._stop_memory(memory_start)
+            self.spans.append(span)
+
+    def _start_memory(self):
+        """
+        Starting the memory measurement of a span, returns the current traced memory.
+        """
+        current, peak = tracemalloc.get_traced_memory()
+        self._propagate_peak(peak)
+        tracemalloc.reset_peak()
+        self._open_peaks.append(current)
+        return current
+
+    def _stop_memory(self, memory_start):
+        """
+        Stopping the memory measurement of a span.
+        Returns (peak, retained) relative to the start of the span.
+        """
+        current, peak = tracemalloc.get_traced_memory()
+        peak = max(self._open_peaks.pop(), peak)
+        self._propagate_peak(peak)
+        tracemalloc.reset_peak()
+        return peak - memory_start, current - memory_start
+
+    def _propagate_peak(self, peak):
+        """
+        Passing a peak measured within a span to the enclosing span and the whole run.
+        """
+        if self._open_peaks:
+            self._open_peaks[-1] = max(self._open_peaks[-1], peak)
+        self.memory_peak = max(self.memory_peak, peak)
+
+    def snapshot_allocations(self, count=10):
+        """
+        Storing the top allocation sites of the currently allocated memory
+        (e.g. called while all function records are alive).
+        """
+        if not self.memory:
+            return
+        statistics = tracemalloc.take_snapshot().filter_traces((
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+        )).statistics("lineno")
+        self.allocation_sites = [
+            {"site": f"{stat.traceback[0].filename}:{stat.traceback[0].lineno}",
+             "size": stat.size, "count": stat.count}
+            for stat in statistics[:count]]
+
+    def extend(self, spans):
+        """
+        Adding spans recorded by another profile (e.g. of a worker process).
+        """
+        self.spans.extend(spans)
+
+    def add_memo_stats(self, stats):
+        """
+        Adding the memoization counters of the main or a worker process
+        (dict name -> {"hits", "misses"}).
+        """
+        for name, counts in stats.items():
+            total = self.memo_stats.setdefault(name, {"hits": 0, "misses": 0})
+            for key in total:
+                total[key] += counts.get(key, 0)
+
+    def stop(self):
+        """
+        Stopping the memory tracing of the profile (if started).
+        """
+        if self.memory and tracemalloc.is_tracing():
+            tracemalloc.stop()
+
+    def elapsed(self):
+        """
+        Returning the wall time since the start of the profile in seconds.
+        """
+        return time.perf_counter() - self.origin
+
+    def summary(self, category=STAGE):
+        """
+        Returning the sums of all spans per name (in order of the first span)
+        as dict name -> {count, wall, cpu, bytes_read, bytes_written, functions}.
+        """
+        rows = {}
+        for span in self.spans:
+            if span["category"] != category:
+                continue
+            row = rows.setdefault(span["name"], {
+                "count": 0, "wall": 0.0, "cpu": 0.0,
+                "bytes_read": 0, "bytes_written": 0, "functions": 0,
+                "memory_peak": 0, "memory_retained": 0})
+            row["count"] += 1
+            for key in ("wall", "cpu", "bytes_read", "bytes_written", "functions"):
+                row[key] += span[key]
+            if "memory_peak" in span:
+                row["memory_peak"] = max(row["memory_peak"], span["memory_peak"])
+                row["memory_retained"] += span["memory_retained"]
+        return rows
+
+    def slowest_files(self, count=5, key="wall"):
+        """
+        Returning the file spans with the longest wall time (or largest value of key).
+        """
+        files = [span for span in self.spans if span["category"] == FILE and key in span]
+        return sorted(files, key=lambda span: span[key], reverse=True)[:count]
+
+    def worker_utilization(self):
+        """
+        Returning the utilization of the processes, which processed files, as dict
+        pid -> {files, busy, utilization}: busy is the sum of the wall times of the
+        files, utilization relative to the time from the first file start to the last file end.
+        """
+        files = [span for span in self.spans if span["category"] == FILE]
+        if not files:
+            return {}
+        start = min(span["start"] for span in files)
+        duration = max(span["start"] + span["wall"] for span in files) - start
+        workers = {}
+        for span in files:
+            worker = workers.setdefault(span["pid"], {"files": 0, "busy": 0.0, "utilization": 0.0})
+            worker["files"] += 1
+            worker["busy"] += span["wall"]
+        for worker in workers.values():
+            worker["utilization"] = worker["busy"] / duration if duration > 0 else 1.0
+        return workers
+
+    def format_summary(self):
+        """
+        Returning the summary table of the run as text.
+        Wall and CPU time of stages within worker processes are summed over all processes.
+        """
+        header = (f"{'stage':<10} {'count':>6} {'wall [s]':>9} {'cpu [s]':>9} "
+                  f"{'read [kB]':>10} {'written [kB]':>12} {'functions':>9}")
+        if self.memory:
+            header += f" {'peak [MB]':>10} {'retained [MB]':>13}"
+        lines = [header]
+        for name, row in self.summary().items():
+            line = (f"{name:<10} {row['count']:>6} {row['wall']:>9.3f} {row['cpu']:>9.3f} "
+                    f"{row['bytes_read'] / 1024:>10.1f} {row['bytes_written'] / 1024:>12.1f} "
+                    f"{row['functions']:>9}")
+            if self.memory:
+                line += f" {row['memory_peak'] / MB:>10.2f} {row['memory_retained'] / MB:>13.2f}"
+            lines.append(line)
+        total = f"{'total':<10} {'':>6} {self.elapsed():>9.3f}"
+        if self.memory:
+            total += f" {'':>9} {'':>10} {'':>12} {'':>9} {self.memory_peak / MB:>10.2f}"
+        lines.append(total)
+
+        slowest = self.slowest_files()
+        if slowest:
+            lines.append("slowest files:")
+            for span in slowest:
+                lines.append(f"  {span['wall']:>8.3f}s  {span['file']}")
+        if self.memory:
+            lines.extend(self.format_memory())
+        lines.extend(self.format_workers())
+        lines.extend(self.format_memo_stats())
+        return "\n".join(lines)
+
+    def format_workers(self):
+        """
+        Returning the lines of the worker utilization (only if the files were
+        processed by several worker processes, see worker_utilization).
+        """
+        workers = self.worker_utilization()
+        if len(workers) < 2:
+            return []
+        lines = [f"{'worker':<10} {'files':>6} {'busy [s]':>9} {'busy':>9}"]
+        for pid, worker in sorted(workers.items(), key=lambda item: -item[1]["busy"]):
+            lines.append(f"{pid:<10} {worker['files']:>6} {worker['busy']:>9.3f} "
+                         f"{worker['utilization']:>9.1%}")
+        return lines
+
+    def format_memo_stats(self):
+        """
+        Returning the lines of the memoization summary (hits, misses and hit rate
+        of each memoized function, which was called during the run).
+        """
+        rows = [(name, counts) for name, counts in self.memo_stats.items()
+                if counts["hits"] or counts["misses"]]
+        if not rows:
+            return []
+        lines = [f"{'memoized':<24} {'hits':>9} {'misses':>9} {'hit rate':>9}"]
+        for name, counts in rows:
+            calls = counts["hits"] + counts["misses"]
+            lines.append(f"{name:<24} {counts['hits']:>9} {counts['misses']:>9} "
+                         f"{counts['hits'] / calls:>9.1%}")
+        return lines
+
+    def format_memory(self):
+        """
+        Returning the lines of the memory summary: files with the largest peak and
+        top allocation sites (see snapshot_allocations).
+        """
+        lines = []
+        largest = self.slowest_files(key="memory_peak")
+        if largest:
+            lines.append("largest memory peak files:")
+            for span in largest:
+                lines.append(f"  {span['memory_peak'] / MB:>8.2f} MB peak, "
+                             f"{span['memory_retained'] / MB:>8.2f} MB retained  {span['file']}")
+        if self.allocation_sites:
+            lines.append("top allocation sites:")
+            for site in self.allocation_sites:
+                lines.append(f"  {site['size'] / MB:>8.2f} MB {site['count']:>9} blocks  "
+                             f"{site['site']}")
+        return lines
+
+    def to_chrome_trace(self):
+        """
+        Returning the spans in Chrome trace event format (complete events "X",
+        timestamps and durations in microseconds relative to the start of the profile).
+        """
+        events = []
+        for span in self.spans:
+            args = {key: span[key] for key in ("bytes_read", "bytes_written", "functions")}
+            args["cpu_ms"] = round(span["cpu"] * 1e3, 3)
+            if "memory_peak" in span:
+                args["memory_peak"] = span["memory_peak"]
+                args["memory_retained"] = span["memory_retained"]
+            if span["file"]:
+                args["file"] = span["file"]
+            events.append({
+                "name": span["name"] if span["category"] == STAGE
+                        else os.path.basename(span["file"] or span["name"]),
+                "cat": span["category"],
+                "ph": "X",
+                "ts": round((span["start"] - self.origin) * 1e6, 3),
+                "dur": round(span["wall"] * 1e6, 3),
+                "pid": span["pid"],
+                "tid": span["tid"],
+                "args": args,
+            })
+        events.sort(key=lambda event: event["ts"])
+        trace = {"traceEvents": events, "displayTimeUnit": "ms"}
+        if self.memory:
+            trace["memory"] = {"peak": self.memory_peak, "allocation_sites": self.allocation_sites}
+        return trace
+
+    def write_chrome_trace(self, path):
+        """
+        Writing the Chrome trace JSON of the run to path.
+        """
+        directory = os.path.dirname(os.path.abspath(path))
+        os.makedirs(directory, exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.to_chrome_trace(), f)
+
+def profile_span(profile, name, file_path=None, category=STAGE):
+    """
+    Returning the span context of profile, or a dummy context if no profile is used.
+    """
+    if profile is None:
+        return nullcontext({})
+    return profile.span(name, file_path, category)
@@ -0,0 +1,101 @@
+# CppCodeDoc — Licensed under the GNU General Public License v3.0 (GPLv3-or-later)
+# SPDX-License-Identifier: GPLv3-or-later
+# Copyright (C) 2025 Jojo1220
+# See https://www.gnu.org/licenses/gpl-3.0.html
+
+"""
+Tracing of hot paths (parser, generator) with levels and per-module enablement.
+Tracing is disabled by default, call sites are guarded by a flag of the
+module tracer, so a disabled trace costs one attribute lookup:
+
+    trace = get_tracer("parser")
+    if trace.debug:
+        trace.log("Input: '%s' -> Output: '%s'", sig, normalized)
+
+The message is formatted (%-style) only if the trace is enabled.
+Enabled by the console argument --trace, e.g. "--trace parser" or "--trace parser=info".
+"""
+
+TRACE_LEVELS = {"info": 1, "debug": 2}
+DEFAULT_TRACE_LEVEL = "debug"
+
+class Tracer:
+    """
+    Tracer of a single module. The flags info and debug are set by enable_tracing.
+    """
+    __slots__ = ("name", "info", "debug")
+
+    def __init__(self, name):
+        self.name = name
+        self.info = False
+        self.debug = False
+
+    def set_level(self, level):
+        """
+        Setting the trace level (None disables the tracer).
+        """
+        value = TRACE_LEVELS.get(level, 0) if level else 0
+        self.info = value >= TRACE_LEVELS["info"]
+        self.debug = value >= TRACE_LEVELS["debug"]
+
+    def log(self, message, *args):
+        """
+        Printing a trace message, args are formatted into message (%-style).
+        Call sites check the level flag before calling log.
+        """
+        if args:
+            message = message % args
+        print(f"[{self.name}] {message}")
+
+_tracers = {}
+
+def get_tracer(name):
+    """
+    Returning the (shared) tracer of the module name.
+    """
+    if name not in _tracers:
+        _tracers[name] = Tracer(name)
+    return _tracers[name]
+
+def parse_trace_spec(spec):
+    """
+    Parsing the trace specification: list (or comma separated string) of
+    module names with optional level, e.g. ["parser", "generator=info"].
+    Returns a dict {module: level}. Unknown levels raise a ValueError.
+    """
+    if not spec:
+        return {}
+    if isinstance(spec, str):
+        spec = spec.split(",")
+
+    modules = {}
+    for item in spec:
+        item = item.strip()
+        if not item:
+            continue
+        name, _, level = item.partition("=")
+        level = level.strip().lower() or DEFAULT_TRACE_LEVEL
+        if level not in TRACE_LEVELS:
+            raise ValueError(f"Invalid trace level '{level}' for '{name}' "
+                             f"(valid: {', '.join(TRACE_LEVELS)})")
+        modules[name.strip()] = level
+    return modules
+
+def get_trace_spec():
+    """
+    Returning the specification of the enabled tracers (see parse_trace_spec),
+    e.g. to enable the same tracers within worker processes.
+    """
+    return [f"{name}={'debug' if tracer.debug else 'info'}"
+            for name, tracer in _tracers.items() if tracer.info]
+
+def enable_tracing(spec):
+    """
+    Enabling the tracers of the trace specification (see parse_trace_spec),
+    all other tracers are disabled.
+    """
+    modules = parse_trace_spec(spec)
+    for name in modules:
+        get_tracer(name)
+    for name, tracer in _tracers.items():
+        tracer.set_level(modules.get(name))
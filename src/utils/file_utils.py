@@ -8,35 +8,86 @@ Helper functions for file handling/utilities.
 """
 
 import os
+import shutil
+import tempfile
+
+from utils.file_walker import (DEFAULT_EXTENSIONS, DEFAULT_IGNORE_FILES, GITIGNORE,
+                               create_matcher, walk_source_files)
 
 def get_cpp_files(path, arguments):
     """
     function to gather a list of all cpp-based files out of overloaded path.
-    If selected recursive, all subdirectorys are also parsed. 
+    If selected recursive, all subdirectorys are also parsed.
+    Optional settings (see file_walker):
+    extensions: selected file extensions, include/exclude: glob patterns,
+    ignore_files: names of .gitignore-style ignore files,
+    use_gitignore: respecting .gitignore files in addition to the default ignore files,
+    walk_workers: number of threads listing the directories
     """
-    cpp_files = []
-    recursive = bool(arguments["recursive"])
+    extensions = tuple(arguments.get("extensions") or DEFAULT_EXTENSIONS)
 
     if os.path.isfile(path):
-        if path.endswith((".cpp", ".h", ".hpp", ".cxx", ".ino")):
-            cpp_files.append(path)
-        return cpp_files
+        if path.endswith(extensions):
+            return [path]
+        return []
     if os.path.isdir(path):
-        if recursive:
-            for root, _, files in os.walk(path):
-                for file in files:
-                    if ( file.endswith(".cpp") or file.endswith(".h") or
-                            file.endswith(".hpp") or file.endswith(".cxx") or
-                            file.endswith(".ino")):
-                        cpp_files.append(os.path.join(root, file))
-        else:
-            for file in os.listdir(path):
-                full_path = os.path.join(path, file)
-                if (os.path.isfile(full_path) and
-                        file.endswith((".cpp", ".h", ".hpp", ".cxx", ".ino"))):
-                    cpp_files.append(full_path)
-
-        return cpp_files
+        return walk_source_files(path, **get_walk_settings(arguments))
 
     # if wether file or directory exists - return nothing-list
     return []
+
+def get_walk_settings(arguments):
+    """
+    Returning the settings of the file walker out of the configuration,
+    as keyword arguments of walk_source_files/scan_tree (see get_cpp_files).
+    """
+    extensions = tuple(arguments.get("extensions") or DEFAULT_EXTENSIONS)
+    ignore_files = arguments.get("ignore_files")
+    if ignore_files is None:
+        ignore_files = DEFAULT_IGNORE_FILES
+        if arguments.get("use_gitignore"):
+            ignore_files += (GITIGNORE,)
+    return {
+        "matcher": create_matcher(extensions, arguments.get("include") or (),
+                                  arguments.get("exclude") or ()),
+        "ignore_files": tuple(ignore_files),
+        "recursive": bool(arguments["recursive"]),
+        "workers": int(arguments.get("walk_workers") or 1),
+    }
+
+def write_text_if_changed(file_path, text, original=None):
+    """
+    Writing text to file_path (utf-8, platform line endings like open(file_path, 'w')).
+    If the file already has this content, it is left untouched, so its modification
+    time is kept and build systems do not rebuild it.
+    original: content of the file read with newline='' (avoids reading it again)
+    The file is written atomically: into a temporary file within the same directory,
+    which replaces the file afterwards (keeping its permissions).
+    Returns True, if the file was written.
+    """
+    if os.linesep != "\n":
+        text = text.replace("\n", os.linesep)
+    if original is None:
+        try:
+            with open(file_path, "r", encoding="utf-8", newline="") as f:
+                original = f.read()
+        except (OSError, UnicodeDecodeError):
+            original = None
+    if original == text:
+        return False
+
+    # a symbolic link is kept, its target is replaced
+    target = os.path.realpath(file_path)
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(target),
+                                    prefix=f".{os.path.basename(target)}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8", newline="") as f:
+            f.write(text)
+        if os.path.exists(target):
+            shutil.copymode(target, tmp_path)
+        os.replace(tmp_path, target)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    return True
@@ -0,0 +1,243 @@
+# CppCodeDoc — Licensed under the GNU General Public License v3.0 (GPLv3-or-later)
+# SPDX-License-Identifier: GPLv3-or-later
+# Copyright (C) 2025 Jojo1220
+# See https://www.gnu.org/licenses/gpl-3.0.html
+
+"""
+Fast discovery of source files within large directory trees.
+The tree is walked by os.scandir, all filters (extensions, include/exclude
+patterns and .gitignore-style ignore files) are compiled into one regular
+expression per directory scope. Excluded directories are pruned before descent,
+so e.g. build/, .git/ or third_party/ are never listed.
+
+Patterns follow the .gitignore syntax (relative to the walked directory,
+or to the directory of the ignore file):
+    *.gen.h         file name at any depth
+    /main.cpp       anchored at the base directory
+    build/          directories only (and everything below)
+    src/**/test_*   ** matches any number of directories
+    !keep.h         negation, re-including a path (and everything below it)
+                    matched by another pattern
+Unlike git, a negated pattern wins regardless of its position.
+"""
+
+import os
+import re
+from concurrent.futures import ThreadPoolExecutor
+
+DEFAULT_EXTENSIONS = (".cpp", ".h", ".hpp", ".cxx", ".ino")
+DEFAULT_IGNORE_FILES = (".cppcodedocignore",)
+# respected in addition to the default ignore files only on request (use_gitignore)
+GITIGNORE = ".gitignore"
+# version control directories are never walked
+VCS_DIRECTORIES = (".git/", ".svn/", ".hg/")
+
+def glob_to_regex(pattern):
+    """
+    Converting a single .gitignore-style glob (without "!" and trailing "/")
+    into a regular expression, matching a path relative to the base directory.
+    """
+    anchored = "/" in pattern.rstrip("/")
+    pattern = pattern.lstrip("/")
+    regex, i = "", 0
+    while i < len(pattern):
+        char = pattern[i]
+        if pattern.startswith("**/", i):
+            regex += "(?:.*/)?"
+            i += 3
+            continue
+        if pattern.startswith("**", i):
+            regex += ".*"
+            i += 2
+            continue
+        if char == "*":
+            regex += "[^/]*"
+        elif char == "?":
+            regex += "[^/]"
+        elif char == "[":
+            end = pattern.find("]", i + 2)
+            if end == -1:
+                regex += re.escape(char)
+            else:
+                content = pattern[i + 1:end]
+                if content.startswith("!"):
+                    content = "^" + content[1:]
+                regex += f"[{content.replace(chr(92), chr(92) * 2)}]"
+                i = end
+        elif char == "\\" and i + 1 < len(pattern):
+            i += 1
+            regex += re.escape(pattern[i])
+        else:
+            regex += re.escape(char)
+        i += 1
+    # patterns without "/" match the name at any depth
+    return regex if anchored else "(?:.*/)?" + regex
+
+class PathMatcher:
+    """
+    Compiled filter of a directory scope.
+    A rule is (regex, negated, directory_only) with the regex relative to the
+    walked directory. All rules are combined into one regex for files and one
+    regex for directories, a path below an excluded directory is excluded as well.
+    """
+    def __init__(self, extensions=DEFAULT_EXTENSIONS, include=(), rules=()):
+        self.extensions = tuple(extensions)
+        self.include = tuple(include)
+        self.rules = tuple(rules)
+        self.file_regex = self._compile(directory=False)
+        self.dir_regex = self._compile(directory=True)
+
+    def _compile(self, directory):
+        """
+        Combining the rules into one regex: excluded (and not re-included) paths
+        do not match, files have to match an extension and an include pattern.
+        """
+        # a rule excludes the path itself and everything below it,
+        # a directory-only rule excludes a file only below the directory
+        parts, negated = [], []
+        for regex, is_negated, directory_only in self.rules:
+            if is_negated:
+                if directory or not directory_only:
+                    negated.append(regex)
+            elif directory or not directory_only:
+                parts.append(r"(?:%s)(?:/.*)?$" % regex)
+            else:
+                parts.append(r"(?:%s)/.*$" % regex)
+        regex = "^"
+        if parts:
+            exclusion = "|".join(parts)
+            if negated:
+                exclusion = r"(?!(?:%s)(?:/.*)?$)(?:%s)" % ("|".join(negated), exclusion)
+            regex += r"(?!%s)" % exclusion
+        if not directory:
+            if self.include:
+                regex += r"(?=(?:%s)(?:/.*)?$)" % "|".join(self.include)
+            regex += r"(?=.*(?:%s)$)" % "|".join(re.escape(ext) for ext in self.extensions)
+        return re.compile(regex + ".*$", re.DOTALL)
+
+    def extended(self, lines, base=""):
+        """
+        Returning a matcher with the additional rules of lines (content of an ignore
+        file or exclude patterns). base: directory of the ignore file relative to
+        the walked directory ("" for the walked directory itself).
+        """
+        rules = list(self.rules)
+        prefix = re.escape(base + "/") if base else ""
+        for line in lines:
+            line = line.rstrip("\n").rstrip("\r")
+            if not line.strip() or line.startswith("#"):
+                continue
+            if not line.endswith("\\ "):
+                line = line.rstrip()
+            negated = line.startswith("!")
+            line = line[1:] if negated else line
+            if line.startswith("\\#") or line.startswith("\\!"):
+                line = line[1:]
+            directory_only = line.endswith("/")
+            rules.append((prefix + glob_to_regex(line.rstrip("/")), negated, directory_only))
+        return PathMatcher(self.extensions, self.include, rules)
+
+    def match_file(self, relative_path):
+        """
+        Checking if a file (path relative to the walked directory, "/" separated) is selected.
+        """
+        return self.file_regex.match(relative_path) is not None
+
+    def match_dir(self, relative_path):
+        """
+        Checking if a directory has to be walked.
+        """
+        return self.dir_regex.match(relative_path) is not None
+
+def create_matcher(extensions=DEFAULT_EXTENSIONS, include=(), exclude=()):
+    """
+    Creating the matcher of the walked directory out of extensions,
+    include and exclude patterns (see module description).
+    """
+    include = [glob_to_regex(pattern.rstrip("/")) for pattern in include]
+    return PathMatcher(extensions, include).extended(VCS_DIRECTORIES + tuple(exclude))
+
+def read_ignore_file(path):
+    """
+    Returning the lines of an ignore file (empty, if it can not be read).
+    """
+    try:
+        with open(path, "r", encoding="utf-8", errors="replace") as f:
+            return f.readlines()
+    except OSError:
+        return []
+
+def scan_directory(directory, relative_dir, matcher, ignore_files, recursive):
+    """
+    Listing a single directory: returns the selected files (sorted) and the
+    subdirectories to walk as (path, relative path, matcher).
+    The ignore files of the directory are applied to its entries and all subdirectories.
+    """
+    try:
+        with os.scandir(directory) as it:
+            entries = sorted(it, key=lambda entry: entry.name)
+    except OSError:
+        # like os.walk: directories which can not be listed are skipped
+        return [], []
+
+    names = {entry.name for entry in entries}
+    for ignore_file in ignore_files:
+        if ignore_file in names:
+            matcher = matcher.extended(
+                read_ignore_file(os.path.join(directory, ignore_file)), relative_dir)
+
+    files, subdirs = [], []
+    for entry in entries:
+        relative_path = f"{relative_dir}/{entry.name}" if relative_dir else entry.name
+        try:
+            is_dir = entry.is_dir()
+        except OSError:
+            is_dir = False
+        if is_dir:
+            # symbolic links to directories are not followed (like os.walk)
+            if recursive and not entry.is_symlink() and matcher.match_dir(relative_path):
+                subdirs.append((entry.path, relative_path, matcher))
+        elif matcher.match_file(relative_path):
+            files.append(entry.path)
+    return files, subdirs
+
+def scan_tree(path, matcher=None, ignore_files=DEFAULT_IGNORE_FILES, recursive=True, workers=1):
+    """
+    Listing all walked directories below path (excluded directories are pruned).
+    Returns a dict directory -> (selected files, walked subdirectories).
+    workers > 1 lists the directories of each tree level in parallel threads.
+    """
+    matcher = matcher or create_matcher()
+    results = {}
+    level = [(path, "", matcher)]
+    executor = ThreadPoolExecutor(max_workers=workers) if workers > 1 else None
+    try:
+        while level:
+            scan = lambda item: scan_directory(item[0], item[1], item[2], ignore_files, recursive)
+            scanned = list(executor.map(scan, level) if executor else map(scan, level))
+            next_level = []
+            for (directory, _, _), (files, subdirs) in zip(level, scanned):
+                results[directory] = (files, [subdir[0] for subdir in subdirs])
+                next_level.extend(subdirs)
+            level = next_level
+    finally:
+        if executor:
+            executor.shutdown()
+    return results
+
+def walk_source_files(path, matcher=None, ignore_files=DEFAULT_IGNORE_FILES, recursive=True,
+                      workers=1):
+    """
+    Returning all selected files below path in a deterministic order
+    (per directory: files sorted by name, then the subdirectories sorted by name).
+    workers > 1 lists the directories of each tree level in parallel threads
+    (useful for large trees, e.g. on network drives), the result is the same.
+    """
+    results = scan_tree(path, matcher, ignore_files, recursive, workers)
+
+    source_files, stack = [], [path]
+    while stack:
+        files, subdirs = results[stack.pop()]
+        source_files.extend(files)
+        stack.extend(reversed(subdirs))
+    return source_files
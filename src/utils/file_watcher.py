@@ -0,0 +1,207 @@
+# CppCodeDoc — Licensed under the GNU General Public License v3.0 (GPLv3-or-later)
+# SPDX-License-Identifier: GPLv3-or-later
+# Copyright (C) 2025 Jojo1220
+# See https://www.gnu.org/licenses/gpl-3.0.html
+
+"""
+Monitoring of a source directory for the watch mode (--watch).
+On Linux the kernel notifications (inotify, by ctypes) are used, otherwise
+the walked files are polled (modification time and size). Bursts of changes
+(e.g. "save all" within the editor) are collected until no further change
+occurs for the debounce time, then all changed paths are returned at once.
+"""
+
+import os
+import sys
+import time
+import errno
+import select
+import struct
+import ctypes
+import ctypes.util
+
+from utils.file_walker import scan_tree, walk_source_files
+
+DEFAULT_DEBOUNCE = 0.3
+DEFAULT_POLL_INTERVAL = 0.25
+
+class Watcher:
+    """
+    Base class of the watchers. poll(timeout) has to return the paths changed
+    since the last call (waiting up to timeout seconds for a change).
+    """
+    def __init__(self, path, walk_settings, debounce=DEFAULT_DEBOUNCE):
+        self.path = path
+        self.walk_settings = walk_settings
+        self.debounce = debounce
+
+    def poll(self, timeout):
+        raise NotImplementedError
+
+    def wait_for_changes(self, timeout=None):
+        """
+        Waiting for changed files. Returns the set of changed paths as soon as no
+        further change occurred for the debounce time, or an empty set if nothing
+        changed within timeout seconds (None: waiting without limit).
+        """
+        changes, last_change = set(), None
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            now = time.monotonic()
+            if changes:
+                wait = last_change + self.debounce - now
+            elif deadline is None:
+                wait = 1.0
+            else:
+                wait = deadline - now
+            if wait <= 0 and (changes or deadline is not None):
+                return changes
+            changed = self.poll(max(0.0, wait))
+            if changed:
+                changes |= changed
+                last_change = time.monotonic()
+
+    def close(self):
+        """
+        Releasing the resources of the watcher.
+        """
+
+class PollingWatcher(Watcher):
+    """
+    Watcher comparing the modification time and size of all walked files.
+    """
+    def __init__(self, path, walk_settings, debounce=DEFAULT_DEBOUNCE,
+                 interval=DEFAULT_POLL_INTERVAL):
+        super().__init__(path, walk_settings, debounce)
+        self.interval = interval
+        self.snapshot = self.take_snapshot()
+
+    def take_snapshot(self):
+        """
+        Returning path -> (mtime, size) of all walked files.
+        """
+        snapshot = {}
+        for file_path in walk_source_files(self.path, **self.walk_settings):
+            try:
+                stat = os.stat(file_path)
+            except OSError:
+                continue
+            snapshot[file_path] = (stat.st_mtime_ns, stat.st_size)
+        return snapshot
+
+    def poll(self, timeout):
+        time.sleep(min(timeout, self.interval))
+        snapshot = self.take_snapshot()
+        changed = {path for path in snapshot.keys() | self.snapshot.keys()
+                   if snapshot.get(path) != self.snapshot.get(path)}
+        self.snapshot = snapshot
+        return changed
+
+# inotify event masks (see inotify(7))
+IN_MODIFY = 0x00000002
+IN_ATTRIB = 0x00000004
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ISDIR = 0x40000000
+IN_WATCH_MASK = (IN_MODIFY | IN_ATTRIB | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO
+                 | IN_CREATE | IN_DELETE)
+EVENT_HEADER = struct.Struct("iIII")
+
+def load_inotify():
+    """
+    Returning the C library with the inotify functions, or None if not available.
+    """
+    if not sys.platform.startswith("linux"):
+        return None
+    try:
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        if all(hasattr(libc, name) for name in
+               ("inotify_init1", "inotify_add_watch", "inotify_rm_watch")):
+            return libc
+    except OSError:
+        pass
+    return None
+
+class InotifyWatcher(Watcher):
+    """
+    Watcher based on inotify. All walked directories are watched (excluded
+    directories are not), directories created later are added on the fly.
+    """
+    def __init__(self, path, walk_settings, debounce=DEFAULT_DEBOUNCE, libc=None):
+        super().__init__(path, walk_settings, debounce)
+        self.libc = libc or load_inotify()
+        self.fd = self.libc.inotify_init1(os.O_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        self.directories = {}
+        self.extensions = walk_settings["matcher"].extensions
+        try:
+            self.add_tree(path)
+        except OSError:
+            self.close()
+            raise
+
+    def add_tree(self, directory):
+        """
+        Watching a directory and all walked subdirectories.
+        """
+        for walked in scan_tree(directory, **self.walk_settings):
+            wd = self.libc.inotify_add_watch(self.fd, os.fsencode(walked), IN_WATCH_MASK)
+            if wd >= 0:
+                self.directories[wd] = walked
+            elif ctypes.get_errno() not in (errno.ENOENT, errno.EACCES):
+                raise OSError(ctypes.get_errno(), f"inotify_add_watch failed for {walked}")
+
+    def poll(self, timeout):
+        readable, _, _ = select.select([self.fd], [], [], timeout)
+        if not readable:
+            return set()
+        data = os.read(self.fd, 64 * 1024)
+        changed, offset = set(), 0
+        while offset < len(data):
+            wd, mask, _, length = EVENT_HEADER.unpack_from(data, offset)
+            offset += EVENT_HEADER.size
+            name = os.fsdecode(data[offset:offset + length].rstrip(b"\0"))
+            offset += length
+            if mask & IN_Q_OVERFLOW:
+                # events were lost: all watched files are treated as changed
+                changed.update(walk_source_files(self.path, **self.walk_settings))
+                continue
+            if mask & IN_IGNORED:
+                self.directories.pop(wd, None)
+                continue
+            directory = self.directories.get(wd)
+            if directory is None or not name:
+                continue
+            event_path = os.path.join(directory, name)
+            if mask & IN_ISDIR:
+                if mask & (IN_CREATE | IN_MOVED_TO):
+                    # files of a new directory are reported as changed
+                    self.add_tree(event_path)
+                    changed.update(walk_source_files(event_path, **self.walk_settings))
+            elif name.endswith(self.extensions):
+                changed.add(event_path)
+        return changed
+
+    def close(self):
+        if self.fd >= 0:
+            os.close(self.fd)
+            self.fd = -1
+
+def create_watcher(path, walk_settings, debounce=DEFAULT_DEBOUNCE, polling=False):
+    """
+    Creating the watcher of path: inotify if available, otherwise polling.
+    walk_settings: settings of the file walker (see get_walk_settings)
+    """
+    if not polling and load_inotify() is not None:
+        try:
+            return InotifyWatcher(path, walk_settings, debounce)
+        except OSError:
+            # e.g. the limit of inotify watches is reached
+            pass
+    return PollingWatcher(path, walk_settings, debounce)
@@ -0,0 +1,77 @@
+# CppCodeDoc — Licensed under the GNU General Public License v3.0 (GPLv3-or-later)
+# SPDX-License-Identifier: GPLv3-or-later
+# Copyright (C) 2025 Jojo1220
+# See https://www.gnu.org/licenses/gpl-3.0.html
+
+"""
+Bounded memoization (least recently used) of pure string functions of the
+parser and doxygen generator, which are called again and again with equal
+arguments (e.g. parameter lists like "const std::string& name" or "void").
+The hits and misses of every memoized function are counted, they are printed
+within the summary at the end of a CLI run (see RunProfile).
+"""
+
+from functools import lru_cache, wraps
+
+DEFAULT_MAXSIZE = 4096
+
+# lru_cache wrappers of all memoized functions (a module imported twice, e.g. as
+# formatter.x and src.formatter.x, registers its functions twice)
+MEMOIZED = []
+
+def memoize(maxsize=DEFAULT_MAXSIZE, bypass=None, copy=None):
+    """
+    Decorator memoizing a function with hashable arguments (lru_cache with maxsize entries).
+    The return values are shared between the callers, so they must not be modified.
+    bypass: optional callable, if it returns True the function is called without the
+            cache (e.g. while tracing is enabled, so the trace output is complete)
+    copy: optional callable, which is applied to every returned value (e.g. list, so
+          every caller gets its own list out of a cached tuple)
+    """
+    def decorator(func):
+        cached = lru_cache(maxsize=maxsize)(func)
+        MEMOIZED.append(cached)
+        if bypass is None and copy is None:
+            return cached
+
+        @wraps(func)
+        def wrapper(*args):
+            if bypass is not None and bypass():
+                result = func(*args)
+            else:
+                result = cached(*args)
+            return result if copy is None else copy(result)
+        wrapper.cache_info = cached.cache_info
+        wrapper.cache_clear = cached.cache_clear
+        return wrapper
+    return decorator
+
+def get_memo_stats():
+    """
+    Returning the counters of all memoized functions of this process
+    as dict name -> {"hits", "misses"}.
+    """
+    stats = {}
+    for cached in MEMOIZED:
+        info = cached.cache_info()
+        counts = stats.setdefault(cached.__wrapped__.__name__, {"hits": 0, "misses": 0})
+        counts["hits"] += info.hits
+        counts["misses"] += info.misses
+    return stats
+
+def diff_memo_stats(before, after=None):
+    """
+    Returning the counters, which were added since the stats before were taken
+    (e.g. by a single file within a worker process).
+    """
+    after = get_memo_stats() if after is None else after
+    empty = {"hits": 0, "misses": 0}
+    return {name: {key: value - before.get(name, empty)[key] for key, value in counts.items()}
+            for name, counts in after.items()}
+
+def clear_memo_caches():
+    """
+    Clearing the entries and counters of all memoized functions.
+    """
+    for cached in MEMOIZED:
+        cached.cache_clear()
@@ -0,0 +1,11 @@
+# CppCodeDoc — Licensed under the GNU General Public License v3.0 (GPLv3-or-later)
+# SPDX-License-Identifier: GPLv3-or-later
+# Copyright (C) 2025 Jojo1220
+# See https://www.gnu.org/licenses/gpl-3.0.html
+
+import os
+import sys
+
+# Application modules are importing each other relative to ./src (e.g. "formatter.code_parser"),
+# therefore ./src has to be available for every test module, independent of collection order.
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', "src")))
@@ -102,3 +102,13 @@ def test_multilin_comment_on_next_line_after_closing_brace(mock_find_end_line):
     ]
     updated = add_post_comment(lines[:], "processTest", 0)
     assert updated == expected
+
+@patch("src.formatter.code_parser.find_function_end_line")
+def test_comment_markers_within_string(mock_find_end_line):
+    lines = [
+        "const char* url() {",
+        '  return "http://host/*"; }'
+    ]
+    mock_find_end_line.return_value = 1
+    updated = add_post_comment(lines[:], "url", 0)
+    assert updated[1] == '  return "http://host/*"; } /* url() */'
@@ -0,0 +1,153 @@
+# CppCodeDoc — Licensed under the GNU General Public License v3.0 (GPLv3-or-later)
+# SPDX-License-Identifier: GPLv3-or-later
+# Copyright (C) 2025 Jojo1220
+# See https://www.gnu.org/licenses/gpl-3.0.html
+
+import sys
+import os
+import stat
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', "src")))
+from formatter.backup_store import BackupStore, create_backup_store
+from formatter.doc_generator import generate_documentation
+
+def write_sources(tmp_path, names, content="int func(int a) {\n    return a;\n}\n"):
+    source_files = []
+    for name in names:
+        source = tmp_path / "src" / name
+        source.parent.mkdir(parents=True, exist_ok=True)
+        source.write_text(content)
+        source_files.append(str(source))
+    return source_files
+
+def blobs(store):
+    return sorted(file for _, _, files in os.walk(store.objects_dir) for file in files)
+
+@pytest.fixture
+def arguments(tmp_path):
+    return {
+        "readonly": False,
+        "headerCommentStyle": "doxygen",
+        "backup_path": str(tmp_path / "backup"),
+        "cache": False,
+    }
+
+@pytest.mark.parametrize("compress", [False, True])
+def test_equal_contents_are_stored_once(tmp_path, compress):
+    source_files = write_sources(tmp_path, ["a/main.cpp", "b/main.cpp", "c.cpp"])
+    store = BackupStore(str(tmp_path / "backup"), compress, run_id="run1")
+
+    digests = [store.add(path) for path in source_files]
+
+    assert len(set(digests)) == 1
+    assert len(blobs(store)) == 1
+    assert blobs(store)[0].endswith(".gz") is compress
+    assert store.get_run("run1") == dict.fromkeys(source_files, digests[0])
+    assert store.read_blob(digests[0]) == b"int func(int a) {\n    return a;\n}\n"
+
+def test_same_named_files_are_restored(tmp_path):
+    first, second = write_sources(tmp_path, ["a/main.cpp", "b/main.cpp"])
+    with open(second, "w", encoding="utf-8") as f:
+        f.write("int other();\n")
+    store = BackupStore(str(tmp_path / "backup"))
+    store.add(first)
+    with open(second, "r", encoding="utf-8", newline="") as f:
+        store.add(second, f.read())
+
+    for path in (first, second):
+        with open(path, "w", encoding="utf-8") as f:
+            f.write("// edited\n")
+    os.remove(first)
+
+    assert sorted(store.restore()) == [first, second]
+    assert open(first, encoding="utf-8").read() == "int func(int a) {\n    return a;\n}\n"
+    assert open(second, encoding="utf-8").read() == "int other();\n"
+    # unchanged files are not written again
+    assert store.restore() == []
+
+def test_restore_selected_file_of_older_run(tmp_path):
+    source, other = write_sources(tmp_path, ["main.cpp", "other.cpp"])
+    old_run = BackupStore(str(tmp_path / "backup"), run_id="20250101-000000-1")
+    old_run.add(source)
+    old_run.add(other)
+    with open(source, "w", encoding="utf-8") as f:
+        f.write("// edited\n")
+    BackupStore(str(tmp_path / "backup"), run_id="20250102-000000-1").add(source)
+    with open(other, "w", encoding="utf-8") as f:
+        f.write("// edited\n")
+
+    assert old_run.list_runs() == ["20250101-000000-1", "20250102-000000-1"]
+    assert old_run.restore(files=[source]) == []
+    assert old_run.restore("20250101-000000-1", files=[source]) == [source]
+    assert open(other, encoding="utf-8").read() == "// edited\n"
+
+def test_corrupted_blob_is_not_restored(tmp_path):
+    source = write_sources(tmp_path, ["main.cpp"])[0]
+    store = BackupStore(str(tmp_path / "backup"))
+    path = store.blob_path(store.add(source))
+    os.chmod(path, 0o644)
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("corrupted")
+    os.remove(source)
+
+    with pytest.raises(ValueError):
+        store.restore()
+    assert not os.path.exists(source)
+
+def test_prune_keeps_blobs_of_remaining_runs(tmp_path):
+    source = write_sources(tmp_path, ["main.cpp"])[0]
+    for run in range(4):
+        with open(source, "w", encoding="utf-8") as f:
+            f.write(f"int version{run % 2}();\n")
+        BackupStore(str(tmp_path / "backup"), run_id=f"run{run}").add(source)
+    with open(source, "w", encoding="utf-8") as f:
+        f.write("int version2();\n")
+    store = BackupStore(str(tmp_path / "backup"), run_id="run4")
+    store.add(source)
+
+    assert store.prune(keep_runs=2) == 1
+    assert store.list_runs() == ["run3", "run4"]
+    assert len(blobs(store)) == 2
+    assert store.prune(keep_runs=2) == 0
+
+def test_prune_removes_read_only_blobs(tmp_path, monkeypatch):
+    source = write_sources(tmp_path, ["main.cpp"])[0]
+    for run in range(3):
+        with open(source, "w", encoding="utf-8") as f:
+            f.write(f"int version{run}();\n")
+        BackupStore(str(tmp_path / "backup"), run_id=f"run{run}").add(source)
+    store = BackupStore(str(tmp_path / "backup"))
+    remove = os.remove
+
+    def remove_like_windows(path):
+        # read-only files can not be deleted on Windows
+        if not os.stat(path).st_mode & stat.S_IWRITE:
+            raise PermissionError(f"read-only file: {path}")
+        remove(path)
+    monkeypatch.setattr(os, "remove", remove_like_windows)
+
+    assert store.prune(keep_runs=1) == 2
+    assert blobs(store) == [os.path.basename(path) for path in store.get_run("run2").values()]
+
+def test_documentation_run_backs_up_changes_only(arguments, tmp_path):
+    source_files = write_sources(tmp_path, ["a.cpp", "b.cpp", "c.cpp"])
+    store = create_backup_store(arguments)
+    original = open(source_files[0], encoding="utf-8").read()
+
+    generate_documentation(arguments, source_files)
+    first_blobs = blobs(store)
+    generate_documentation(arguments, source_files)
+
+    runs = store.list_runs()
+    assert len(first_blobs) == 1
+    # the documented files of the first run are equal as well
+    assert len(blobs(store)) == 2
+    assert len(runs) == 2
+    store.restore(runs[0])
+    assert all(open(path, encoding="utf-8").read() == original for path in source_files)
+
+def test_backup_store_settings(arguments):
+    assert create_backup_store(dict(arguments, readonly=True)) is None
+    assert create_backup_store(dict(arguments, backup_path=None)) is None
+    assert create_backup_store(dict(arguments, backup_compress=True)).compress is True
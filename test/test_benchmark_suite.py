@@ -0,0 +1,59 @@
+# CppCodeDoc — Licensed under the GNU General Public License v3.0 (GPLv3-or-later)
+# SPDX-License-Identifier: GPLv3-or-later
+# Copyright (C) 2025 Jojo1220
+# See https://www.gnu.org/licenses/gpl-3.0.html
+
+import sys
+import os
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', "scripts")))
+from corpus_generator import corpus_options, generate_corpus, write_corpus
+from benchmark_suite import BENCHMARKS, compare_results, run_benchmarks
+from formatter.code_parser import extract_functions_from_string
+
+def test_corpus_is_deterministic():
+    options = {"files": 3, "pathological": 2, "pathological_length": 300}
+
+    assert generate_corpus(options, seed=7) == generate_corpus(options, seed=7)
+    assert generate_corpus(options, seed=7) != generate_corpus(options, seed=8)
+
+def test_corpus_options():
+    assert corpus_options(files=2, density=None)["files"] == 2
+    with pytest.raises(ValueError):
+        corpus_options(unknown=1)
+    with pytest.raises(ValueError):
+        corpus_options(comment_style="fancy")
+
+@pytest.mark.parametrize("comment_style", ["none", "line", "block", "doxygen"])
+def test_corpus_functions_are_found(comment_style):
+    options = {"files": 1, "functions": 12, "overloads": 1, "template_depth": 2,
+               "comment_style": comment_style, "pathological": 6, "pathological_length": 500}
+    _, text = generate_corpus(options, seed=3)[0]
+
+    names = {func["name"] for func in extract_functions_from_string(text)}
+
+    assert names == {f"func_0_{i}" for i in range(12)}
+
+def test_write_corpus(tmp_path):
+    paths = write_corpus(str(tmp_path / "corpus"), {"files": 2, "functions": 3})
+
+    assert [os.path.basename(path) for path in paths] == ["file_0000.cpp", "file_0001.cpp"]
+    assert all(os.path.getsize(path) > 0 for path in paths)
+
+def test_run_benchmarks():
+    results = run_benchmarks({"files": 1, "functions": 4}, repeat=1)
+
+    assert list(results["benchmarks"]) == list(BENCHMARKS)
+    for result in results["benchmarks"].values():
+        assert len(result["runs"]) == 1
+        assert result["best"] > 0
+        assert result["units"] > 0
+
+def test_compare_results_flags_regressions():
+    baseline = {"benchmarks": {"a": {"best": 1.0}, "b": {"best": 1.0}, "c": {"best": 1.0}}}
+    results = {"benchmarks": {"a": {"best": 1.05}, "b": {"best": 1.5}, "new": {"best": 1.0}}}
+
+    rows = compare_results(baseline, results, threshold=0.1)
+
+    assert [(name, regression) for name, _, _, _, regression in rows] == [("a", False), ("b", True)]
@@ -0,0 +1,81 @@
+# CppCodeDoc — Licensed under the GNU General Public License v3.0 (GPLv3-or-later)
+# SPDX-License-Identifier: GPLv3-or-later
+# Copyright (C) 2025 Jojo1220
+# See https://www.gnu.org/licenses/gpl-3.0.html
+
+import sys
+import os
+from unittest.mock import patch
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from src.formatter.brace_map import BraceMap
+from src.formatter.code_parser import find_function_end_line, add_post_comment
+
+CODE = """\
+namespace demo {
+int add(int a, int b) { return a + b; }
+
+/* unbalanced { within a comment */
+void print(const char* text)
+{
+    printf("{%s", text); // closing } in a comment
+    char c = '}';
+    if (text) {
+        while (false) { }
+    }
+}
+
+/*
+ * }
+ */
+bool check(int a,
+           int b) {
+    return a > b;
+} // end of check
+
+void open() {
+"""
+
+def test_end_line_matches_find_function_end_line():
+    lines = CODE.splitlines()
+    brace_map = BraceMap(lines)
+
+    for start_line in range(len(lines)):
+        assert brace_map.end_line(start_line) == find_function_end_line(lines, start_line)
+
+def test_end_line_out_of_range():
+    brace_map = BraceMap(CODE.splitlines())
+
+    assert brace_map.end_line(-1) is None
+    assert brace_map.end_line(len(CODE.splitlines())) is None
+
+def test_brace_map_is_used_for_end_line():
+    lines = CODE.splitlines()
+    brace_map = BraceMap(lines)
+
+    with patch("src.formatter.code_parser.remove_strings_and_comments") as scan:
+        assert find_function_end_line(lines, 4, brace_map) == 11
+    scan.assert_not_called()
+
+def test_post_comments_keep_brace_map_in_sync():
+    lines = CODE.splitlines()
+    brace_map = BraceMap(lines)
+
+    lines = add_post_comment(lines, "add", 1, brace_map)
+    lines = add_post_comment(lines, "print", 4, brace_map)
+    lines = add_post_comment(lines, "check", 16, brace_map)
+
+    assert lines[1].endswith("/* add() */")
+    assert lines[11] == "} /* print() */"
+    assert lines[19] == "} /* end of check */"
+    for start_line in range(len(lines)):
+        assert brace_map.end_line(start_line) == find_function_end_line(lines, start_line)
+
+def test_update_line_rebuilds_on_changed_braces():
+    lines = ["void f() {", "// }", "}"]
+    brace_map = BraceMap(lines)
+    assert brace_map.end_line(0) == 2
+
+    lines[1] = "}"
+    brace_map.update_line(lines, 1)
+    assert brace_map.end_line(0) == 1
@@ -0,0 +1,57 @@
+# CppCodeDoc — Licensed under the GNU General Public License v3.0 (GPLv3-or-later)
+# SPDX-License-Identifier: GPLv3-or-later
+# Copyright (C) 2025 Jojo1220
+# See https://www.gnu.org/licenses/gpl-3.0.html
+
+import os
+import sys
+import json
+import argparse
+import subprocess
+import pytest
+
+SRC_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', "src"))
+
+# the console application (--NoGui) is started several hundred times a day by hooks
+IMPORT_TIME_BUDGET = 1.5
+
+IMPORT_SCRIPT = """
+import sys, json, time
+sys.path.insert(0, sys.argv[1])
+start = time.perf_counter()
+import CppCodeDoc
+duration = time.perf_counter() - start
+gui_modules = [name for name in ("PyQt5", "requests", "markdown", "gui.main_window")
+               if name in sys.modules]
+# NumPy is only imported for the line analysis of large files
+optional_modules = [name for name in ("numpy",) if name in sys.modules]
+print(json.dumps({"duration": duration, "gui_modules": gui_modules,
+                  "optional_modules": optional_modules}))
+"""
+
+def import_application():
+    # fresh interpreter, so modules imported by other tests are not counted
+    result = subprocess.run([sys.executable, "-c", IMPORT_SCRIPT, SRC_DIR],
+                            capture_output=True, text=True, check=True)
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+def test_console_mode_does_not_import_gui_modules():
+    assert import_application()["gui_modules"] == []
+
+def test_console_mode_does_not_import_numpy():
+    assert import_application()["optional_modules"] == []
+
+def test_import_time_budget():
+    duration = min(import_application()["duration"] for _ in range(3))
+
+    assert duration < IMPORT_TIME_BUDGET, f"import took {duration:.2f}s"
+
+def test_jobs_argument_accepts_config_values():
+    sys.path.insert(0, SRC_DIR)
+    from CppCodeDoc import jobs_argument
+
+    assert jobs_argument("4") == 4
+    assert jobs_argument("auto") == (os.cpu_count() or 1)
+    assert jobs_argument("0") == (os.cpu_count() or 1)
+    with pytest.raises(argparse.ArgumentTypeError):
+        jobs_argument("many")
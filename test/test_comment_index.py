@@ -0,0 +1,88 @@
+# CppCodeDoc — Licensed under the GNU General Public License v3.0 (GPLv3-or-later)
+# SPDX-License-Identifier: GPLv3-or-later
+# Copyright (C) 2025 Jojo1220
+# See https://www.gnu.org/licenses/gpl-3.0.html
+
+import sys
+import os
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', "src")))
+from formatter.comment_index import CommentIndex
+from formatter.code_parser import (
+    extract_multiline_comments, is_in_comment_block, is_inside_multiline_comment,
+    sync_multiline_comments_to_joined_lines)
+
+CODE = """\
+/*
+ * header
+ */
+int add(int a, int b) { return a + b; } /* inline */
+
+/* single line */
+void print(const char* text)
+{
+    /* opened
+       and closed */ run();
+}
+/* not closed
+void dead() {}
+"""
+
+def test_from_lines_matches_is_inside_multiline_comment():
+    lines = CODE.splitlines()
+    comment_index = CommentIndex.from_lines(lines)
+
+    inside = [idx for idx in range(len(lines)) if is_inside_multiline_comment(lines, idx)]
+    assert inside == [0, 1, 8, 11, 12]
+    for idx in range(len(lines)):
+        assert comment_index.contains(idx) == (idx in inside)
+    assert is_inside_multiline_comment(lines, 1, comment_index) is True
+    assert is_inside_multiline_comment(lines, 3, comment_index) is False
+
+def test_comment_markers_within_strings():
+    lines = ['const char* a = "/*";', 'int b; // "*/" ', "char c = '/'; /* x */ int d;"]
+    comment_index = CommentIndex.from_lines(lines)
+
+    assert not any(comment_index.contains(idx) for idx in range(len(lines)))
+    assert comment_index.region_at(0, 17) == ((0, 16), (0, 20), "string")
+    assert comment_index.is_comment(1, 7) and not comment_index.is_comment(1, 6)
+    assert comment_index.strip_comments(2, lines[2]) == "char c = '/';  int d;"
+
+def test_regions_spanning_lines():
+    lines = CODE.splitlines()
+    comment_index = CommentIndex.from_lines(lines)
+
+    assert comment_index.region_at(9, 3) == ((8, 4), (9, 20), "comment")
+    assert comment_index.region_at(9, 21) is None
+    assert comment_index.strip_comments(9, lines[9]) == " run();"
+    # not closed until the end of the file
+    assert comment_index.region_at(12, 0) == ((11, 0), (len(lines), 0), "comment")
+
+def test_replace_line():
+    lines = ["void f() {", "}", "int x;"]
+    comment_index = CommentIndex.from_lines(lines)
+
+    lines[1] = "} /* f() */"
+    comment_index.replace_line(1, lines[1])
+
+    assert comment_index.regions == CommentIndex.from_lines(lines).regions
+
+def test_from_comments_matches_is_in_comment_block():
+    comments = extract_multiline_comments(CODE.splitlines())
+    comment_index = CommentIndex.from_comments(comments)
+
+    for idx in range(-1, len(CODE.splitlines()) + 1):
+        assert is_in_comment_block(idx, comment_index) == is_in_comment_block(idx, comments)
+
+def test_overlapping_intervals():
+    comment_index = CommentIndex([(5, 6), (0, 10), (2, 3)])
+
+    assert [idx for idx in range(-1, 13) if comment_index.contains(idx)] == list(range(0, 11))
+    assert not CommentIndex().contains(0)
+
+def test_sync_multiline_comments_to_joined_lines():
+    comments = [(0, 2, "a"), (5, 5, "b"), (8, 9, "c"), (11, 11, "d")]
+    final_startlines = [0, 1, 2, 4, 7, 8, 10]
+
+    assert sync_multiline_comments_to_joined_lines(comments, 12, final_startlines) == [
+        (0, 2, "a"), (3, 3, "b"), (5, 5, "c"), (6, 6, "d")]
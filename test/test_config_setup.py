@@ -141,4 +141,36 @@ def test_load_config_missing_document_section():
 
     assert config_test["document"]["title"] == "📄 Documentation"
     assert config_test["document"]["author"] == "Unknown"
-    assert "[configSetup] Missing key 'document' in section 'root' in config file 'dummy_path.yaml'" in errors
\ No newline at end of file
+    assert "[configSetup] Missing key 'document' in section 'root' in config file 'dummy_path.yaml'" in errors
+
+def test_load_config_optional_jobs(fake_config_dict):
+    with patch("builtins.open", mock_open(read_data="data")), \
+         patch("yaml.safe_load", return_value=fake_config_dict), \
+         patch("src.configSetup.configSetup.resource_path", side_effect=lambda a, b=None: a):
+
+        config_default, errors = load_config("dummy_path.yaml")
+
+    # optional key: no warning, if jobs is not specified
+    assert config_default["jobs"] == 1
+    assert errors is None
+
+    fake_config_dict["jobs"] = "auto"
+    with patch("builtins.open", mock_open(read_data="data")), \
+         patch("yaml.safe_load", return_value=fake_config_dict), \
+         patch("src.configSetup.configSetup.resource_path", side_effect=lambda a, b=None: a):
+
+        config_auto, _ = load_config("dummy_path.yaml")
+
+    assert config_auto["jobs"] == "auto"
+
+def test_load_config_optional_cache(fake_config_dict):
+    with patch("builtins.open", mock_open(read_data="data")), \
+         patch("yaml.safe_load", return_value=fake_config_dict), \
+         patch("src.configSetup.configSetup.resource_path", side_effect=lambda a, b=None: a):
+
+        config_default, errors = load_config("dummy_path.yaml")
+
+    assert config_default["cache"] is True
+    assert config_default["cache_path"] is None
+    assert config_default["cache_max_size"] == 256
+    assert errors is None
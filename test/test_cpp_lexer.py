@@ -0,0 +1,93 @@
+# CppCodeDoc — Licensed under the GNU General Public License v3.0 (GPLv3-or-later)
+# SPDX-License-Identifier: GPLv3-or-later
+# Copyright (C) 2025 Jojo1220
+# See https://www.gnu.org/licenses/gpl-3.0.html
+
+import sys
+import os
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from src.formatter.cpp_lexer import (
+    COMMENT, STRING, CHAR, PREPROCESSOR, tokenize, clean_line, clean_lines, TokenStream)
+
+CODE = """\
+int add(int a, int b) { return a + b; } // adds {
+/* block { comment
+   still } comment */ void open() {
+    const char* text = "{ // no comment";
+    char c = '}';
+    auto raw = R"json({
+        "key": "}"
+    })json";
+}
+"""
+
+def test_tokenize():
+    text = 'a = "x"; /* c */ b = \'y\'; // d'
+    tokens = [(kind, text[start:end]) for kind, start, end, _, _ in tokenize(text)]
+
+    assert tokens == [(STRING, '"x"'), (COMMENT, "/* c */"), (CHAR, "'y'"), (COMMENT, "// d")]
+
+def test_clean_lines():
+    cleaned, _ = clean_lines(CODE.splitlines())
+
+    assert cleaned == [
+        "int add(int a, int b) { return a + b; } ",
+        "",
+        " void open() {",
+        '    const char* text = "";',
+        "    char c = '';",
+        '    auto raw = ""',
+        "",
+        ";",
+        "}",
+    ]
+
+def test_states_of_multiline_tokens():
+    _, states = clean_lines(CODE.splitlines())
+
+    assert states[2] == (COMMENT, "*/")
+    assert states[6] == (STRING, ')json"')
+    assert states[7] == (STRING, ')json"')
+    assert [idx for idx, state in enumerate(states) if state] == [2, 6, 7]
+
+def test_clean_line_continues_states():
+    lines = CODE.splitlines()
+    cleaned, states = clean_lines(lines)
+
+    for idx, line in enumerate(lines):
+        assert clean_line(line, states[idx]) == (cleaned[idx], states[idx + 1])
+
+def test_unclosed_block_comment():
+    cleaned, states = clean_lines(["void f() { /* open", "}", "still open"])
+
+    assert cleaned == ["void f() { ", "", ""]
+    assert states == [None, (COMMENT, "*/"), (COMMENT, "*/"), (COMMENT, "*/")]
+    assert clean_line("/*/", None) == ("", (COMMENT, "*/"))
+
+def test_empty_input():
+    assert clean_lines([]) == ([], [None])
+
+def test_punctuation_and_preprocessor_tokens():
+    text = '#include <map>\nf(a<b) { "<" } // )'
+    tokens = [(kind, text[start:end]) for kind, start, end, _, _ in tokenize(text)]
+
+    assert tokens == [(PREPROCESSOR, "#"), ("<", "<"), (">", ">"), ("(", "("), ("<", "<"),
+                      (")", ")"), ("{", "{"), (STRING, '"<"'), ("}", "}"), (COMMENT, "// )")]
+
+def test_token_stream_lines():
+    lines = CODE.splitlines()
+    stream = TokenStream(lines)
+
+    assert (stream.code_lines, stream.states) == clean_lines(lines)
+    assert stream.tokens[1] == [(COMMENT, 0, len(lines[1]))]
+    assert stream.tokens[2][0] == (COMMENT, 0, 21)
+    assert [kind for kind, _, _ in stream.tokens[2][1:]] == ["(", ")", "{"]
+    assert [kind for kind, _, _ in stream.tokens[6]] == [STRING]
+
+def test_token_stream_directives():
+    lines = ["  #define MAX(a, b) \\", "    ((a) > (b))", "int x;", "/*", "#if 0 */"]
+    stream = TokenStream(lines)
+
+    assert stream.directives == [True, True, False, False, False]
+    assert stream.tokens[0][0] == (PREPROCESSOR, 0, 3)
@@ -6,11 +6,15 @@
 import sys
 import os
 import pytest
+import threading
 from pathlib import Path
 from unittest.mock import patch
+from concurrent.futures import ThreadPoolExecutor
 
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
-from src.formatter.doc_generator import generate_documentation
+import src.formatter.doc_generator as doc_generator
+from src.formatter.doc_generator import generate_documentation, get_jobs, CANCELLED
+from src.formatter.backup_store import BackupStore
 
 @pytest.fixture
 def arguments(tmp_path):
@@ -64,8 +68,10 @@ def test_generate_documentation_success(arguments, tmp_path):
         assert result == mock_functions
 
         # Check, if Backup was created successfull
-        backup_file = backup_dir / "test.cpp.bak"
-        assert backup_file.exists()
+        backup = BackupStore(str(backup_dir)).get_run()
+        assert list(backup) == [str(test_file)]
+        assert BackupStore(str(backup_dir)).read_blob(backup[str(test_file)]) == \
+            b"int main() { return 0; }"
 
 def test_generate_documentation_readonly(arguments, tmp_path):
     test_file = tmp_path / "test.cpp"
@@ -118,4 +124,139 @@ def test_generate_documentation_backup_fails(arguments, tmp_path):
          patch("src.formatter.doxygen_generator.generate_doxygen_comment"):
 
         result = generate_documentation(arguments, source_files)
-        assert result == expected_error
\ No newline at end of file
+        assert result == expected_error
+def write_sources(tmp_path, count):
+    source_files = []
+    for i in range(count):
+        source = tmp_path / f"file{i}.cpp"
+        source.write_text(f"int func{i}(int a) {{\n    return a + {i};\n}}\n")
+        source_files.append(str(source))
+    return source_files
+
+def test_generate_documentation_parallel_matches_serial(arguments, tmp_path):
+    arguments["backup_path"] = None
+    serial_dir = tmp_path / "serial"
+    parallel_dir = tmp_path / "parallel"
+    serial_dir.mkdir()
+    parallel_dir.mkdir()
+
+    serial = generate_documentation(dict(arguments, jobs=1), write_sources(serial_dir, 6))
+    parallel = generate_documentation(dict(arguments, jobs=3), write_sources(parallel_dir, 6))
+
+    # deterministic order of the merged results
+    assert [func["name"] for func in parallel] == [f"func{i}" for i in range(6)]
+    for serial_func, parallel_func in zip(serial, parallel):
+        assert serial_func["doxygen"] == parallel_func["doxygen"]
+        assert serial_func["startLine"] == parallel_func["startLine"]
+    for i in range(6):
+        assert ((serial_dir / f"file{i}.cpp").read_text() ==
+                (parallel_dir / f"file{i}.cpp").read_text())
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_generate_documentation_failing_file_does_not_stop_run(arguments, tmp_path, jobs):
+    arguments["backup_path"] = None
+    arguments["jobs"] = jobs
+    source_files = write_sources(tmp_path, 2)
+    source_files.insert(1, str(tmp_path / "missing.cpp"))
+
+    errors = []
+    result = generate_documentation(arguments, source_files, errors)
+
+    assert [func["name"] for func in result] == ["func0", "func1"]
+    assert len(errors) == 1
+    assert errors[0][0] == str(tmp_path / "missing.cpp")
+    assert "FileNotFoundError" in errors[0][1]
+
+@pytest.mark.parametrize("jobs, expected", [
+    (None, 1), (1, 1), (4, 4), ("2", 2), (-3, 1), ("invalid", 1),
+    (0, os.cpu_count() or 1), ("auto", os.cpu_count() or 1)])
+def test_get_jobs(jobs, expected):
+    assert get_jobs({"jobs": jobs}) == expected
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_generate_documentation_reports_progress(arguments, tmp_path, jobs):
+    arguments["backup_path"] = None
+    arguments["jobs"] = jobs
+    source_files = write_sources(tmp_path, 3)
+
+    calls = []
+    generate_documentation(arguments, source_files,
+                           progress=lambda done, total, file_path: calls.append((done, total, file_path)))
+
+    assert calls == [(i + 1, 3, file_path) for i, file_path in enumerate(source_files)]
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_generate_documentation_cancel_between_files(arguments, tmp_path, jobs):
+    arguments["backup_path"] = None
+    arguments["jobs"] = jobs
+    source_files = write_sources(tmp_path, 4)
+    cancel = threading.Event()
+
+    def progress(done, total, file_path):
+        if done == 1:
+            cancel.set()
+
+    result = generate_documentation(arguments, source_files, progress=progress, cancel=cancel)
+
+    assert result == CANCELLED
+    # the first file is completely written, the run stops cleanly before the next file
+    assert "/*" in Path(source_files[0]).read_text()
+    if jobs == 1:
+        assert all("/*" not in Path(path).read_text() for path in source_files[1:])
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_generate_documentation_cancel_keeps_housekeeping(arguments, tmp_path, jobs):
+    arguments["jobs"] = jobs
+    arguments["backup_keep_runs"] = 1
+    arguments["cache_path"] = str(tmp_path / "cache")
+    arguments["cache_max_size"] = 0
+    source_files = write_sources(tmp_path, 4)
+    old_file = tmp_path / "old.cpp"
+    old_file.write_text("int old();\n")
+    BackupStore(arguments["backup_path"], run_id="00000000-old").add(str(old_file))
+    cancel = threading.Event()
+
+    def progress(done, total, file_path):
+        if done == 1:
+            cancel.set()
+
+    result = generate_documentation(arguments, source_files, progress=progress, cancel=cancel)
+
+    assert result == CANCELLED
+    # the older run is pruned and the cache is evicted down to its (zero) size
+    runs = BackupStore(arguments["backup_path"]).list_runs()
+    assert len(runs) == 1 and runs[0] != "00000000-old"
+    assert [files for _, _, files in os.walk(arguments["cache_path"]) if files] == []
+
+@pytest.mark.parametrize("jobs, parse_workers", [(1, None), (2, 1)])
+def test_pool_workers_parse_without_nested_pool(arguments, tmp_path, jobs, parse_workers):
+    arguments["backup_path"] = None
+    arguments["jobs"] = jobs
+    source_files = write_sources(tmp_path, 2)
+    parse = doc_generator.SourceDocument.parse
+    calls = []
+
+    def record_parse(document, chunk_lines=0, workers=None):
+        calls.append(workers)
+        return parse(document, chunk_lines, workers)
+
+    # threads instead of processes, so the patched parse is also used by the pool
+    with patch.object(doc_generator, "ProcessPoolExecutor", ThreadPoolExecutor), \
+         patch.object(doc_generator.SourceDocument, "parse", record_parse):
+        generate_documentation(arguments, source_files)
+
+    assert calls == [parse_workers, parse_workers]
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_generate_documentation_passes_functions_to_report(arguments, tmp_path, jobs):
+    arguments["backup_path"] = None
+    arguments["jobs"] = jobs
+    source_files = write_sources(tmp_path, 3)
+
+    reported = []
+    result = generate_documentation(arguments, source_files,
+                                    report=lambda functions: reported.append(functions))
+
+    assert result == []
+    assert [[func["name"] for func in functions] for functions in reported] == [
+        ["func0"], ["func1"], ["func2"]]
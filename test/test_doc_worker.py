@@ -0,0 +1,87 @@
+# CppCodeDoc — Licensed under the GNU General Public License v3.0 (GPLv3-or-later)
+# SPDX-License-Identifier: GPLv3-or-later
+# Copyright (C) 2025 Jojo1220
+# See https://www.gnu.org/licenses/gpl-3.0.html
+
+import sys
+import os
+import pytest
+from unittest.mock import patch
+
+pytest.importorskip("PyQt5")
+from PyQt5.QtCore import QCoreApplication
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', "src")))
+import gui.doc_worker as doc_worker
+from gui.doc_worker import DocumentationWorker
+from formatter.doc_generator import CANCELLED
+
+@pytest.fixture
+def config():
+    return {"readonly": True, "headerCommentStyle": "doxygen", "backup_path": None,
+            "incremental": False, "document": {"title": "Before"}}
+
+@pytest.fixture
+def app():
+    return QCoreApplication.instance() or QCoreApplication([])
+
+def fake_generate_documentation(arguments, source_files, errors=None, progress=None,
+                                cancel=None, manifest=None):
+    """
+    Stand-in of generate_documentation: one function per file, stops when cancelled.
+    """
+    functions = []
+    for done, file_path in enumerate(source_files, start=1):
+        if cancel is not None and cancel.is_set():
+            return CANCELLED
+        functions.append({"name": arguments["document"]["title"], "file": file_path})
+        progress(done, len(source_files), file_path)
+    return functions
+
+def run_worker(worker):
+    progress, finished = [], []
+    worker.progress.connect(lambda *args: progress.append(args))
+    worker.finished_run.connect(finished.append)
+    with patch.object(doc_worker, "generate_documentation", fake_generate_documentation), \
+         patch.object(doc_worker, "save_documentation",
+                      return_value=(["report.html"], {"functions": 2})) as save:
+        # executed synchronously, the signals are delivered directly
+        worker.run()
+    return progress, finished, save
+
+def test_worker_emits_progress_and_result(app, config):
+    worker = DocumentationWorker(config, ["a.cpp", "b.cpp"])
+    # edits of the GUI after the start are not seen by the run
+    config["document"]["title"] = "After"
+
+    progress, finished, save = run_worker(worker)
+
+    assert [(done, total, path) for done, total, path, _ in progress] == [
+        (1, 2, "a.cpp"), (2, 2, "b.cpp")]
+    assert len(finished) == 1
+    result = finished[0]
+    assert [func["name"] for func in result["functions"]] == ["Before", "Before"]
+    assert result["result_files"] == ["report.html"]
+    assert result["error"] is None
+    save.assert_called_once()
+
+def test_cancelled_worker_does_not_save(app, config):
+    worker = DocumentationWorker(config, ["a.cpp", "b.cpp"])
+    worker.cancel()
+
+    progress, finished, save = run_worker(worker)
+
+    assert worker.is_cancelled()
+    assert progress == []
+    assert finished[0]["functions"] == CANCELLED
+    assert finished[0]["result_files"] is None
+    save.assert_not_called()
+
+@pytest.mark.parametrize("full", [False, True])
+def test_full_run_resets_manifest(app, config, full):
+    worker = DocumentationWorker(config, ["a.cpp"], full=full)
+
+    with patch.object(doc_worker, "create_run_manifest", return_value=None) as create_manifest:
+        run_worker(worker)
+
+    assert create_manifest.call_args.kwargs == {"reset": full}
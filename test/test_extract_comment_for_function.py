@@ -7,7 +7,10 @@ import sys
 import os
 
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
-from src.formatter.code_parser import extract_comment_for_function
+from src.formatter.code_parser import (
+    extract_comment_for_function, extract_multiline_comments,
+    get_block_comments, get_block_comment_above)
+from src.formatter.line_analysis import BLANK, LINE_COMMENT, BLOCK_COMMENT, PREPROCESSOR, CODE
 
 def test_extract_multiline_comment():
     # Test, if multiline comment is extracted correctly
@@ -55,3 +58,54 @@ def test_extract_no_comment():
     orig_idx = 1 # retesting with other start index
     comment = extract_comment_for_function(lines, orig_idx, multiline_comments)
     assert comment == ""
+
+def test_block_comment_above_gives_same_comment():
+    # Testing, if the preselected block comment gives the same result as all comments
+    lines = [
+        "/* first */",
+        "void first() {}",
+        "/* not a",
+        "",
+        "   block comment */",
+        "void second() {}",
+        "/**",
+        " * third",
+        " */",
+        "#define X",
+        "void third() {}",
+        "// fourth",
+        "void fourth() {}",
+    ]
+    multiline_comments = extract_multiline_comments(lines)
+    block_comments, block_comment_ends = get_block_comments(lines, multiline_comments)
+
+    for orig_idx in range(len(lines)):
+        comment = extract_comment_for_function(
+            lines, orig_idx, get_block_comment_above(block_comments, block_comment_ends, orig_idx))
+        assert comment == extract_comment_for_function(lines, orig_idx, multiline_comments)
+
+def test_extract_comment_with_line_classes():
+    lines = [
+        "/**",
+        " * @brief documented",
+        " */",
+        "#ifdef WIN32",
+        "",
+        "int f(int a) {",
+        "}",
+        "// line comment",
+        "#if 1",
+        "int g() {",
+        "}",
+    ]
+    # classes as classify_lines returns them, the text of the lines is not rescanned
+    classes = [BLOCK_COMMENT, BLOCK_COMMENT, BLOCK_COMMENT, PREPROCESSOR, BLANK, CODE, CODE,
+               LINE_COMMENT, PREPROCESSOR, CODE, CODE]
+    block_comments, ends = get_block_comments(lines, extract_multiline_comments(lines), classes)
+
+    assert extract_comment_for_function(
+        lines, 5, get_block_comment_above(block_comments, ends, 5), classes) == "\n".join(lines[:3])
+    assert extract_comment_for_function(
+        lines, 9, get_block_comment_above(block_comments, ends, 9), classes) == "// line comment"
+    # a line classified as code ends the comment lookup
+    assert extract_comment_for_function(lines, 9, [], classes[:8] + [CODE] + classes[9:]) == ""
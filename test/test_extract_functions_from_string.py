@@ -7,7 +7,8 @@ import sys
 import os
 
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
-from src.formatter.code_parser import extract_functions_from_string
+from src.formatter.code_parser import extract_functions_from_string, find_chunk_bounds
+from streamLogger.trace import enable_tracing
 
 def test_function_parsing_with_comments():
     test_code = """
@@ -325,3 +326,96 @@ def test_function_parsing_with_comments():
     assert result[29]['templateParams'] == "<typename T, typename U>"
 
     assert len(result) == 30
+
+CHUNKED_CODE = """\
+/**
+ * @brief first overload
+ */
+int add(int a, int b) {
+    return a + b;
+}
+
+template <typename T>
+class Box {
+    T get() const;
+};
+
+T Box::get() const
+{
+    return value;
+}
+
+/* a comment
+}
+
+   with a closing brace */
+int add(int a, int b) {
+    return b + a;
+}
+
+static const char* name(
+    int id,
+    bool full)
+{
+    return "x";
+}
+
+// line comment
+int add(int a, int b) {
+    return 0;
+}
+"""
+
+def test_chunk_bounds_at_top_level_closing_braces():
+    lines = CHUNKED_CODE.splitlines()
+    bounds = find_chunk_bounds(lines, len(lines))
+
+    assert bounds[0] == 0 and bounds[-1] == len(lines)
+    # empty lines after "}" / "};", but not within the block comment
+    assert bounds[1:-1] == [6, 11, 16, 24, 31]
+
+def test_chunk_bounds_not_within_tokens():
+    lines = [
+        "int f() { /* opened after code",
+        "}",
+        "",
+        "*/ return R\"x(",
+        "}",
+        "",
+        ")x\"; }",
+        "}",
+        "",
+        "int g();",
+    ]
+
+    assert find_chunk_bounds(lines, len(lines)) == [0, 8, len(lines)]
+
+def test_chunked_parsing_equals_single_parsing():
+    expected = [dict(func) for func in extract_functions_from_string(CHUNKED_CODE, "x.cpp")]
+
+    for chunk_lines in (1, 5, 12):
+        functions = extract_functions_from_string(CHUNKED_CODE, "x.cpp", chunk_lines, workers=2)
+        assert [dict(func) for func in functions] == expected
+
+    # the template line is pending across the end of the class, the overloads are
+    # counted across all chunks
+    assert [(func["name"], func["count"], func["startLine"], func["isTemplate"])
+            for func in expected] == [
+        ("add", 1, 3, False), ("Box::get", 1, 12, True), ("add", 2, 21, False),
+        ("name", 1, 25, False), ("add", 3, 33, False)]
+
+def test_chunked_parsing_with_trace(capfd):
+    lines = CHUNKED_CODE.splitlines()
+    bounds = find_chunk_bounds(lines, -(-len(lines) // 12))
+    enable_tracing(["parser=info"])
+    try:
+        functions = extract_functions_from_string(CHUNKED_CODE, "x.cpp", 12, workers=2)
+    finally:
+        enable_tracing(None)
+
+    # tracing keeps the chunks, every chunk is traced by its worker
+    assert len(functions) == 5
+    output = capfd.readouterr().out
+    assert f"Parsing x.cpp in {len(bounds) - 1} chunks" in output
+    for start, end in zip(bounds, bounds[1:]):
+        assert f"x.cpp lines {start + 1}-{end}:" in output
@@ -31,4 +31,16 @@ def test_ignore_inline_comment():
         "}"
     ]
     result = extract_multiline_comments(lines)
-    assert result == []  # Should ignore inline block comments
\ No newline at end of file
+    assert result == []  # Should ignore inline block comments
+
+def test_comment_followed_by_code_is_no_comment_block():
+    lines = [
+        "/* step 1 */ int x = 1;",
+        "const char* s = \"/* not a comment\";",
+        "int y = 2; /* opened after code",
+        "   closed */",
+        "/* a */ /* b",
+        "   c */",
+    ]
+    result = extract_multiline_comments(lines)
+    assert [(start, end) for start, end, _ in result] == [(4, 5)]
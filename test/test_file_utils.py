@@ -7,7 +7,7 @@ import os
 import sys
 
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
-from src.utils.file_utils import get_cpp_files
+from src.utils.file_utils import get_cpp_files, write_text_if_changed
 
 def test_single_cpp_file(tmp_path):
     test_file = tmp_path / "main.cpp"
@@ -57,3 +57,27 @@ def test_recursive_directory(tmp_path):
 def test_path_is_neither_file_nor_directory():
     result = get_cpp_files("nonexistent_path_12345", {"recursive": True})
     assert result == []
+
+def test_write_text_if_changed(tmp_path):
+    test_file = tmp_path / "main.cpp"
+    test_file.write_text("int main() { return 0; }\n")
+    os.chmod(test_file, 0o640)
+    mtime = os.stat(test_file).st_mtime_ns
+
+    assert write_text_if_changed(str(test_file), "int main() { return 0; }\n") is False
+    assert os.stat(test_file).st_mtime_ns == mtime
+
+    assert write_text_if_changed(str(test_file), "int main() { return 1; }\n") is True
+    assert test_file.read_text() == "int main() { return 1; }\n"
+    assert os.stat(test_file).st_mode & 0o777 == 0o640
+    assert os.listdir(tmp_path) == ["main.cpp"]
+
+def test_write_text_if_changed_keeps_symlink(tmp_path):
+    target = tmp_path / "real.h"
+    target.write_text("old\n")
+    link = tmp_path / "link.h"
+    link.symlink_to(target)
+
+    assert write_text_if_changed(str(link), "new\n") is True
+    assert link.is_symlink()
+    assert target.read_text() == "new\n"
@@ -0,0 +1,112 @@
+# CppCodeDoc — Licensed under the GNU General Public License v3.0 (GPLv3-or-later)
+# SPDX-License-Identifier: GPLv3-or-later
+# Copyright (C) 2025 Jojo1220
+# See https://www.gnu.org/licenses/gpl-3.0.html
+
+import sys
+import os
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', "src")))
+import utils.file_walker as file_walker
+from utils.file_walker import create_matcher, walk_source_files
+from utils.file_utils import get_cpp_files
+
+def write_tree(root, paths):
+    for path in paths:
+        full_path = root / path
+        full_path.parent.mkdir(parents=True, exist_ok=True)
+        full_path.write_text("// file\n")
+
+def relative(root, paths):
+    return [os.path.relpath(path, root).replace(os.sep, "/") for path in paths]
+
+@pytest.mark.parametrize("pattern, path, excluded", [
+    ("*.gen.h", "a/b/types.gen.h", True),
+    ("*.gen.h", "a/types.h", False),
+    ("/main.cpp", "main.cpp", True),
+    ("/main.cpp", "src/main.cpp", False),
+    ("src/*.cpp", "src/a.cpp", True),
+    ("src/*.cpp", "src/sub/a.cpp", False),
+    ("src/**/test_*.cpp", "src/a/b/test_x.cpp", True),
+    ("src/**/test_*.cpp", "src/test_x.cpp", True),
+    ("**/generated", "a/generated/x.cpp", True),
+    ("file?.cpp", "file1.cpp", True),
+    ("file[0-9].cpp", "filex.cpp", False),
+    ("file[!0-9].cpp", "filex.cpp", True),
+    ("third_party", "third_party/lib/x.h", True),
+])
+def test_patterns(pattern, path, excluded):
+    matcher = create_matcher(exclude=[pattern])
+
+    assert matcher.match_file(path) is not excluded
+
+def test_directory_only_pattern_and_negation():
+    matcher = create_matcher(exclude=["build/", "*.h", "!keep.h"])
+
+    assert not matcher.match_dir("build")
+    assert not matcher.match_file("build/main.cpp")
+    assert matcher.match_file("build.cpp")
+    assert not matcher.match_file("src/a.h")
+    assert matcher.match_file("src/keep.h")
+
+def test_extensions_and_include():
+    matcher = create_matcher(extensions=[".cc"], include=["src/"])
+
+    assert matcher.match_file("src/a.cc")
+    assert not matcher.match_file("src/a.cpp")
+    assert not matcher.match_file("test/a.cc")
+
+def test_walk_order_and_ignore_files(tmp_path):
+    write_tree(tmp_path, ["b.cpp", "a.h", "notes.txt", "src/z.cpp", "src/lib/y.hpp",
+                          "src/gen/x.cpp", "build/out.cpp", ".git/hook.cpp", "vendor/v.cpp",
+                          "vendor/keep/k.cpp"])
+    (tmp_path / ".gitignore").write_text("# build output\nbuild/\n\n")
+    (tmp_path / "src" / ".gitignore").write_text("gen/\n")
+    (tmp_path / ".cppcodedocignore").write_text("vendor/*\n!vendor/keep\n")
+
+    result = walk_source_files(str(tmp_path), ignore_files=(".gitignore", ".cppcodedocignore"))
+
+    assert relative(tmp_path, result) == [
+        "a.h", "b.cpp", "src/z.cpp", "src/lib/y.hpp", "vendor/keep/k.cpp"]
+
+def test_gitignore_is_not_respected_by_default(tmp_path):
+    write_tree(tmp_path, ["a.cpp", "build/out.cpp", "vendor/v.cpp"])
+    (tmp_path / ".gitignore").write_text("build/\n")
+    (tmp_path / ".cppcodedocignore").write_text("vendor/\n")
+
+    assert relative(tmp_path, walk_source_files(str(tmp_path))) == ["a.cpp", "build/out.cpp"]
+
+def test_ignore_file_is_relative_to_its_directory(tmp_path):
+    write_tree(tmp_path, ["a/main.cpp", "b/main.cpp"])
+    (tmp_path / "a" / ".cppcodedocignore").write_text("/main.cpp\n")
+
+    assert relative(tmp_path, walk_source_files(str(tmp_path))) == ["b/main.cpp"]
+
+def test_excluded_directories_are_not_listed(tmp_path, monkeypatch):
+    write_tree(tmp_path, ["src/a.cpp", "build/deep/b.cpp", "third_party/c.cpp"])
+    listed = []
+    scandir = os.scandir
+    monkeypatch.setattr(file_walker.os, "scandir",
+                        lambda path: listed.append(os.path.relpath(path, tmp_path)) or scandir(path))
+
+    walk_source_files(str(tmp_path), create_matcher(exclude=["build/", "third_party"]))
+
+    assert sorted(listed) == [".", "src"]
+
+def test_parallel_walk_matches_serial(tmp_path):
+    write_tree(tmp_path, [f"d{i}/s{j}/f{k}.cpp" for i in range(4) for j in range(3) for k in range(2)])
+
+    assert (walk_source_files(str(tmp_path), workers=4) ==
+            walk_source_files(str(tmp_path), workers=1))
+
+def test_get_cpp_files_settings(tmp_path):
+    write_tree(tmp_path, ["main.cc", "main.cpp", "test/t.cc", "build/b.cc"])
+    (tmp_path / ".gitignore").write_text("build/\n")
+    arguments = {"recursive": True, "extensions": [".cc"], "exclude": ["test/"], "walk_workers": 2}
+
+    assert relative(tmp_path, get_cpp_files(str(tmp_path), arguments)) == ["main.cc", "build/b.cc"]
+    arguments["use_gitignore"] = True
+    assert relative(tmp_path, get_cpp_files(str(tmp_path), arguments)) == ["main.cc"]
+    arguments["ignore_files"] = []
+    assert relative(tmp_path, get_cpp_files(str(tmp_path), arguments)) == ["main.cc", "build/b.cc"]
@@ -0,0 +1,91 @@
+# CppCodeDoc — Licensed under the GNU General Public License v3.0 (GPLv3-or-later)
+# SPDX-License-Identifier: GPLv3-or-later
+# Copyright (C) 2025 Jojo1220
+# See https://www.gnu.org/licenses/gpl-3.0.html
+
+import sys
+import os
+import time
+import threading
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', "src")))
+from utils.file_walker import create_matcher, DEFAULT_IGNORE_FILES
+from utils.file_watcher import PollingWatcher, InotifyWatcher, load_inotify
+
+WATCHERS = [
+    pytest.param(lambda path, settings: PollingWatcher(path, settings, debounce=0.2, interval=0.05),
+                 id="polling"),
+    pytest.param(lambda path, settings: InotifyWatcher(path, settings, debounce=0.2), id="inotify",
+                 marks=pytest.mark.skipif(load_inotify() is None, reason="inotify not available")),
+]
+
+def walk_settings(exclude=()):
+    return {"matcher": create_matcher(exclude=list(exclude)), "ignore_files": DEFAULT_IGNORE_FILES,
+            "recursive": True, "workers": 1}
+
+def write(path, content):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(content)
+
+@pytest.fixture(params=WATCHERS)
+def watch(request, tmp_path):
+    write(str(tmp_path / "a.cpp"), "int a();\n")
+    write(str(tmp_path / "src" / "b.h"), "int b();\n")
+    write(str(tmp_path / "build" / "c.cpp"), "int c();\n")
+    watchers = []
+
+    def create(exclude=()):
+        watcher = request.param(str(tmp_path), walk_settings(exclude))
+        watchers.append(watcher)
+        return watcher
+    yield create
+    for watcher in watchers:
+        watcher.close()
+
+def test_modified_created_and_deleted_files(watch, tmp_path):
+    watcher = watch()
+    time.sleep(0.05)
+    write(str(tmp_path / "a.cpp"), "int a(int x);\n")
+    write(str(tmp_path / "src" / "new.cpp"), "int n();\n")
+    os.remove(str(tmp_path / "src" / "b.h"))
+
+    changed = watcher.wait_for_changes(timeout=5)
+
+    assert changed == {str(tmp_path / "a.cpp"), str(tmp_path / "src" / "new.cpp"),
+                       str(tmp_path / "src" / "b.h")}
+
+def test_files_of_new_directories(watch, tmp_path):
+    watcher = watch()
+    time.sleep(0.05)
+    write(str(tmp_path / "new" / "deep" / "d.cpp"), "int d();\n")
+    assert watcher.wait_for_changes(timeout=5) == {str(tmp_path / "new" / "deep" / "d.cpp")}
+
+    write(str(tmp_path / "new" / "deep" / "d.cpp"), "int d(int x);\n")
+    assert watcher.wait_for_changes(timeout=5) == {str(tmp_path / "new" / "deep" / "d.cpp")}
+
+def test_excluded_and_other_files_are_ignored(watch, tmp_path):
+    watcher = watch(exclude=["build/"])
+    time.sleep(0.05)
+    write(str(tmp_path / "build" / "c.cpp"), "int c(int x);\n")
+    write(str(tmp_path / "notes.txt"), "notes\n")
+
+    assert watcher.wait_for_changes(timeout=0.5) == set()
+
+def test_burst_of_changes_is_debounced(watch, tmp_path):
+    watcher = watch()
+    paths = [str(tmp_path / f"burst{i}.cpp") for i in range(5)]
+
+    def save_all():
+        # pauses longer than the poll interval, but shorter than the debounce time
+        for path in paths:
+            write(path, "int x();\n")
+            time.sleep(0.1)
+    writer = threading.Thread(target=save_all)
+    writer.start()
+    changed = watcher.wait_for_changes(timeout=5)
+    writer.join()
+
+    assert changed == set(paths)
+    assert watcher.wait_for_changes(timeout=0.3) == set()
@@ -0,0 +1,124 @@
+# CppCodeDoc — Licensed under the GNU General Public License v3.0 (GPLv3-or-later)
+# SPDX-License-Identifier: GPLv3-or-later
+# Copyright (C) 2025 Jojo1220
+# See https://www.gnu.org/licenses/gpl-3.0.html
+
+import io
+import os
+import re
+import sys
+import time
+import contextlib
+
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', "src")))
+from formatter.function_head import match_function_head, match_constructor_head
+from formatter.cpp_lexer import TokenStream
+from formatter.code_parser import (
+    extract_functions_from_string, mask_templates, remove_comment_tokens, unmask_templates)
+
+# former regexes, only used as reference
+FUNCTION_REGEX = re.compile(r"""
+    ^\s*
+    (?P<rtype>\w[\w\s:*&<>]*?)\s*
+    (?P<name>(\w+::)*[\w~]+|operator\s*[\w\[\]\(\)\+\-\*/<>=!&|^%~]+)
+    \s*\(
+    (?P<params>[^()]*(?:\([^)]*\)[^()]*)*)
+    \)
+    \s*(?P<const>const)?
+    \s*(\{)?\s*$
+    """, re.VERBOSE)
+
+CONSTRUCTOR_REGEX = re.compile(r"""
+    ^\s*(?P<name>(\w+::)?~?\w+)\s*
+    \((?P<params>[^)]*)\)\s*
+    (?:\s*:\s*(?P<initlist>[^{}]*))?
+    (?P<const>const)?\s*
+    \{
+    """, re.VERBOSE)
+
+SAMPLE_LINES = [
+    "int add(int a, int b) {",
+    "  static const std::string& name() const",
+    "void Counter::reset()",
+    "unsigned long long   compute (int (*f)(int), double x) const {",
+    "std::vector<int> values(const std::vector<int>& v) { ",
+    "bool operator==(const A& other) const {",
+    "A& operator()(int x)",
+    "bool operator < (const A& other)",
+    "T* operator->()",
+    "operator int()",
+    "Counter() : value(0) {}",
+    "Counter::Counter(int v) : value(v), next(nullptr) {",
+    "Counter::~Counter() {",
+    "~Counter() const {",
+    "if (x > 0) {",
+    "return add(a, b);",
+    "int x = f(a) + g(b);",
+    "void f(int a) { return; }",
+    "a::b::c d::e::f(int)",
+    "int f((a)(b))",
+    "",
+    "   ",
+]
+
+PATHOLOGICAL_LINES = {
+    "long_word": "a" * 20000,
+    "words": "int " + "a " * 20000 + "x",
+    "qualified": "a::" * 20000 + "b",
+    "unclosed_params": "void f(" + "a, " * 20000,
+    "nested_parens": "void f(" + "(a)" * 20000,
+    "operator": "bool operator" + "(" * 20000,
+    "spaces": "a()" + " " * 20000 + "x",
+    "comments": "int x = 0; " + "/* " * 20000,
+    "templates": "template<" + "<a," * 20000,
+    "init_list": "A::A() : " + "a(1), " * 20000,
+    "rtype_chars": "a" + "*& <>::" * 20000,
+    "operator_run": "operator" * 2500 + "x",
+    "minified": "int f(int a){return a;}" * 1000,
+}
+
+def regex_groups(match, names):
+    return None if match is None else {name: match.group(name) for name in names}
+
+@pytest.mark.parametrize("line", SAMPLE_LINES)
+def test_match_function_head_matches_regex(line):
+    expected = regex_groups(FUNCTION_REGEX.match(line), ("rtype", "name", "params", "const"))
+
+    assert match_function_head(line) == expected
+
+@pytest.mark.parametrize("line", SAMPLE_LINES)
+def test_match_constructor_head_matches_regex(line):
+    expected = regex_groups(CONSTRUCTOR_REGEX.match(line), ("name", "params", "const"))
+
+    assert match_constructor_head(line) == expected
+
+def test_remove_comment_tokens():
+    text = 'a /* b */ c("//") /* d'
+    tokens = TokenStream([text]).tokens[0]
+
+    assert remove_comment_tokens(text, tokens) == ('a  c("//")', [
+        ('(', 4, 5), ('string', 5, 9), (')', 9, 10)])
+    assert remove_comment_tokens(text, tokens, inline_only=True)[0] == 'a  c("//") /* d'
+
+def test_mask_and_unmask_templates():
+    line = "std::map<int, std::vector<T>> f(std::pair<A, B> p, int x)"
+    masked, templates = mask_templates(line)
+
+    assert masked == "std::map__TPL0__ f(std::pair__TPL1__ p, int x)"
+    assert templates == {"__TPL0__": "<int, std::vector<T>>", "__TPL1__": "<A, B>"}
+    assert unmask_templates(masked, templates) == line
+    assert mask_templates("a > b < c") == ("a > b < c", {})
+
+@pytest.mark.parametrize("name", PATHOLOGICAL_LINES)
+def test_pathological_lines_are_linear(name):
+    line = PATHOLOGICAL_LINES[name]
+
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        extract_functions_from_string(line)
+    duration = time.perf_counter() - start
+
+    # backtracking regexes needed several seconds up to minutes for these lines
+    assert duration < 2.0, f"{name}: {duration:.2f}s"
@@ -0,0 +1,104 @@
+# CppCodeDoc — Licensed under the GNU General Public License v3.0 (GPLv3-or-later)
+# SPDX-License-Identifier: GPLv3-or-later
+# Copyright (C) 2025 Jojo1220
+# See https://www.gnu.org/licenses/gpl-3.0.html
+
+import sys
+import os
+from unittest.mock import MagicMock
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from src.formatter.function_index import FunctionIndex
+from src.formatter.code_parser import (
+    extract_functions_from_string, find_function_start_line, is_function_start_line)
+
+CODE = """\
+int add(int a, int b) {
+    return a + b;
+}
+
+int add(int a, int b, int c) {
+    return a + b + c;
+}
+
+void run() {
+    add(1, 2);
+}
+"""
+
+def build_index(lines, fallback=None):
+    functions = extract_functions_from_string("\n".join(lines))
+    return functions, FunctionIndex(
+        functions, fallback=fallback, verify=is_function_start_line)
+
+def test_find_returns_start_lines_without_fallback():
+    lines = CODE.splitlines()
+    fallback = MagicMock(return_value=-1)
+    functions, index = build_index(lines, fallback)
+
+    assert [index.find(func, lines) for func in functions] == [0, 4, 8]
+    fallback.assert_not_called()
+
+def test_find_matches_find_function_start_line():
+    lines = CODE.splitlines()
+    functions, index = build_index(lines)
+
+    for func in functions:
+        assert index.find(func, lines) == find_function_start_line(
+            CODE, func["name"], func["params"], func["count"])
+
+def test_shift_after_inserted_header_block():
+    lines = CODE.splitlines()
+    functions, index = build_index(lines)
+
+    # inserting a three lined header block above the second function
+    lines = lines[:4] + ["/*", " * header", "*/"] + lines[4:]
+    index.shift(4, 3)
+
+    assert [index.find(func, lines) for func in functions] == [0, 7, 11]
+
+def test_shift_after_removed_header_block():
+    lines = ["/*", " * header", "*/"] + CODE.splitlines()
+    functions, index = build_index(lines)
+
+    lines = lines[3:]
+    index.shift(3, -3)
+
+    assert [index.find(func, lines) for func in functions] == [0, 4, 8]
+
+def test_fallback_for_records_without_start_line():
+    lines = CODE.splitlines()
+    fallback = MagicMock(return_value=8)
+    index = FunctionIndex([], fallback=fallback)
+
+    func = {"name": "run", "params": "", "count": 1}
+    assert index.find(func, lines) == 8
+    fallback.assert_called_once_with(CODE.rstrip("\n"), "run", "", 1)
+
+    # resolved lines are cached within the index
+    assert index.find(func, lines) == 8
+    fallback.assert_called_once()
+
+def test_fallback_if_indexed_line_is_out_of_sync():
+    lines = CODE.splitlines()
+    functions, index = build_index(lines, fallback=find_function_start_line)
+
+    # lines changed, without shifting the index
+    lines = ["", ""] + lines
+    assert index.find(functions[2], lines) == 10
+
+def test_not_found_without_fallback():
+    index = FunctionIndex([])
+    assert index.find({"name": "missing", "params": "", "count": 1}, ["int x;"]) == -1
+
+def test_shifted_index_on_overload_is_rejected():
+    lines = CODE.splitlines()
+    functions, index = build_index(lines, find_function_start_line)
+
+    # the first overload is moved onto the line of the second one (missing shift)
+    index.start_lines[FunctionIndex.key(functions[0])] = 4
+    assert is_function_start_line(lines, 4, functions[1])
+    assert not is_function_start_line(lines, 4, functions[0])
+
+    assert index.find(functions[0], lines) == 0
+    assert index.get(functions[0]) == 0
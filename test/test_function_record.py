@@ -0,0 +1,85 @@
+# CppCodeDoc — Licensed under the GNU General Public License v3.0 (GPLv3-or-later)
+# SPDX-License-Identifier: GPLv3-or-later
+# Copyright (C) 2025 Jojo1220
+# See https://www.gnu.org/licenses/gpl-3.0.html
+
+import sys
+import os
+import copy
+import pickle
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', "src")))
+from formatter.function_record import FunctionRecord
+from formatter.code_parser import extract_functions_from_string
+
+FIELDS = {
+    "name": "add", "return_type": "int", "params": "int a, int b", "const": False,
+    "comment": "", "isDoxygenComment": False, "file": "src/a.cpp", "startLine": 3,
+    "count": 1, "isTemplate": False, "templateParams": None,
+}
+
+def test_dict_style_access():
+    func = FunctionRecord(FIELDS)
+
+    assert func["name"] == "add"
+    assert func.get("doxygen", "") == ""
+    assert "doxygen" not in func
+    assert "name" in func
+    with pytest.raises(KeyError):
+        func["doxygen"]
+
+    func["doxygen"] = "/** @brief add */"
+    assert "doxygen" in func
+    assert list(func) == list(FIELDS) + ["doxygen"]
+    assert len(func) == len(FIELDS) + 1
+
+    del func["doxygen"]
+    assert "doxygen" not in func
+    with pytest.raises(KeyError):
+        del func["doxygen"]
+
+def test_equality_with_dicts():
+    func = FunctionRecord(**FIELDS)
+
+    assert func == FIELDS
+    assert FIELDS == func
+    assert [func] == [dict(FIELDS)]
+    assert func != dict(FIELDS, startLine=4)
+    assert func.to_dict() == FIELDS
+
+def test_additional_keys():
+    func = FunctionRecord(FIELDS, custom=1)
+
+    assert func["custom"] == 1
+    assert func.get("custom") == 1
+    assert func.get("other", 2) == 2
+    assert list(func)[-1] == "custom"
+    del func["custom"]
+    assert func == FIELDS
+
+def test_copy_pickle_and_deepcopy():
+    func = FunctionRecord(FIELDS, doxygen_TODO_Analyze={"todo": 1})
+
+    for duplicate in (func.copy(), copy.deepcopy(func), pickle.loads(pickle.dumps(func))):
+        assert isinstance(duplicate, FunctionRecord)
+        assert duplicate == func
+        assert duplicate is not func
+
+def test_strings_are_interned():
+    first = FunctionRecord(FIELDS, file="".join(["src/", "b.cpp"]))
+    second = FunctionRecord(FIELDS, file="".join(["src/", "b", ".cpp"]))
+
+    assert first["file"] is second["file"]
+
+def test_record_is_smaller_than_dict():
+    func = FunctionRecord(FIELDS, doxygen="", doxygen_TODO_Analyze={})
+
+    assert not hasattr(func, "__dict__")
+    assert sys.getsizeof(func) < sys.getsizeof(dict(func.items()))
+
+def test_extract_functions_returns_records():
+    functions = extract_functions_from_string("int add(int a, int b) {\n    return a + b;\n}\n", "a.cpp")
+
+    assert isinstance(functions[0], FunctionRecord)
+    assert functions[0] == dict(FIELDS, file="a.cpp", startLine=0)
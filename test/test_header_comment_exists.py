@@ -93,4 +93,18 @@ def test_ifdef_block_with_duplicate_function():
     # First Variant (#if-Path)
     assert header_comment_exists(lines, 5) is True
     # Second Variant (#else-Path)
-    assert header_comment_exists(lines, 9) is False
\ No newline at end of file
+    assert header_comment_exists(lines, 9) is False
+
+def test_braces_within_comments_and_strings():
+    lines = [
+        "/*",
+        " * }",
+        " */",
+        "void test() {}",
+        'const char* s = "}";  // }',
+        "void next() {}",
+    ]
+    # the "}" of the comment does not end the candidate, the "}" of the string does not
+    # end the code before the function, which is no header comment
+    assert header_comment_exists(lines, 3) is True
+    assert header_comment_exists(lines, 5) is False
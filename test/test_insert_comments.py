@@ -41,12 +41,12 @@ def find_function_start_line(content, name, params, count):
     return -1
 
 # MOCK header_comment_exists Implementation
-def header_comment_exists(lines, start_line):
+def header_comment_exists(lines, start_line, comment_index=None):
     # Adding "///" in previous line
     return start_line > 0 and lines[start_line-1].strip().startswith("///")
 
 # MOCK add_header_comment Implementation
-def add_header_comment(lines, func_name, start_line, comment_text=None):
+def add_header_comment(lines, func_name, start_line, comment_text=None, comment_index=None):
     # Ading two space elements + default comment header
     comment = comment_text or f"// Header fuer {func_name}"
     insert_pos = start_line
@@ -61,7 +61,7 @@ def remove_existing_header(lines, start_line):
     return lines
 
 # MOCK add_post_comment Implementation
-def add_post_comment(lines, func_name, start_line):
+def add_post_comment(lines, func_name, start_line, brace_map=None):
     # Seachring closing "}" of the function (very roughly: next "}" after start_line)
     for i in range(start_line, len(lines)):
         if lines[i].strip() == "}":
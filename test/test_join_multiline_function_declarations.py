@@ -8,6 +8,7 @@ import os
 
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 from src.formatter.code_parser import join_multiline_function_declarations
+from src.formatter.line_analysis import LINE_COMMENT, CODE
 
 def test_join_simple_multiline_function():
     lines = [
@@ -180,3 +181,39 @@ def test_function_closes_with_commend_bevor_opening_curly_brakets():
     ]
     joined, _, _ = join_multiline_function_declarations(lines)
     assert "void dumpTestingFunction(int a, int _b) {" in joined
+
+def test_comments_within_joined_declaration_are_removed():
+    lines = [
+        "int sum(int a, // first",
+        "        int b) /* second */",
+        "{",
+        "    return a + b; // see f(",
+        "}"
+    ]
+    joined, _, starts = join_multiline_function_declarations(lines)
+    assert joined == ["int sum(int a, int b) {", "return a + b; // see f(", "}"]
+    assert starts == [0, 3, 4]
+
+def test_braces_and_parens_in_literals_are_no_code():
+    lines = [
+        'int f(const char* s = "{ (") {',
+        "    char c = '}'; return 0; }",
+        "int x; // g(",
+        "int y;"
+    ]
+    joined, _, _ = join_multiline_function_declarations(lines)
+    assert joined == ['int f(const char* s = "{ (") {', "char c = '}'; return 0; }",
+                      "int x; // g(", "int y;"]
+
+def test_join_stops_at_comment_lines_of_classes():
+    lines = [
+        "int f(int a,",
+        "      int b)",
+        "{",
+    ]
+    joined, _, _ = join_multiline_function_declarations(lines)
+    assert joined == ["int f(int a, int b) {"]
+
+    # line classes (see classify_lines): a line comment line ends the declaration
+    joined, _, _ = join_multiline_function_declarations(lines, classes=[CODE, LINE_COMMENT, CODE])
+    assert joined == ["int f(int a,", "int b)", "{"]
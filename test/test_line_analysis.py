@@ -0,0 +1,101 @@
+# CppCodeDoc — Licensed under the GNU General Public License v3.0 (GPLv3-or-later)
+# SPDX-License-Identifier: GPLv3-or-later
+# Copyright (C) 2025 Jojo1220
+# See https://www.gnu.org/licenses/gpl-3.0.html
+
+import sys
+import os
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', "src")))
+import formatter.line_analysis as line_analysis
+from formatter.line_analysis import (analyze_lines, classify_line, classify_lines, LineClasses,
+                                     BLANK, LINE_COMMENT, BLOCK_COMMENT, PREPROCESSOR, CODE)
+from formatter.code_parser import find_function_end_line
+
+requires_numpy = pytest.mark.skipif(line_analysis.load_numpy() is None,
+                                    reason="NumPy not installed")
+
+LINES = [
+    "#include <map>",
+    "",
+    "/* a { comment",
+    " * with } braces",
+    " */",
+    "int add(int a,",
+    "        int b) {",
+    '    const char* text = "}{";  // }',
+    "    if (a) { return b; }",
+    "    return a + b;",
+    "}",
+    "\t  ",
+    " // after Unicode whitespace",
+    "　",
+    "    x = R\"(raw { string",
+    "    )\"; char c = '{';",
+    "}}",
+]
+
+def test_depths_and_classes():
+    analysis = analyze_lines(LINES, use_numpy=False)
+
+    assert analysis.openings[6:11] == [1, 0, 1, 0, 0]
+    assert analysis.closings[6:11] == [0, 0, 1, 0, 1]
+    assert analysis.depths[5:12] == [0, 0, 1, 1, 1, 1, 0]
+    assert analysis.depths[-1] == -2
+    assert analysis.paren_depths[5:8] == [0, 1, 0]
+    assert analysis.classes == [
+        PREPROCESSOR, BLANK, BLOCK_COMMENT, BLOCK_COMMENT, BLOCK_COMMENT, CODE, CODE, CODE,
+        CODE, CODE, CODE, BLANK, LINE_COMMENT, BLANK, CODE, CODE, CODE]
+
+def test_end_line_equals_brace_counting():
+    analysis = analyze_lines(LINES, use_numpy=False)
+
+    assert analysis.end_line(5) == 10
+    assert analysis.end_line(8) == 8
+    assert analysis.end_line(len(LINES)) is None
+    assert find_function_end_line(LINES, 5) == 10
+
+@pytest.mark.parametrize("line, expected", [
+    ("", BLANK), ("  // x", LINE_COMMENT), ("/** x", BLOCK_COMMENT), ("*/", BLOCK_COMMENT),
+    (" #define X", PREPROCESSOR), ("/ x", CODE), ("x // y", CODE),
+])
+def test_classify_line(line, expected):
+    assert classify_line(line) == expected
+
+@pytest.mark.parametrize("use_numpy", [False, pytest.param(True, marks=requires_numpy)])
+def test_classify_lines_equals_analysis(use_numpy):
+    expected = analyze_lines(LINES, use_numpy=False).classes
+
+    assert classify_lines(LINES, use_numpy) == expected
+    assert [LineClasses(LINES)[i] for i in range(len(LINES))] == expected
+
+@requires_numpy
+@pytest.mark.parametrize("lines", [
+    LINES,
+    LINES * 200,
+    ["", "  "],
+    ["{"],
+    ["ä { ö", "  é } (", "/", "*", " //"],
+], ids=["sample", "large", "blank", "single", "unicode"])
+def test_numpy_equals_python(lines):
+    python = analyze_lines(lines, use_numpy=False)
+    vectorized = analyze_lines(lines, use_numpy=True)
+
+    for key in ("openings", "closings", "depths", "paren_depths", "classes"):
+        assert getattr(vectorized, key) == getattr(python, key), key
+
+@requires_numpy
+def test_numpy_is_used_for_large_files():
+    assert analyze_lines(LINES).use_numpy is False
+    assert analyze_lines(LINES * 200).use_numpy is True
+
+def test_without_numpy(monkeypatch):
+    monkeypatch.setattr(line_analysis, "load_numpy", lambda: None)
+
+    assert analyze_lines(LINES * 200).use_numpy is False
+    assert classify_lines(LINES * 200) == classify_lines(LINES * 200, use_numpy=False)
+    with pytest.raises(ImportError):
+        analyze_lines(LINES, use_numpy=True)
+    with pytest.raises(ImportError):
+        classify_lines(LINES, use_numpy=True)
@@ -60,7 +60,7 @@ def test_gui_callback_called(stream_logger):
     stream_logger.set_app_class(DummyApp)
 
     # QTimer.singleShot mock, for simulation of direct function call
-    with patch("src.streamLogger.log_setup.QTimer.singleShot", lambda ms, func: func()):
+    with patch("PyQt5.QtCore.QTimer.singleShot", lambda ms, func: func()):
         stream_logger.log("Test GUI log", level="debug")
         mock_instance.append_log.assert_called_once_with("Test GUI log")
 
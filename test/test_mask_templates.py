@@ -40,3 +40,10 @@ def test_mask_templates_with_multiple_templates():
     assert len(templates) == 1
     assert templates == expected_templates
     assert '__TPL0__' in masked
+
+def test_mask_templates_ignores_brackets_in_literals_and_comments():
+    line = 'std::map<K, V> f(const char* s = "<", bool b = a < b) // x > y'
+    masked, templates = mask_templates(line)
+
+    assert masked == 'std::map__TPL0__ f(const char* s = "<", bool b = a < b) // x > y'
+    assert templates == {'__TPL0__': '<K, V>'}
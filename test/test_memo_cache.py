@@ -0,0 +1,88 @@
+# CppCodeDoc — Licensed under the GNU General Public License v3.0 (GPLv3-or-later)
+# SPDX-License-Identifier: GPLv3-or-later
+# Copyright (C) 2025 Jojo1220
+# See https://www.gnu.org/licenses/gpl-3.0.html
+
+import sys
+import os
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', "src")))
+from utils.memo_cache import memoize, get_memo_stats, diff_memo_stats, clear_memo_caches
+from streamLogger.run_profile import RunProfile
+from formatter.doxygen_generator import split_function_params, extract_param_name
+from formatter.code_parser import find_function_start_line
+from formatter.doc_generator import generate_documentation
+
+def test_memoize_counts_hits_and_misses():
+    calls = []
+
+    @memoize(maxsize=2)
+    def upper_for_test(text):
+        calls.append(text)
+        return text.upper()
+
+    before = get_memo_stats()
+    assert [upper_for_test(text) for text in ["a", "b", "a", "a", "c", "b"]] == \
+        ["A", "B", "A", "A", "C", "B"]
+
+    # "b" was evicted by "c" (maxsize 2)
+    assert calls == ["a", "b", "c", "b"]
+    assert diff_memo_stats(before)["upper_for_test"] == {"hits": 2, "misses": 4}
+
+def test_bypass_calls_the_function():
+    calls, tracing = [], [True]
+
+    @memoize(bypass=lambda: tracing[0])
+    def strip_for_test(text):
+        calls.append(text)
+        return text.strip()
+
+    strip_for_test(" a ")
+    strip_for_test(" a ")
+    tracing[0] = False
+    strip_for_test(" a ")
+    strip_for_test(" a ")
+
+    assert calls == [" a ", " a ", " a "]
+    assert strip_for_test.cache_info().hits == 1
+
+def test_memoized_results_are_equal():
+    params = "const std::string& name, void (*cb)(int, int), std::map<int, int> m = {}"
+    clear_memo_caches()
+    first = split_function_params(params)
+    second = split_function_params(params)
+
+    assert first == ["const std::string& name", "void (*cb)(int, int)",
+                     "std::map<int, int> m = {}"]
+    assert second == first
+    assert [extract_param_name(p) for p in first] == ["name", "cb", "m"]
+
+def test_memoized_list_is_not_shared():
+    clear_memo_caches()
+    first = split_function_params("int a, int b")
+    first.append("int c")
+
+    assert split_function_params("int a, int b") == ["int a", "int b"]
+    assert split_function_params.cache_info().hits == 1
+
+def test_find_function_start_line_with_unnormalized_signature():
+    content = "void f(int  *a)\n{\n}\nvoid f(int a)\n{\n}\n"
+
+    assert find_function_start_line(content, "f", "int  *a") == 0
+    assert find_function_start_line(content, "f", "int a") == 3
+
+def test_memo_stats_within_run_profile(tmp_path):
+    source = tmp_path / "test.cpp"
+    source.write_text("int add(int a, int b) {\n    return a + b;\n}\n"
+                      "int sub(int a, int b) {\n    return a - b;\n}\n")
+    profile = RunProfile()
+    clear_memo_caches()
+
+    generate_documentation({"readonly": True, "headerCommentStyle": "doxygen",
+                            "backup_path": None, "cache": False},
+                           [str(source)], profile=profile)
+
+    assert profile.memo_stats["split_function_params"] == {"hits": 1, "misses": 1}
+    summary = profile.format_summary()
+    assert "split_function_params" in summary
+    assert "50.0%" in summary
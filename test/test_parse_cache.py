@@ -0,0 +1,106 @@
+# CppCodeDoc — Licensed under the GNU General Public License v3.0 (GPLv3-or-later)
+# SPDX-License-Identifier: GPLv3-or-later
+# Copyright (C) 2025 Jojo1220
+# See https://www.gnu.org/licenses/gpl-3.0.html
+
+import sys
+import os
+import pytest
+from unittest.mock import patch
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', "src")))
+from formatter.parse_cache import ParseCache, create_parse_cache
+from formatter.doc_generator import generate_documentation
+
+CODE = """\
+int add(int a, int b) {
+    return a + b;
+}
+
+void run()
+{
+    add(1, 2);
+}
+"""
+
+@pytest.fixture
+def arguments(tmp_path):
+    return {
+        "readonly": False,
+        "headerCommentStyle": "doxygen",
+        "backup_path": None,
+        "cache_path": str(tmp_path / "cache"),
+    }
+
+def write_sources(tmp_path, name):
+    source = tmp_path / name
+    source.write_text(CODE, encoding="utf-8")
+    return str(source)
+
+def test_unchanged_file_is_taken_out_of_cache(arguments, tmp_path):
+    first = write_sources(tmp_path, "first.cpp")
+    expected_functions = generate_documentation(arguments, [first])
+
+    # same content in a second file: equal result, without parsing
+    second = write_sources(tmp_path, "second.cpp")
+    with patch("formatter.source_document.extract_functions_from_string") as parse:
+        functions = generate_documentation(arguments, [second])
+    parse.assert_not_called()
+
+    assert (tmp_path / "second.cpp").read_text(encoding="utf-8") == \
+           (tmp_path / "first.cpp").read_text(encoding="utf-8")
+    for expected, func in zip(expected_functions, functions):
+        assert func["file"] == second
+        expected.pop("file")
+        func.pop("file")
+        assert func == expected
+
+def test_results_equal_without_cache(arguments, tmp_path):
+    cached = write_sources(tmp_path, "cached.cpp")
+    generate_documentation(arguments, [write_sources(tmp_path, "warmup.cpp")])
+    functions = generate_documentation(arguments, [cached])
+
+    uncached = write_sources(tmp_path, "uncached.cpp")
+    expected_functions = generate_documentation(dict(arguments, cache=False), [uncached])
+
+    assert [func["doxygen"] for func in functions] == [func["doxygen"] for func in expected_functions]
+    assert (tmp_path / "cached.cpp").read_text(encoding="utf-8") == \
+           (tmp_path / "uncached.cpp").read_text(encoding="utf-8")
+
+def test_key_depends_on_content_version_and_settings(arguments):
+    key = ParseCache.make_key(CODE, arguments)
+
+    assert key == ParseCache.make_key(CODE, dict(arguments))
+    assert key != ParseCache.make_key(CODE + "\n", arguments)
+    assert key != ParseCache.make_key(CODE, dict(arguments, readonly=True))
+    assert key != ParseCache.make_key(CODE, dict(arguments, headerCommentStyle="default"))
+    with patch("formatter.parse_cache.PARSER_VERSION", "parser-changed"):
+        assert key != ParseCache.make_key(CODE, arguments)
+
+def test_get_and_put(tmp_path):
+    cache = ParseCache(str(tmp_path / "cache"))
+
+    assert cache.get("ab12") is None
+    assert cache.put("ab12", {"functions": [], "output": None})
+    assert cache.get("ab12") == {"functions": [], "output": None}
+
+def test_evict_least_recently_used(tmp_path):
+    cache = ParseCache(str(tmp_path / "cache"))
+    entry = {"functions": [], "output": "x" * 100}
+    for age, key in enumerate(["cc", "bb", "aa"]):
+        cache.put(key, entry)
+        os.utime(cache.entry_path(key), (1000 - age, 1000 - age))
+
+    cache.max_size = 2 * os.path.getsize(cache.entry_path("aa"))
+    assert cache.evict() == 1
+    assert cache.get("aa") is None
+    assert cache.get("bb") is not None
+    assert cache.get("cc") is not None
+
+def test_create_parse_cache(tmp_path):
+    assert create_parse_cache({"cache": False, "cache_path": str(tmp_path)}) is None
+    assert create_parse_cache({}) is None
+
+    cache = create_parse_cache({"output_path": str(tmp_path / "out" / "doc.html"), "cache_max_size": 1})
+    assert cache.cache_dir == str(tmp_path / "out" / ".cppcodedoc_cache")
+    assert cache.max_size == 1024 * 1024
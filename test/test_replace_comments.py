@@ -19,7 +19,7 @@ def find_function_start_line(content, function_name, param_signature=None, occur
     return -1
 
 # MOCK: header_comment_exists Implementation for pytest
-def header_comment_exists(lines, start_line):
+def header_comment_exists(lines, start_line, comment_index=None):
     # Checking if Doxygen_Comment exists above the function
     return start_line >= 1 and lines[start_line - 1].strip().startswith("///")
 
@@ -0,0 +1,170 @@
+# CppCodeDoc — Licensed under the GNU General Public License v3.0 (GPLv3-or-later)
+# SPDX-License-Identifier: GPLv3-or-later
+# Copyright (C) 2025 Jojo1220
+# See https://www.gnu.org/licenses/gpl-3.0.html
+
+import sys
+import os
+import pytest
+from unittest.mock import patch
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', "src")))
+import formatter.doc_generator as doc_generator
+from formatter.run_manifest import RunManifest, create_run_manifest
+from formatter.doc_generator import generate_documentation
+from generator.save_report import StreamingReport
+
+@pytest.fixture
+def arguments(tmp_path):
+    return {
+        "readonly": False,
+        "headerCommentStyle": "doxygen",
+        "backup_path": None,
+        "cache": False,
+        "output_path": str(tmp_path / "docs" / "Documentation"),
+        "output_format": ["md", "html"],
+        "document": {"title": "Test Report", "highlightTodo": True},
+        "app_info": {"version": "1.0.0"},
+    }
+
+def write_sources(tmp_path, count):
+    source_files = []
+    for i in range(count):
+        source = tmp_path / f"file{i}.cpp"
+        source.write_text(f"int func{i}(int a) {{\n    return a + {i};\n}}\n")
+        source_files.append(str(source))
+    return source_files
+
+def incremental_run(arguments, source_files):
+    """
+    Documentation run with a manifest loaded from and saved to disk (like the CLI).
+    Returns the functions and the paths of the processed files.
+    """
+    manifest = create_run_manifest(arguments)
+    processed = []
+    process = doc_generator.process_source_file
+    with patch.object(doc_generator, "process_source_file",
+                      side_effect=lambda file_path, *args: processed.append(file_path)
+                      or process(file_path, *args)):
+        functions = generate_documentation(arguments, source_files, manifest=manifest)
+    manifest.save()
+    return functions, processed
+
+def test_unchanged_files_are_not_processed(arguments, tmp_path):
+    source_files = write_sources(tmp_path, 3)
+    first, processed = incremental_run(arguments, source_files)
+    assert processed == source_files
+
+    second, processed = incremental_run(arguments, source_files)
+
+    assert processed == []
+    assert second == first
+    assert all(func["file"] == path for func, path in zip(second, source_files))
+
+def test_only_changed_files_are_processed(arguments, tmp_path):
+    source_files = write_sources(tmp_path, 3)
+    incremental_run(arguments, source_files)
+    with open(source_files[1], "a", encoding="utf-8") as f:
+        f.write("\nvoid added()\n{\n}\n")
+
+    functions, processed = incremental_run(arguments, source_files)
+
+    assert processed == [source_files[1]]
+    assert [func["name"] for func in functions] == ["func0", "func1", "added", "func2"]
+
+def test_touched_file_with_same_content_is_unchanged(arguments, tmp_path):
+    source_files = write_sources(tmp_path, 1)
+    incremental_run(arguments, source_files)
+    stat = os.stat(source_files[0])
+    os.utime(source_files[0], ns=(stat.st_atime_ns, stat.st_mtime_ns + 5_000_000_000))
+
+    _, processed = incremental_run(arguments, source_files)
+
+    assert processed == []
+    manifest = create_run_manifest(arguments)
+    assert manifest.is_unchanged(source_files[0])
+
+def test_changed_settings_discard_the_manifest(arguments, tmp_path):
+    source_files = write_sources(tmp_path, 2)
+    incremental_run(arguments, source_files)
+
+    arguments["headerCommentStyle"] = "default"
+    _, processed = incremental_run(arguments, source_files)
+
+    assert processed == source_files
+
+def test_full_run_and_disabled_manifest(arguments, tmp_path):
+    source_files = write_sources(tmp_path, 1)
+    incremental_run(arguments, source_files)
+
+    assert create_run_manifest(arguments, reset=True).entries == {}
+    assert create_run_manifest(dict(arguments, incremental=False)) is None
+    assert create_run_manifest(dict(arguments, output_path=None)) is None
+
+def test_deleted_files_are_removed(arguments, tmp_path):
+    source_files = write_sources(tmp_path, 2)
+    incremental_run(arguments, source_files)
+    os.remove(source_files[0])
+
+    incremental_run(arguments, source_files[1:])
+
+    assert list(create_run_manifest(arguments).entries) == [RunManifest.file_key(source_files[1])]
+
+def test_parallel_run_uses_manifest(arguments, tmp_path):
+    arguments["jobs"] = 2
+    source_files = write_sources(tmp_path, 4)
+    manifest = create_run_manifest(arguments)
+    first = generate_documentation(arguments, source_files, manifest=manifest)
+    manifest.save()
+    with open(source_files[2], "a", encoding="utf-8") as f:
+        f.write("\n")
+
+    manifest = create_run_manifest(arguments)
+    changed = [not manifest.is_unchanged(path) for path in source_files]
+    second = generate_documentation(arguments, source_files, manifest=manifest)
+
+    assert changed == [False, False, True, False]
+    assert [func["name"] for func in second] == [func["name"] for func in first]
+
+def streamed_report(arguments, source_files):
+    manifest = create_run_manifest(arguments)
+    with StreamingReport(arguments, manifest) as report:
+        with patch.object(StreamingReport, "render_sections", autospec=True,
+                          side_effect=StreamingReport.render_sections) as render:
+            generate_documentation(arguments, source_files, report=report.add, manifest=manifest)
+        report.close()
+    manifest.save()
+    output = [open(path, encoding="utf-8").read()
+              for path in (arguments["output_path"] + ".md", arguments["output_path"] + ".html")]
+    return output, [call.args[2][0]["file"] for call in render.call_args_list]
+
+def test_report_sections_of_unchanged_files_are_reused(arguments, tmp_path):
+    source_files = write_sources(tmp_path, 3)
+    first, rendered = streamed_report(arguments, source_files)
+    assert rendered == [path for path in source_files for _ in range(2)]
+
+    second, rendered = streamed_report(arguments, source_files)
+    assert rendered == []
+    assert second == first
+
+    # the last file changes, the sections of the other files are still valid
+    with open(source_files[2], "a", encoding="utf-8") as f:
+        f.write("\nvoid added()\n{\n}\n")
+    third, rendered = streamed_report(arguments, source_files)
+    assert rendered == [source_files[2], source_files[2]]
+    assert "added" in third[0] and "added" in third[1]
+
+def test_changed_file_does_not_invalidate_the_following_files(arguments, tmp_path):
+    source_files = write_sources(tmp_path, 3)
+    streamed_report(arguments, source_files)
+
+    # the first file gets another function, the functions after it move within the report
+    with open(source_files[0], "a", encoding="utf-8") as f:
+        f.write("\nvoid added()\n{\n}\n")
+    output, rendered = streamed_report(arguments, source_files)
+    assert rendered == [source_files[0], source_files[0]]
+
+    fresh, _ = streamed_report(dict(arguments, manifest_path=str(tmp_path / "fresh.json")),
+                               source_files)
+    assert output == fresh
+    assert "id='comment_3'" in output[1] and "id='comment_4'" not in output[1]
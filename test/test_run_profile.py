@@ -0,0 +1,171 @@
+# CppCodeDoc — Licensed under the GNU General Public License v3.0 (GPLv3-or-later)
+# SPDX-License-Identifier: GPLv3-or-later
+# Copyright (C) 2025 Jojo1220
+# See https://www.gnu.org/licenses/gpl-3.0.html
+
+import sys
+import os
+import json
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', "src")))
+from streamLogger.run_profile import RunProfile, FILE, STAGE, profile_span
+from formatter.doc_generator import generate_documentation
+
+def write_sources(directory, count):
+    source_files = []
+    for i in range(count):
+        source = directory / f"file{i}.cpp"
+        source.write_text(f"int func{i}(int a) {{\n    return a + {i};\n}}\n")
+        source_files.append(str(source))
+    return source_files
+
+def test_span_records_times_and_counters():
+    profile = RunProfile()
+    with profile.span("parse", "a.cpp") as span:
+        span["functions"] = 3
+        sum(range(10000))
+
+    recorded = profile.spans[0]
+    assert recorded["name"] == "parse"
+    assert recorded["category"] == STAGE
+    assert recorded["file"] == "a.cpp"
+    assert recorded["functions"] == 3
+    assert recorded["wall"] >= 0 and recorded["cpu"] >= 0
+    assert recorded["start"] >= profile.origin
+
+def test_span_is_recorded_on_exception():
+    profile = RunProfile()
+    with pytest.raises(RuntimeError):
+        with profile.span("read", "a.cpp"):
+            raise RuntimeError("failing file")
+
+    assert [span["name"] for span in profile.spans] == ["read"]
+
+def test_profile_span_without_profile():
+    with profile_span(None, "parse") as span:
+        span["functions"] = 1
+
+def test_summary_and_format():
+    profile = RunProfile()
+    for name, functions in [("parse", 2), ("write", 0), ("parse", 3)]:
+        with profile.span(name) as span:
+            span["functions"] = functions
+    with profile.span("file", "a.cpp", FILE):
+        pass
+
+    summary = profile.summary()
+    assert list(summary) == ["parse", "write"]
+    assert summary["parse"]["count"] == 2
+    assert summary["parse"]["functions"] == 5
+
+    text = profile.format_summary()
+    assert text.splitlines()[1].startswith("parse")
+    assert "total" in text
+    assert "a.cpp" in text
+
+def test_chrome_trace(tmp_path):
+    profile = RunProfile()
+    with profile.span("file", "dir/a.cpp", FILE):
+        with profile.span("parse", "dir/a.cpp") as span:
+            span["functions"] = 1
+
+    path = tmp_path / "trace" / "run.json"
+    profile.write_chrome_trace(str(path))
+    events = json.loads(path.read_text())["traceEvents"]
+
+    assert [event["name"] for event in events] == ["a.cpp", "parse"]
+    for event in events:
+        assert event["ph"] == "X"
+        assert event["ts"] >= 0 and event["dur"] >= 0
+        assert event["args"]["file"] == "dir/a.cpp"
+    assert events[1]["args"]["functions"] == 1
+
+@pytest.mark.parametrize("jobs", [1, 2])
+def test_generate_documentation_records_stages_per_file(tmp_path, jobs):
+    arguments = {"readonly": False, "headerCommentStyle": "doxygen",
+                 "backup_path": None, "jobs": jobs}
+    source_files = write_sources(tmp_path, 2)
+    sizes_before = sum(os.path.getsize(path) for path in source_files)
+    profile = RunProfile()
+
+    generate_documentation(arguments, source_files, profile=profile)
+
+    summary = profile.summary()
+    assert list(summary) == ["read", "parse", "rewrite", "doxygen", "write"]
+    assert summary["read"]["count"] == 2
+    assert summary["read"]["bytes_read"] == sizes_before
+    assert summary["parse"]["functions"] == 2
+    assert summary["write"]["bytes_written"] == sum(os.path.getsize(path) for path in source_files)
+    assert sorted(span["file"] for span in profile.slowest_files()) == source_files
+
+@pytest.fixture
+def memory_profile():
+    profile = RunProfile(memory=True)
+    yield profile
+    profile.stop()
+
+def test_memory_peak_and_retained(memory_profile):
+    retained = []
+    with memory_profile.span("file", "a.cpp", FILE) as outer:
+        with memory_profile.span("parse", "a.cpp"):
+            temporary = bytearray(4 * 1024 * 1024)
+            del temporary
+        with memory_profile.span("doxygen", "a.cpp"):
+            retained.append(bytearray(1024 * 1024))
+
+    parse, doxygen, outer = memory_profile.spans
+    assert parse["memory_peak"] >= 4 * 1024 * 1024
+    assert parse["memory_retained"] < 1024 * 1024
+    assert doxygen["memory_retained"] >= 1024 * 1024
+    # the peak of an inner span is also the peak of the enclosing span
+    assert outer["memory_peak"] >= parse["memory_peak"]
+    assert memory_profile.memory_peak >= 4 * 1024 * 1024
+
+def test_memory_summary_and_allocation_sites(memory_profile):
+    with memory_profile.span("file", "a.cpp", FILE):
+        with memory_profile.span("parse", "a.cpp"):
+            records = [{"name": f"func{i}"} for i in range(20000)]
+            memory_profile.snapshot_allocations(count=5)
+
+    assert 0 < len(memory_profile.allocation_sites) <= 5
+    assert any("test_run_profile.py" in site["site"] for site in memory_profile.allocation_sites)
+    text = memory_profile.format_summary()
+    assert "peak [MB]" in text
+    assert "largest memory peak files:" in text
+    assert "top allocation sites:" in text
+    assert "memory" in memory_profile.to_chrome_trace()
+    assert len(records) == 20000
+
+def test_generate_documentation_records_memory_in_workers(tmp_path, memory_profile):
+    arguments = {"readonly": False, "headerCommentStyle": "doxygen",
+                 "backup_path": None, "jobs": 2}
+
+    generate_documentation(arguments, write_sources(tmp_path, 2), profile=memory_profile)
+
+    file_spans = [span for span in memory_profile.spans if span["category"] == FILE]
+    assert len(file_spans) == 2
+    assert all(span["memory_peak"] > 0 for span in file_spans)
+
+def test_worker_utilization():
+    profile = RunProfile()
+    for pid, start, wall in [(1, 10.0, 3.0), (1, 13.0, 1.0), (2, 10.0, 2.0), (2, 12.5, 0.5)]:
+        profile.spans.append({"name": "file", "category": FILE, "file": f"{pid}-{start}.cpp",
+                              "start": start, "wall": wall, "cpu": wall, "bytes_read": 0,
+                              "bytes_written": 0, "functions": 0, "pid": pid, "tid": 1})
+
+    workers = profile.worker_utilization()
+
+    assert workers[1] == {"files": 2, "busy": 4.0, "utilization": 1.0}
+    assert workers[2] == {"files": 2, "busy": 2.5, "utilization": 2.5 / 4.0}
+    lines = profile.format_workers()
+    assert lines[1].split() == ["1", "2", "4.000", "100.0%"]
+    assert lines[2].split() == ["2", "2", "2.500", "62.5%"]
+    assert "62.5%" in profile.format_summary()
+
+def test_worker_utilization_of_serial_run():
+    profile = RunProfile()
+    with profile.span("file", "a.cpp", FILE):
+        pass
+    assert list(profile.worker_utilization()) == [os.getpid()]
+    assert profile.format_workers() == []
@@ -9,7 +9,7 @@ import tempfile
 import pytest
 
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
-from src.generator.save_report import save_documentation
+from src.generator.save_report import save_documentation, get_output_files, StreamingReport
 
 # Dummy-Functions for testing
 dummy_functions = [
@@ -55,3 +55,46 @@ def test_save_documentation(formats):
         assert isinstance(file_path, str)
         assert isinstance(todo_stats, dict)
         assert "percent_done" in todo_stats
+
+def test_get_output_files():
+    arguments = {"output_path": "docs/Documentation", "output_format": ["html", "md"]}
+
+    assert get_output_files(arguments) == ["docs/Documentation.html", "docs/Documentation.md"]
+
+def report_functions(count):
+    return [dict(dummy_functions[0], name=f"func{i}", startLine=i,
+                 doxygen=dummy_functions[0]["doxygen"] + ("\n@note TODO" if i % 2 else ""))
+            for i in range(count)]
+
+@pytest.mark.parametrize("highlight_todo", [False, True])
+def test_streaming_report_matches_save_documentation(tmp_path, highlight_todo):
+    def report_arguments(name):
+        return {
+            "output_path": str(tmp_path / name / "output"),
+            "output_format": ["md", "html"],
+            "document": {"title": "Test Report", "highlightTodo": highlight_todo,
+                         "showDocProgress": True, "logoPath": None},
+            "app_info": {"version": "1.0.0"},
+        }
+    expected_path, expected_stats = save_documentation(report_arguments("full"), report_functions(5))
+
+    with StreamingReport(report_arguments("stream")) as report:
+        for functions in (report_functions(5)[:2], [], report_functions(5)[2:]):
+            report.add(functions)
+        file_path, todo_stats = report.close()
+
+    assert report.function_count == 5
+    assert todo_stats == expected_stats
+    assert file_path == str(tmp_path / "stream" / "output.html")
+    for extension in ("md", "html"):
+        assert ((tmp_path / "stream" / f"output.{extension}").read_text(encoding="utf-8") ==
+                (tmp_path / "full" / f"output.{extension}").read_text(encoding="utf-8"))
+    # the spool files are deleted
+    assert sorted(os.listdir(tmp_path / "stream")) == ["output.html", "output.md"]
+
+def test_streaming_report_invalid_format(tmp_path):
+    arguments = {"output_path": str(tmp_path / "output"), "output_format": ["pdf"],
+                 "document": {"title": "Test Report"}}
+
+    with pytest.raises(ValueError):
+        StreamingReport(arguments)
@@ -0,0 +1,78 @@
+# CppCodeDoc — Licensed under the GNU General Public License v3.0 (GPLv3-or-later)
+# SPDX-License-Identifier: GPLv3-or-later
+# Copyright (C) 2025 Jojo1220
+# See https://www.gnu.org/licenses/gpl-3.0.html
+
+import sys
+import os
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', "src")))
+from formatter.scheduler import estimate_costs, schedule_files, DEFAULT_SECONDS_PER_BYTE
+from formatter.run_manifest import create_run_manifest
+from formatter.doc_generator import generate_documentation
+
+def write_sources(tmp_path, sizes):
+    source_files = []
+    for i, size in enumerate(sizes):
+        source = tmp_path / f"file{i}.cpp"
+        body = "".join(f"int f{i}_{n}(int a) {{\n    return a;\n}}\n" for n in range(size))
+        source.write_text(body)
+        source_files.append(str(source))
+    return source_files
+
+@pytest.fixture
+def arguments(tmp_path):
+    return {
+        "readonly": False,
+        "headerCommentStyle": "doxygen",
+        "backup_path": None,
+        "cache": False,
+        "jobs": 2,
+        "output_path": str(tmp_path / "docs" / "Documentation"),
+    }
+
+def test_costs_by_size_without_timings(tmp_path):
+    source_files = write_sources(tmp_path, [1, 20, 5])
+    costs = estimate_costs(source_files + [str(tmp_path / "missing.cpp")])
+
+    assert costs[:3] == [os.path.getsize(path) * DEFAULT_SECONDS_PER_BYTE for path in source_files]
+    assert costs[3] == 0
+    assert schedule_files(costs) == [1, 2, 0, 3]
+
+def test_schedule_keeps_order_of_equal_costs():
+    assert schedule_files([1.0, 3.0, 1.0, 3.0, 0.0]) == [1, 3, 0, 2, 4]
+
+def test_costs_by_timings_of_previous_run(arguments, tmp_path):
+    source_files = write_sources(tmp_path, [10, 10, 10])
+    manifest = create_run_manifest(arguments)
+    generate_documentation(arguments, source_files, manifest=manifest)
+    assert all(manifest.get_timing(path)[1] > 0 for path in source_files)
+
+    size = os.path.getsize(source_files[0])
+    manifest.update(source_files[0], [], wall=2.0)
+    manifest.update(source_files[1], [], wall=0.5)
+    with open(source_files[1], "a", encoding="utf-8") as f:
+        f.write(" " * size)
+    (tmp_path / "new").mkdir()
+    new_file = write_sources(tmp_path / "new", [1])[0]
+    del manifest.entries[manifest.file_key(source_files[2])]["wall"]
+
+    costs = estimate_costs(source_files + [new_file], manifest)
+
+    assert costs[0] == 2.0
+    # the file size was doubled since the previous run
+    assert costs[1] == pytest.approx(1.0)
+    # throughput of the measured files: 2.5 s per 2 * size bytes
+    assert costs[2] == pytest.approx(os.path.getsize(source_files[2]) * 2.5 / (2 * size))
+    assert costs[3] == pytest.approx(os.path.getsize(new_file) * 2.5 / (2 * size))
+    assert schedule_files(costs) == [0, 2, 1, 3]
+
+def test_parallel_run_in_order_of_source_files(arguments, tmp_path):
+    source_files = write_sources(tmp_path, [1, 30, 3, 60, 2])
+
+    functions = generate_documentation(arguments, source_files)
+
+    assert [func["file"] for func in functions] == sorted(
+        (func["file"] for func in functions), key=source_files.index)
+    assert len(functions) == 96
@@ -0,0 +1,146 @@
+# CppCodeDoc — Licensed under the GNU General Public License v3.0 (GPLv3-or-later)
+# SPDX-License-Identifier: GPLv3-or-later
+# Copyright (C) 2025 Jojo1220
+# See https://www.gnu.org/licenses/gpl-3.0.html
+
+import sys
+import os
+import builtins
+from unittest.mock import patch
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', "src")))
+from formatter.source_document import SourceDocument
+from formatter.code_parser import insert_comments, replace_comments, extract_functions
+from formatter.doxygen_generator import generate_doxygen_comment
+
+CODE = """\
+#include <string>
+
+// Adds two numbers
+int add(int a, int b) {
+    return a + b;
+}
+
+/**
+ * @brief Scales a value
+ */
+double scale(double x, double f = 2.0) {
+    return x * f;
+}
+
+void noComment()
+{
+    run();
+}
+"""
+
+ARGUMENTS = {"headerCommentStyle": "doxygen"}
+
+def run_file_based_pipeline(file_path):
+    insert_comments(file_path, ARGUMENTS)
+    functions = extract_functions(file_path)
+    for func in functions:
+        generate_doxygen_comment(func)
+    replace_comments(file_path, functions)
+    return functions
+
+def run_document_pipeline(file_path):
+    document = SourceDocument(file_path)
+    document.parse()
+    document.insert_comments(ARGUMENTS)
+    for func in document.functions:
+        generate_doxygen_comment(func)
+    document.replace_comments()
+    document.save()
+    return document.functions
+
+def test_document_pipeline_matches_file_based_pipeline(tmp_path):
+    file_based = tmp_path / "file_based.cpp"
+    in_memory = tmp_path / "in_memory.cpp"
+    file_based.write_text(CODE, encoding="utf-8")
+    in_memory.write_text(CODE, encoding="utf-8")
+
+    expected_functions = run_file_based_pipeline(str(file_based))
+    functions = run_document_pipeline(str(in_memory))
+
+    assert in_memory.read_text(encoding="utf-8") == file_based.read_text(encoding="utf-8")
+    for expected, func in zip(expected_functions, functions):
+        expected.pop("file")
+        func.pop("file")
+        assert func == expected
+
+def test_document_is_read_and_written_once(tmp_path):
+    source = tmp_path / "test.cpp"
+    source.write_text(CODE, encoding="utf-8")
+
+    modes, replaced = [], []
+    original_open = builtins.open
+    original_replace = os.replace
+
+    def counting_open(file, mode="r", *args, **kwargs):
+        if str(file) == str(source):
+            modes.append(mode)
+        return original_open(file, mode, *args, **kwargs)
+
+    def counting_replace(src, dst):
+        replaced.append(dst)
+        return original_replace(src, dst)
+
+    with patch("builtins.open", side_effect=counting_open), \
+            patch("os.replace", side_effect=counting_replace):
+        run_document_pipeline(str(source))
+
+    # written once, atomically by a temporary file
+    assert modes == ["r"]
+    assert replaced == [str(source)]
+    assert sorted(os.listdir(tmp_path)) == ["test.cpp"]
+
+def test_unmodified_document_is_not_written(tmp_path):
+    source = tmp_path / "test.cpp"
+    source.write_text(CODE, encoding="utf-8")
+
+    document = SourceDocument(str(source))
+    document.parse()
+    assert [func["name"] for func in document.functions] == ["add", "scale", "noComment"]
+    assert document.save() is False
+
+def test_document_keeps_original_content(tmp_path):
+    source = tmp_path / "test.cpp"
+    source.write_bytes(CODE.replace("\n", "\r\n").encode("utf-8"))
+
+    document = SourceDocument(str(source))
+    document.parse()
+    document.insert_comments(ARGUMENTS)
+
+    assert document.content == CODE.replace("\n", "\r\n")
+    assert document.lines != CODE.splitlines()
+
+def test_documented_file_is_not_written_again(tmp_path):
+    source = tmp_path / "test.cpp"
+    source.write_text(CODE, encoding="utf-8")
+    run_document_pipeline(str(source))
+    documented = source.read_text(encoding="utf-8")
+    mtime = os.stat(source).st_mtime_ns
+
+    document = SourceDocument(str(source))
+    document.parse()
+    document.insert_comments(ARGUMENTS)
+    for func in document.functions:
+        generate_doxygen_comment(func)
+    document.replace_comments()
+
+    assert document.save() is False
+    assert os.stat(source).st_mtime_ns == mtime
+    assert source.read_text(encoding="utf-8") == documented
+
+def test_file_based_pipeline_does_not_write_documented_file(tmp_path):
+    source = tmp_path / "test.cpp"
+    source.write_text(CODE, encoding="utf-8")
+    run_file_based_pipeline(str(source))
+    mtime = os.stat(source).st_mtime_ns
+
+    with patch("os.replace") as replace:
+        run_file_based_pipeline(str(source))
+
+    replace.assert_not_called()
+    assert os.stat(source).st_mtime_ns == mtime
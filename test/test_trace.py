@@ -0,0 +1,78 @@
+# CppCodeDoc — Licensed under the GNU General Public License v3.0 (GPLv3-or-later)
+# SPDX-License-Identifier: GPLv3-or-later
+# Copyright (C) 2025 Jojo1220
+# See https://www.gnu.org/licenses/gpl-3.0.html
+
+import sys
+import os
+import pytest
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..', "src")))
+from streamLogger.trace import enable_tracing, get_tracer, parse_trace_spec
+from formatter.code_parser import extract_functions_from_string, normalize_signature
+
+CODE = """\
+int add(int a, int b) {
+    return a + b;
+}
+"""
+
+@pytest.fixture(autouse=True)
+def disabled_tracing():
+    enable_tracing(None)
+    yield
+    enable_tracing(None)
+
+class NotFormatted:
+    """Argument, which fails the test if it is formatted into a message."""
+    def __str__(self):
+        raise AssertionError("disabled trace was formatted")
+
+def test_parse_trace_spec():
+    assert parse_trace_spec(None) == {}
+    assert parse_trace_spec(["parser"]) == {"parser": "debug"}
+    assert parse_trace_spec(["parser=info", "generator"]) == {"parser": "info", "generator": "debug"}
+    assert parse_trace_spec("parser, generator=INFO") == {"parser": "debug", "generator": "info"}
+    with pytest.raises(ValueError):
+        parse_trace_spec(["parser=verbose"])
+
+def test_levels_and_per_module_enablement():
+    parser_trace = get_tracer("parser")
+    generator_trace = get_tracer("generator")
+
+    enable_tracing(["parser=info"])
+    assert (parser_trace.info, parser_trace.debug) == (True, False)
+    assert (generator_trace.info, generator_trace.debug) == (False, False)
+
+    enable_tracing(["generator"])
+    assert (parser_trace.info, parser_trace.debug) == (False, False)
+    assert (generator_trace.info, generator_trace.debug) == (True, True)
+
+def test_tracer_created_after_enabling():
+    enable_tracing(["late_module"])
+
+    assert get_tracer("late_module").debug
+
+def test_log_formats_only_enabled_messages(capsys):
+    trace = get_tracer("parser")
+    if trace.debug:
+        trace.log("value %s", NotFormatted())
+
+    enable_tracing(["parser"])
+    if trace.debug:
+        trace.log("value %s of %d", "a", 2)
+
+    assert capsys.readouterr().out == "[parser] value a of 2\n"
+
+def test_parser_is_silent_without_tracing(capsys):
+    normalize_signature("int  a, int *b")
+    extract_functions_from_string(CODE)
+
+    assert capsys.readouterr().out == ""
+
+def test_parser_traces_with_tracing_enabled(capsys):
+    enable_tracing(["parser"])
+    normalize_signature("int  a, int *b")
+
+    assert "[parser] [normalize_signature] Input: 'int  a, int *b' -> Output: 'int a, int*b'" in \
+        capsys.readouterr().out